@@ -73,7 +73,8 @@ PACKAGE_INSTALL_REQUIRES = [
 # Keys should be name of the optional feature and values are lists of required packages
 # E.g. {'feature1': ['pandas', 'numpy'], 'feature2': ['matplotlib']}
 OPTIONAL_PACKAGE_INSTALL_REQUIRES = {
-
+    # File system events for PipelineManager.watch, otherwise falls back to polling
+    'inotify': ['inotify_simple'],
 }
 
 # Packages added to Binder environment so that examples can be executed in Binder
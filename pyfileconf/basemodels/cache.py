@@ -0,0 +1,38 @@
+import threading
+
+
+class CacheStats:
+    """
+    Tracks hits and misses for one of the pyfileconf caches
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return f'<CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})>'
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def record_eviction(self):
+        with self._lock:
+            self.evictions += 1
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses
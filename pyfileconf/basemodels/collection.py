@@ -1,4 +1,4 @@
-from typing import List, Optional, Sequence, Type, Any, Dict
+from typing import List, Optional, Sequence, Type, Any, Dict, Tuple
 import os
 
 from pyfileconf.basemodels.container import Container
@@ -12,13 +12,34 @@ scaffolding_error = NotImplementedError('must use SpecificClassCollection or Pip
 
 class Collection(Container, ReprMixin):
     name_dict: Dict[str, Any]
+    # Names by id of items, for identity lookups of items
+    _name_by_id: Dict[int, str]
 
     #### Scaffolding functions. These should be overridden by collection subclasses ###
 
-    def _set_name_map(self):
+    def _name_for_item(self, item) -> str:
+        """
+        Gets the name under which an item or nested collection is stored in the collection
+        """
         raise scaffolding_error
 
-    def _output_config_files(self):
+    def _prepare_config_output(self):
+        """
+        Creates any folders and section-level files needed before config files
+        can be output for the items of this collection
+        """
+        raise scaffolding_error
+
+    def _config_filepath_for(self, item) -> str:
+        raise scaffolding_error
+
+    def _config_source_for(self, item) -> Any:
+        """
+        Gets the object whose signature is extracted to create the config for the item
+        """
+        raise scaffolding_error
+
+    def _output_config_file(self, item):
         raise scaffolding_error
 
     def _transform_item(self, item):
@@ -41,6 +62,9 @@ class Collection(Container, ReprMixin):
                  imports: ImportStatementContainer = None, always_import_strs: Optional[Sequence[str]] = None,
                  always_assign_strs: Optional[Sequence[str]] = None, klass: Optional[Type] = None,
                  key_attr: str = 'name', execute_attr: str = '__call__'):
+        # Collection which holds this collection, if any, kept so appends can update its path index
+        self._parent: Optional[Collection] = None
+        self._path_index: Optional[Dict[str, Any]] = None
         self.basepath = basepath
         self.imports = imports
         self.name = name
@@ -51,7 +75,6 @@ class Collection(Container, ReprMixin):
         self.execute_attr = execute_attr
         self.klass = klass
         self.items = self._transform_items(items)
-        self._set_name_map()
 
     def get(self, section_path_str: str) -> Any:
         sp = SectionPath(section_path_str)
@@ -66,6 +89,9 @@ class Collection(Container, ReprMixin):
         return obj
 
     def __getattr__(self, item):
+        if item == 'name_dict':
+            # Not set yet, such as while unpickling
+            raise AttributeError(item)
         try:
             return self.name_dict[item]
         except KeyError:
@@ -82,21 +108,111 @@ class Collection(Container, ReprMixin):
     def items(self, items):
         self._items = items
         self._set_name_map()  # need to recreate pipeline map when items change
+        self._set_parent_of_items(items)
+        self._invalidate_path_index()
 
     def append(self, item):
+        num_names = len(self.name_dict)
         self._items.append(item)
-        self._set_name_map()
+        self._update_name_map([item])
+        self._set_parent_of_items([item])
+        if self._has_default_name_map and len(self.name_dict) == num_names + 1:
+            self._add_to_path_index(item)
+        else:
+            # Replaced an item with the same name, which may have had items under it, so rebuild
+            self._invalidate_path_index()
 
     def extend(self, items):
+        items = list(items)
         self._items.extend(items)
-        self._set_name_map()
+        self._update_name_map(items)
+        self._set_parent_of_items(items)
+        self._invalidate_path_index()
+
+    @property
+    def path_index(self) -> Dict[str, Any]:
+        """
+        Flat index of every item and collection in this collection and all nested collections,
+        by section path string relative to this collection
+
+        Built on first access and updated as items are appended, so lookups take a single dict
+        access regardless of how deeply the item is nested.
+        """
+        if self._path_index is None:
+            index: Dict[str, Any] = {}
+            for name, item in self.name_dict.items():
+                index[name] = item
+                if isinstance(item, Collection):
+                    for nested_path, nested_item in item.path_index.items():
+                        index[f'{name}.{nested_path}'] = nested_item
+            self._path_index = index
+        return self._path_index
+
+    def _set_parent_of_items(self, items):
+        for item in items:
+            if isinstance(item, Collection):
+                item._parent = self
+
+    def _invalidate_path_index(self):
+        collection: Optional[Collection] = self
+        while collection is not None:
+            collection._path_index = None
+            collection = collection._parent
+
+    def _add_to_path_index(self, item):
+        name = self._name_for_item(item)
+        entries = {name: item}
+        if isinstance(item, Collection):
+            entries.update({f'{name}.{nested_path}': nested_item for nested_path, nested_item in item.path_index.items()})
+
+        # Add entries to this collection and every collection above it, with the path of this collection prepended
+        collection: Optional[Collection] = self
+        while collection is not None:
+            if collection._path_index is not None:
+                collection._path_index.update(entries)
+            parent = collection._parent
+            if parent is not None:
+                entries = {f'{collection.name}.{path}': value for path, value in entries.items()}
+            collection = parent
 
     def name_for_obj(self, obj: Any) -> str:
+        name = getattr(self, '_name_by_id', {}).get(id(obj))
+        if name is not None:
+            return name
+        # Not indexed when the object's name was replaced while it is stored under another name
+        # or when a subclass builds the name map, so find the first name it is stored under
         for name, item in self.name_dict.items():
             if obj is item:
                 return name
         raise ValueError(f'did not find object {obj} in {self}')
 
+    def _set_name_map(self):
+        self.name_dict = {}
+        self._name_by_id = {}
+        self._add_to_name_map(self)
+
+    @property
+    def _has_default_name_map(self) -> bool:
+        return type(self)._set_name_map is Collection._set_name_map
+
+    def _update_name_map(self, items):
+        if self._has_default_name_map:
+            self._add_to_name_map(items)
+        else:
+            # Subclass builds the name map itself, so rebuild it with all the items
+            self._set_name_map()
+
+    def _add_to_name_map(self, items):
+        for item in items:
+            name = self._name_for_item(item)
+            replaced = self.name_dict.get(name)
+            if replaced is not None and self._name_by_id.get(id(replaced)) == name:
+                # Later items with the same name replace earlier ones
+                del self._name_by_id[id(replaced)]
+            self.name_dict[name] = item
+            # Keep the first name for items stored under multiple names
+            self._name_by_id.setdefault(id(item), name)
+
     @classmethod
     def from_dict(cls, dict_: dict, basepath: str, name: str = None,
                   imports: ImportStatementContainer = None, always_import_strs: Optional[Sequence[str]] = None,
@@ -170,6 +286,27 @@ class Collection(Container, ReprMixin):
     def to_nested_dict(self):
         return to_nested_dict(self)
 
+    def _output_config_files(self):
+        for collection, item in self._config_output_items():
+            collection._output_config_file(item)
+
+    def _config_output_items(self) -> List[Tuple['Collection', Any]]:
+        """
+        Prepares the config folders for this collection and all nested collections, then
+        gets the items which need config files, along with the collection which outputs each one.
+
+        Returns: list of (collection, item) tuples in collection order
+
+        """
+        self._prepare_config_output()
+        output_items: List[Tuple[Collection, Any]] = []
+        for item in self:
+            if isinstance(item, Collection):
+                output_items.extend(item._config_output_items())
+            else:
+                output_items.append((self, item))
+        return output_items
+
     def _transform_items(self, items):
         return [self._transform_item(item) for item in items]
 
@@ -1,10 +1,9 @@
+import sys
 import warnings
 from typing import Tuple, Optional, Type, Sequence, Any, Dict
 import os
 from copy import deepcopy
 
-import pandas as pd
-
 from pyfileconf.basemodels.file import ConfigFileBase
 from pyfileconf.imports.models.statements.container import ImportStatementContainer
 from pyfileconf.assignments.models.container import AssignmentStatementContainer
@@ -175,12 +174,14 @@ class ConfigBase(dict):
 
 
 def _values_are_equal(val1: Any, val2: Any) -> bool:
-    # Special handling for pandas
-    if isinstance(val1, (pd.DataFrame, pd.Series)):
-        return val1.equals(val2)
-    elif isinstance(val2, (pd.DataFrame, pd.Series)):
-        # First is not pandas object, so must not be equal
-        return False
+    # Special handling for pandas. If pandas has not been imported, neither value can be a pandas object
+    pd = sys.modules.get('pandas')
+    if pd is not None:
+        if isinstance(val1, (pd.DataFrame, pd.Series)):
+            return val1.equals(val2)
+        elif isinstance(val2, (pd.DataFrame, pd.Series)):
+            # First is not pandas object, so must not be equal
+            return False
 
     try:
         return val1 == val2
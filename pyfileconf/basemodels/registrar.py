@@ -68,6 +68,12 @@ class Registrar(ReprMixin):
         collection._output_config_files()
 
     def get(self, section_path_str: str):
+        # Single lookup in flat index of all nested items and collections
+        try:
+            return self.collection.path_index[section_path_str]
+        except KeyError:
+            pass
+
         section_path = SectionPath(section_path_str)
 
         # Goes into nested sections, until it pulls the final section or pipeline
@@ -1,17 +1,17 @@
 from functools import partial
-from typing import Any, Dict, Callable
+from typing import Any, Dict, Callable, Mapping
 
 from pyfileconf.imports.logic.load.func import function_args_as_dict
 
 
-def apply_config(obj: Any, config: dict) -> None:
+def apply_config(obj: Any, config: Mapping[str, Any]) -> None:
     if isinstance(obj, partial):
         apply_config_to_partial(obj, config)
     else:
         apply_config_to_obj(obj, config)
 
 
-def apply_config_to_obj(obj: Any, config: dict) -> None:
+def apply_config_to_obj(obj: Any, config: Mapping[str, Any]) -> None:
     attributes = dir(obj)
     init_args = function_args_as_dict(obj.__init__)
     relevant_config: Dict[str, Any] = {
@@ -21,7 +21,7 @@ def apply_config_to_obj(obj: Any, config: dict) -> None:
     update_func(**relevant_config)
 
 
-def apply_config_to_partial(part: partial, config: dict) -> None:
+def apply_config_to_partial(part: partial, config: Mapping[str, Any]) -> None:
     attributes = part.keywords.keys()
     for config_attr, config_item in config.items():
         # Skip irrelevant items
@@ -6,15 +6,18 @@ if TYPE_CHECKING:
 
 from mixins.repr import ReprMixin
 
+from pyfileconf.basemodels.cache import CacheStats
 from pyfileconf.basemodels.config import ConfigBase
 from pyfileconf.config.models.file import ActiveFunctionConfigFile
 from pyfileconf.exceptions.config import ConfigManagerNotLoadedException, CannotResolveConfigDependenciesException
 from pyfileconf.logic.get import _get_from_nested_obj_by_section_path
 from pyfileconf.logic.set import _set_in_nested_obj_by_section_path
 from pyfileconf.config.models.interfaces import ConfigSectionOrConfig
-from pyfileconf.config.models.section import ConfigSection, ActiveFunctionConfig
+from pyfileconf.config.models.resolved import ResolvedConfig
+from pyfileconf.config.models.section import ConfigSection, LazyConfigSection, ActiveFunctionConfig
 from pyfileconf.plugin import manager
-from pyfileconf.sectionpath.sectionpath import SectionPath
+from pyfileconf.profile import profile_phase, PHASE_CONFIG_SECTION
+from pyfileconf.sectionpath.sectionpath import SectionPath, _is_in_any_section_path
 
 
 class ConfigManager(ReprMixin):
@@ -25,6 +28,9 @@ class ConfigManager(ReprMixin):
         self.basepath = basepath
         self.pipeline_manager_name = pipeline_manager_name
         self.local_config = ActiveFunctionConfig()
+        # Configs with inheritance from sections and local config already applied, by section path
+        self._resolved_configs: Dict[str, ResolvedConfig] = {}
+        self.resolved_config_stats = CacheStats()
 
     def __getattr__(self, item):
         return getattr(self.section, item)
@@ -42,7 +48,49 @@ class ConfigManager(ReprMixin):
         return exposed_methods + exposed_attrs + list(self.section.config_map.keys())
 
     def load(self):
-        self.section = ConfigSection.from_files(self.basepath)
+        with profile_phase(PHASE_CONFIG_SECTION, self.basepath):
+            self.section = ConfigSection.from_files(self.basepath)
+        self._resolved_configs.clear()
+
+    def reload_from_files(self, section_path_strs: Iterable[str]) -> None:
+        """
+        Replaces configs with fresh configs from their files, keeping all other
+        configs and any updates made to them. Updates made to a replaced function
+        config are applied again on top of its file, as when refreshing it.
+
+        :param section_path_strs: section paths of configs to reload. Section paths for sections
+            reload the whole section from its folder, and an empty section path reloads everything
+        :return:
+        """
+        for section_path_str in section_path_strs:
+            if not section_path_str:
+                self.load()
+                continue
+
+            section_path = SectionPath(section_path_str)
+            parent = self._get_loaded_section(section_path[:-1])
+            if parent is None:
+                # Section has not been read yet, so will already be read fresh from files
+                continue
+
+            filepath = section_path.to_filepath(self.basepath)
+            name = section_path[-1]
+            # Loaded configs are set as attributes of their section
+            prior_config = parent.__dict__.get(name)
+            new_item: Optional[Union[ActiveFunctionConfigFile, ConfigSection]]
+            if os.path.isdir(filepath):
+                new_item = ConfigSection.from_files(filepath)
+            elif os.path.exists(filepath + '.py'):
+                new_item = ActiveFunctionConfigFile(filepath + '.py', name=name)
+            else:
+                new_item = None
+            parent.replace(name, new_item)
+            if isinstance(new_item, ActiveFunctionConfigFile) and isinstance(prior_config, ConfigBase) \
+                    and prior_config._applied_updates:
+                new_config = new_item.load()
+                new_config.update(**prior_config._applied_updates)
+                setattr(parent, name, new_config)
+            self._invalidate_resolved_configs(section_path_str)
 
     def update(
         self, d_: dict=None, section_path_str: str=None, pyfileconf_persist: bool = True, **kwargs
@@ -63,6 +111,7 @@ class ConfigManager(ReprMixin):
         )
         if would_update:
             config_obj.update(d_, pyfileconf_persist=pyfileconf_persist, **kwargs)
+            self._invalidate_resolved_configs(section_path_str)
         return config_obj, would_update
 
     def refresh(self, section_path_str: str) -> Tuple[ConfigBase, bool, Dict[str, Any]]:
@@ -72,6 +121,7 @@ class ConfigManager(ReprMixin):
         would_refresh = self._determine_and_track_if_config_would_be_refreshed(config_obj, section_path_str)
         if would_refresh:
             updates = config_obj.refresh()
+            self._invalidate_resolved_configs(section_path_str)
         else:
             updates = {}
         return config_obj, would_refresh, updates
@@ -109,18 +159,43 @@ class ConfigManager(ReprMixin):
         config_obj = self._get_project_config_or_local_config_by_section_path(section_path_str)
         if config_obj is None:
             raise ConfigManagerNotLoadedException('no config to pop')
-        return config_obj.pop(key)
+        value = config_obj.pop(key)
+        self._invalidate_resolved_configs(section_path_str)
+        return value
 
-    def get(self, section_path_str: str) -> Optional[ActiveFunctionConfig]:
+    def get(self, section_path_str: str) -> Optional[ResolvedConfig]:
         """
         Handles config inheritance to get the active config for a section or function
 
+        Returns a read-only view which looks up values through the local config, section configs
+        and project config before the config itself, without copying or modifying any of them.
+        The view is cached until the config, the config of any section above it or the local config
+        is replaced or changed through this manager.
+
         Args:
             section_path_str:
 
-        Returns:
+        Returns: :class:`ResolvedConfig`, or None if there is no config for the section path.
+            This used to be the config of the function or section itself, updated in place with
+            the overriding configs. The view is a read-only mapping with the same keys and values,
+            use its to_dict or copy methods to get a plain dict which can be modified, and its
+            config attribute for the config of the function or section itself
 
         """
+        try:
+            config = self._resolved_configs[section_path_str]
+        except KeyError:
+            self.resolved_config_stats.record_miss()
+        else:
+            self.resolved_config_stats.record_hit()
+            return config
+
+        config = self._resolve_config(section_path_str)
+        if config is not None:
+            self._resolved_configs[section_path_str] = config
+        return config
+
+    def _resolve_config(self, section_path_str: str) -> Optional[ResolvedConfig]:
         config = self._get_func_or_section_configs(section_path_str)
 
         if self.section is None:
@@ -147,15 +222,12 @@ class ConfigManager(ReprMixin):
             # if is a section, not function/pipeline
             section_configs.append(self._get_func_or_section_configs(full_section))
 
-        if config:
-            # Override configs. Default config is base config, then gets updated by project, then high
-            # level sections to low level sections
-            [config.update(section_config) for section_config in section_configs]
+        if config is None:
+            return None
 
-            # Last, override with local config
-            config.update(self.local_config)
-
-        return config
+        # Local config overrides everything, then low level sections override high level sections,
+        # and project config overrides the defaults in the config itself
+        return ResolvedConfig(config, [self.local_config, *reversed(section_configs)])
 
     def set(self, section_path_str: Optional[str] = None, value: Optional[ConfigBase] = None,
             allow_create: bool = True) -> Tuple[ConfigBase, bool]:
@@ -175,6 +247,7 @@ class ConfigManager(ReprMixin):
             # updating local config
             value = cast(ActiveFunctionConfig, value)
             self.local_config = value
+            self._invalidate_resolved_configs(section_path_str)
             return value, True
 
         try:
@@ -187,6 +260,7 @@ class ConfigManager(ReprMixin):
 
         if new_config:
             self._set_func_or_section_config(section_path_str, value=value, allow_create=allow_create)
+            self._invalidate_resolved_configs(section_path_str)
             return value, True
 
         assert current_config is not None  # should never fail this, for mypy
@@ -195,8 +269,22 @@ class ConfigManager(ReprMixin):
         would_update = self._determine_and_track_if_config_would_be_updated(current_config, section_path_str, **value)
         if would_update:
             self._set_func_or_section_config(section_path_str, value=value, allow_create=allow_create)
+            self._invalidate_resolved_configs(section_path_str)
         return value, would_update
 
+    def _invalidate_resolved_configs(self, section_path_str: Optional[str]) -> None:
+        """
+        Removes cached resolved configs for the section path and anything within it.
+        No section path means the local config changed, which applies to everything.
+        """
+        if section_path_str is None or (self.section is not None and section_path_str == self.section.name):
+            self._resolved_configs.clear()
+            return
+
+        for resolved_section_path_str in list(self._resolved_configs):
+            if _is_in_any_section_path(resolved_section_path_str, {section_path_str}):
+                self._resolved_configs.pop(resolved_section_path_str, None)
+
     def _get_func_or_section_configs(self, section_path_str: str) -> Optional[ActiveFunctionConfig]:
         """
         This get method is used to get only the config for the section path, without handling
@@ -229,6 +317,27 @@ class ConfigManager(ReprMixin):
 
         return conf
 
+    def _get_loaded_section(self, sections: Iterable[str]) -> Optional[ConfigSection]:
+        """
+        Gets a section which has already been read from files, without reading any sections.
+        Returns None if the section or any section above it has not been read or does not exist.
+        """
+        section = self.section
+        if section is None:
+            return None
+        for section_name in sections:
+            if isinstance(section, LazyConfigSection) and not section.is_loaded:
+                return None
+            try:
+                section = getattr(section, section_name)
+            except (KeyError, AttributeError):
+                return None
+            if not isinstance(section, ConfigSection):
+                return None
+        if isinstance(section, LazyConfigSection) and not section.is_loaded:
+            return None
+        return section
+
     def _set_func_or_section_config(self, section_path_str: str, value=None, allow_create: bool = True) -> None:
         if self.section is None:
             raise ConfigManagerNotLoadedException('call .load() on ConfigManager before .set()')
@@ -0,0 +1,108 @@
+import copy
+from collections import ChainMap
+from typing import Callable, Optional, Sequence, Any
+
+from pyfileconf.basemodels.config import ConfigBase
+from pyfileconf.exceptions.config import ReadOnlyConfigException
+from pyfileconf.imports.logic.load.func import function_args_as_dict
+
+
+class ResolvedConfig(ChainMap):
+    """
+    Read-only view of the active config for a function or section, looking up each key through the
+    inheritance chain of local config, sections from lowest to highest, project config and finally
+    the config of the function or section itself.
+
+    No configs are copied or modified, so changes made to the underlying configs show through the view.
+    Use for_function or to_dict to materialize it into a dict.
+    """
+
+    def __init__(self, config: ConfigBase, overrides: Sequence[Optional[ConfigBase]] = ()):
+        """
+        :param config: config of the function or section itself
+        :param overrides: configs which override config, from highest to lowest priority
+        """
+        maps = [override for override in overrides if override is not None]
+        maps.append(config)
+        super().__init__(*maps)
+        self.config = config
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.config.name
+
+    def for_function(self, func: Callable) -> dict:
+        """
+        Strips out items of config which are not applicable to function. Returns dictionary
+        of config items for passing to the function.
+
+        Args:
+            func: func for which to filter out config items
+
+        Returns: dict, applicable config for func
+        """
+        func_kwargs = function_args_as_dict(func)
+        return {key: self[key] for key in self if key in func_kwargs}
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self}
+
+    def copy(self) -> dict:
+        """
+        Copies are materialized into a dict, as the view can not be modified anyway
+        """
+        return self.to_dict()
+
+    def new_child(self, m=None) -> ChainMap:
+        """
+        Writable ChainMap with a new map in front of the configs of the view
+        """
+        if m is None:
+            m = {}
+        return ChainMap(m, *self.maps)
+
+    @property
+    def parents(self) -> ChainMap:
+        return ChainMap(*self.maps[1:])
+
+    def __copy__(self) -> dict:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> dict:
+        from pyfileconf.selector.models.itemview import is_item_view
+        from pyfileconf.selector.models.selector import Selector
+
+        config_dict = self.to_dict()
+        # Selectors and item views refer to other items, so are kept rather than copied
+        for value in config_dict.values():
+            if isinstance(value, Selector) or is_item_view(value):
+                memo[id(value)] = value
+        return copy.deepcopy(config_dict, memo)
+
+    def __reduce__(self):
+        return dict, (self.to_dict(),)
+
+    def __getattr__(self, attr):
+        # Attributes looked up before __init__ has run, such as while copying or
+        # unpickling, must not go through the config lookup which uses them
+        if attr.startswith('__') or attr in ('maps', 'config'):
+            raise AttributeError(attr)
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError(attr)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}(name={self.name}, {self.to_dict()})>'
+
+    def _raise_read_only(self, *args, **kwargs) -> Any:
+        raise ReadOnlyConfigException('resolved config is read-only, update the config through the '
+                                      'PipelineManager or ConfigManager instead')
+
+    __setitem__ = _raise_read_only
+    __delitem__ = _raise_read_only
+    pop = _raise_read_only
+    popitem = _raise_read_only
+    clear = _raise_read_only
+    update = _raise_read_only
+    setdefault = _raise_read_only
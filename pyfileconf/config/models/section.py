@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Union, Optional
 import os
 import warnings
 
@@ -8,6 +8,7 @@ from pyfileconf.config.models.config import ActiveFunctionConfig
 from pyfileconf.config.models.file import ActiveFunctionConfigFile
 from pyfileconf.exceptions.config import ConfigManagerNotLoadedException
 from pyfileconf.pipelines.models.file import FunctionConfigFile
+from pyfileconf.profile import profile_phase, PHASE_CONFIG_SECTION
 from pyfileconf.sectionpath.sectionpath import _strip_py
 
 
@@ -42,24 +43,52 @@ class ConfigSection(Container, ReprMixin):
 
     def append(self, item):
         self._items.append(item)
-        self._set_config_map()
+        self._add_to_config_map([item])
 
     def extend(self, items):
+        items = list(items)
         self._items.extend(items)
-        self._set_config_map()
+        self._add_to_config_map(items)
 
     @property
     def config_map(self):
         return self._config_map
 
     def _set_config_map(self):
-        config_map = {}
-        for config in self:
+        self._config_map = {}
+        self._add_to_config_map(self)
+
+    def _add_to_config_map(self, configs):
+        for config in configs:
             if config.name is None:
                 warnings.warn(f"Couldn't determine name of config {config}. Can't add to mapping.")
                 continue
-            config_map[config.name] = config
-        self._config_map = config_map
+            self._config_map[config.name] = config
+
+    def replace(self, name: str, item: Optional[Union[ActiveFunctionConfigFile, 'ConfigSection']] = None):
+        """
+        Replaces the config or nested section with the passed name, keeping its position.
+        Removes it if no item is passed and adds it to the end if it did not exist.
+
+        :param name: name of config or section to replace
+        :param item: new config or section
+        :return:
+        """
+        # Once loaded, configs are also set as attributes which take precedence over the config map
+        self.__dict__.pop(name, None)
+
+        items = []
+        replaced = False
+        for existing in self.items:
+            if existing.name != name:
+                items.append(existing)
+            elif not replaced:
+                replaced = True
+                if item is not None:
+                    items.append(item)
+        if item is not None and not replaced:
+            items.append(item)
+        self.items = items
 
     def update(self, d: dict=None, **kwargs):
         if self.config is None:
@@ -70,6 +99,13 @@ class ConfigSection(Container, ReprMixin):
 
     @classmethod
     def from_files(cls, basepath: str):
+        """
+        Create a section from a folder of config files. Files are not listed or loaded
+        until the section's contents are first accessed.
+
+        :param basepath: folder containing config files and nested section folders
+        :return: section
+        """
 
         # Get section name by name of folder
         name = os.path.basename(os.path.abspath(basepath))
@@ -78,33 +114,89 @@ class ConfigSection(Container, ReprMixin):
         if not os.path.exists(basepath):
             return cls([], name=name)
 
-        config_file_list = [file for file in next(os.walk(basepath))[2] if file.endswith('.py')]
+        return LazyConfigSection(basepath, name=name)
+
+
+class LazyConfigSection(ConfigSection):
+    """
+    Config section backed by a folder, which is listed with a single pass
+    the first time the items, config or any nested config is accessed.
+
+    Nested section folders become lazy sections themselves, so only the
+    branches of the config tree which are used are ever read.
+    """
+
+    def __init__(self, basepath: str, name: str = None):
+        self._loaded = False
+        self.basepath = basepath
+        self.name = name
+
+    def __getattr__(self, item):
+        # Avoid loading when copy, pickle, etc. check for special methods
+        # or when an attribute is accessed before init
+        if item.startswith('__') or item in ('_loaded', 'basepath'):
+            raise AttributeError(item)
+
+        return super().__getattr__(item)
+
+    @property  # type: ignore
+    def items(self):
+        self._load_if_necessary()
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._loaded = True
+        self._items = items
+        self._set_config_map()
 
-        # Ignore folders starting with . or _
-        config_section_list = [
-            folder for folder in next(os.walk(basepath))[1] if not any(
-                [folder.startswith(item) for item in ('_','.')]
-            )
-        ]
+    @property  # type: ignore
+    def config(self):
+        self._load_if_necessary()
+        return self._config
 
-        # Special handling for section config
-        try:
-            config_file_list.remove('section.py')
-            section_config = ActiveFunctionConfig.from_file(os.path.join(basepath, 'section.py'), name=name)
-        except ValueError:
-            # Didn't find section config
-            section_config = None
+    @config.setter
+    def config(self, config: ActiveFunctionConfig):
+        self._load_if_necessary()
+        self._config = config
 
-        configs = [
-            ActiveFunctionConfigFile(
-                os.path.join(basepath, file),
-                name=_strip_py(file)
-            ) for file in config_file_list
-        ]
-        # Recursively calling section creation to create individual config files
-        config_sections = [ConfigSection.from_files(os.path.join(basepath, folder)) for folder in config_section_list]
+    @property
+    def config_map(self):
+        self._load_if_necessary()
+        return self._config_map
 
-        configs += config_sections
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
 
-        return cls(configs, section_config=section_config, name=name)
+    def append(self, item):
+        self._load_if_necessary()
+        super().append(item)
 
+    def extend(self, items):
+        self._load_if_necessary()
+        super().extend(items)
+
+    def _load_if_necessary(self):
+        if self._loaded:
+            return
+
+        section_config = None
+        configs: List[Union[ActiveFunctionConfigFile, ConfigSection]] = []
+        config_sections: List[ConfigSection] = []
+        with profile_phase(PHASE_CONFIG_SECTION, self.basepath), os.scandir(self.basepath) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Ignore folders starting with . or _
+                    if not entry.name.startswith(('_', '.')):
+                        config_sections.append(LazyConfigSection(entry.path, name=entry.name))
+                elif not entry.name.endswith('.py'):
+                    continue
+                elif entry.name == 'section.py':
+                    # Special handling for section config
+                    section_config = ActiveFunctionConfig.from_file(entry.path, name=self.name)
+                else:
+                    configs.append(ActiveFunctionConfigFile(entry.path, name=_strip_py(entry.name)))
+
+        self._config = section_config
+        self.items = configs + config_sections
@@ -1,13 +1,15 @@
-import pandas as pd
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
 
-def _how_merge_df(df: pd.DataFrame, other_df: pd.DataFrame, ids, how='left'):
+def _how_merge_df(df: 'pd.DataFrame', other_df: 'pd.DataFrame', ids, how='left'):
     return df.merge(other_df, on=ids, how=how)
 
-def outer_merge_df(df: pd.DataFrame, other_df: pd.DataFrame, ids):
+def outer_merge_df(df: 'pd.DataFrame', other_df: 'pd.DataFrame', ids):
     return _how_merge_df(df, other_df, ids, how='outer')
 
-def left_merge_df(df: pd.DataFrame, other_df: pd.DataFrame, ids):
+def left_merge_df(df: 'pd.DataFrame', other_df: 'pd.DataFrame', ids):
     return _how_merge_df(df, other_df, ids, how='left')
 
-def right_merge_df(df: pd.DataFrame, other_df: pd.DataFrame, ids):
+def right_merge_df(df: 'pd.DataFrame', other_df: 'pd.DataFrame', ids):
     return _how_merge_df(df, other_df, ids, how='right')
\ No newline at end of file
@@ -3,7 +3,6 @@ if TYPE_CHECKING:
     from pyfileconf.data.models.merge import DataMerge
 
 from pyfileconf.data.logic.merge.summarize import get_summary_of_df
-from datacode.display import display_df_dict
 
 
 def display_merge_summary(merge: 'DataMerge', *summary_args, summary_method: str=None, summary_function: Callable=None,
@@ -28,6 +27,7 @@ def display_merge_summary(merge: 'DataMerge', *summary_args, summary_method: str
     if summary_method is not None:
         summary_disp = f'df.{summary_method}(*{summary_args}, **{summary_method_kwargs})'
 
+    from datacode.display import display_df_dict
     display_df_dict({
         f'{summary_disp} called on: ' + merge.merge_str: df_disp_dict
     })
@@ -21,17 +21,13 @@ class SpecificClassCollection(Collection):
         if self.klass is None:
             raise ValueError('must pass class for SpecificClassCollection')
 
-    def _set_name_map(self) -> None:
-        obj_map = {}
-        for obj_or_collection in self:
-            obj_or_collection = cast(ObjOrCollection, obj_or_collection)
-            if isinstance(obj_or_collection, SpecificClassCollection):
-                key_attr = 'name'
-            else:
-                key_attr = self.key_attr
-            obj_name = getattr(obj_or_collection, key_attr)
-            obj_map[obj_name] = obj_or_collection
-        self.name_dict = obj_map
+    def _name_for_item(self, item) -> str:
+        obj_or_collection = cast(ObjOrCollection, item)
+        if isinstance(obj_or_collection, SpecificClassCollection):
+            key_attr = 'name'
+        else:
+            key_attr = self.key_attr
+        return getattr(obj_or_collection, key_attr)
 
     def _transform_item(self, item):
         """
@@ -45,12 +41,16 @@ class SpecificClassCollection(Collection):
         """
         return convert_to_empty_obj_if_necessary(item, self.klass, key_attr=self.key_attr)
 
-    def _output_config_files(self) -> None:
+    def _prepare_config_output(self) -> None:
         if not os.path.exists(self.basepath):
-            os.makedirs(self.basepath)
+            os.makedirs(self.basepath, exist_ok=True)
+
+    def _config_filepath_for(self, item: Any) -> str:
+        item_name = getattr(item, self.key_attr)
+        return os.path.join(self.basepath, item_name + '.py')
 
-        for item in self:
-            self._output_config_file(item)
+    def _config_source_for(self, item: Any) -> Type:
+        return self.klass
 
     def _output_config_file(self, item: ObjOrCollection) -> None:
         if isinstance(item, SpecificClassCollection):
@@ -59,7 +59,7 @@ class SpecificClassCollection(Collection):
 
         # Dealing with object itself
         item_name = getattr(item, self.key_attr)
-        item_filepath = os.path.join(self.basepath, item_name + '.py')
+        item_filepath = self._config_filepath_for(item)
 
         class_config = dict(
             klass=self.klass,
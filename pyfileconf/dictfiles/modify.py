@@ -1,8 +1,6 @@
 import ast
 from typing import Optional, Union
 
-import black
-
 from pyfileconf.sectionpath.sectionpath import SectionPath
 
 
@@ -91,6 +89,9 @@ def create_dict_assignment_str_from_nested_dict_with_ast_names(nested_dict: dict
 
 
 def pretty_format_str(string: str) -> str:
+    # black is slow to import and only needed when writing dict files
+    import black
+
     fm = black.FileMode()
     out_str = black.format_str(string, mode=fm)
     return out_str
\ No newline at end of file
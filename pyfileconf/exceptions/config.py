@@ -5,3 +5,11 @@ class ConfigManagerNotLoadedException(Exception):
 
 class CannotResolveConfigDependenciesException(Exception):
     pass
+
+
+class ReadOnlyConfigException(TypeError):
+    pass
+
+
+class ConfigDependencyCycleException(CannotResolveConfigDependenciesException):
+    pass
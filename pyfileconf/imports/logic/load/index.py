@@ -0,0 +1,193 @@
+"""
+Index of the objects and names in imported modules, for finding which
+module an object can be imported from without scanning every module each time.
+
+The index is built lazily on first use and refreshed incrementally: only modules which
+were imported (or re-imported) since the last refresh, or whose namespace has grown since
+they were indexed (e.g. they were still being imported), are scanned again. Rebinding an existing
+name of an indexed module does not change the size of its namespace, so the index may miss the
+new object. Callers fall back to scanning the modules on a miss, then call reindex for the module
+in which the object was found.
+"""
+import sys
+import threading
+from types import ModuleType
+from typing import Dict, List, Tuple, Any, Optional, Iterable
+
+from pyfileconf.imports.logic.load.skipmodules import skip_modules
+
+_skip_module_names = frozenset(skip_modules)
+
+
+def should_skip_module(name: str) -> bool:
+    """
+    Check if the module name ends with a name in skip_modules
+    """
+    parts = name.split('.')
+    for i in range(len(parts)):
+        if '.'.join(parts[i:]) in _skip_module_names:
+            return True
+    return False
+
+
+class ImportedObjectIndex:
+    """
+    Maps id(obj) to the modules and names under which obj can be found, and
+    attribute names to the modules which have them, for all modules in sys.modules.
+
+    Modules are ordered by when they were first seen or re-imported, which is their order
+    in sys.modules, so lookups match the results of scanning sys.modules in order.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._next_order = 0
+        self._module_order: Dict[str, int] = {}
+        self._module_states: Dict[str, Tuple[int, int]] = {}
+        self._module_entries: Dict[str, Dict[str, int]] = {}
+        self._objs: Dict[int, List[Tuple[str, str]]] = {}
+        self._names: Dict[str, List[str]] = {}
+
+    def find_obj(self, obj: Any, search_list: Optional[List[str]] = None) -> Optional[Tuple[ModuleType, str]]:
+        """
+        Find the first module containing obj
+
+        :param obj: object to look for
+        :param search_list: module names to look in, in order, defaults to all of sys.modules
+        :return: module and its name, None if obj is not in any module
+        """
+        with self._lock:
+            self.refresh()
+            candidates = self._in_module_order(
+                module_name for module_name, name in self._objs.get(id(obj), [])
+                if _module_attr_is(module_name, name, obj)
+            )
+        if search_list is not None:
+            candidates = _order_by_search_list(candidates, search_list)
+        if not candidates:
+            return None
+        module_name = candidates[0]
+        return sys.modules[module_name], module_name
+
+    def modules_with_name(self, name: str, search_list: Optional[List[str]] = None) -> List[str]:
+        """
+        Get the names of the modules which have an attribute named name
+
+        :param name: attribute name
+        :param search_list: module names to look in, in order, defaults to all of sys.modules
+        :return: module names in sys.modules order or search_list order if passed
+        """
+        with self._lock:
+            self.refresh()
+            module_names = self._in_module_order(
+                module_name for module_name in self._names.get(name, []) if _module_has_attr(module_name, name)
+            )
+        if search_list is not None:
+            return _order_by_search_list(module_names, search_list)
+        return module_names
+
+    def refresh(self):
+        """
+        Index modules which were imported or have grown since the last refresh
+        """
+        with self._lock:
+            for module_name, module in list(sys.modules.items()):
+                if module is None or should_skip_module(module_name):
+                    continue
+                module_state = (id(module), _namespace_size(module))
+                if self._module_states.get(module_name) == module_state:
+                    continue
+                if module_name in self._module_states and self._module_states[module_name][0] != module_state[0]:
+                    # Module was re-imported, so its previous entries are not relevant and
+                    # it is now after the other modules in sys.modules
+                    self._module_entries.pop(module_name, None)
+                    self._module_order.pop(module_name, None)
+                self._index_module(module_name, module)
+                self._module_states[module_name] = module_state
+
+    def reindex(self, module_name: str):
+        """
+        Scan a module again, such as after rebinding one of its existing names
+        """
+        with self._lock:
+            self._module_states.pop(module_name, None)
+            self.refresh()
+
+    def clear(self):
+        with self._lock:
+            self._next_order = 0
+            self._module_order.clear()
+            self._module_states.clear()
+            self._module_entries.clear()
+            self._objs.clear()
+            self._names.clear()
+
+    def _index_module(self, module_name: str, module: ModuleType):
+        if module_name not in self._module_order:
+            self._module_order[module_name] = self._next_order
+            self._next_order += 1
+        entries = self._module_entries.setdefault(module_name, {})
+        keys = dir(module)
+        # Drop names which were deleted from the module since it was last indexed
+        for key in entries.keys() - set(keys):
+            del entries[key]
+            module_names = self._names.get(key, [])
+            if module_name in module_names:
+                module_names.remove(module_name)
+        for key in keys:
+            try:
+                obj = getattr(module, key)
+            except Exception:
+                # Not expected on normal modules, but can
+                # be necessary in the case of some dynamically
+                # modified modules, e.g. pytest.collect in pytest>=6.0.0
+                continue
+            obj_id = id(obj)
+            if key not in entries:
+                self._names.setdefault(key, []).append(module_name)
+            elif entries[key] == obj_id:
+                continue
+            entries[key] = obj_id
+            self._objs.setdefault(obj_id, []).append((module_name, key))
+
+    def _in_module_order(self, module_names: Iterable[str]) -> List[str]:
+        # Re-imported modules may be listed more than once
+        unique_module_names = {module_name for module_name in module_names if module_name in self._module_order}
+        return sorted(unique_module_names, key=self._module_order.__getitem__)
+
+
+def _module_attr_is(module_name: str, name: str, obj: Any) -> bool:
+    # The id may have been reused by a new object after the indexed object was garbage collected
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    try:
+        return getattr(module, name) is obj
+    except Exception:
+        return False
+
+
+def _module_has_attr(module_name: str, name: str) -> bool:
+    # The name may have been deleted since the module was indexed
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    try:
+        return hasattr(module, name)
+    except Exception:
+        return False
+
+
+def _namespace_size(module: ModuleType) -> int:
+    try:
+        return len(module.__dict__)
+    except Exception:
+        return 0
+
+
+def _order_by_search_list(module_names: Iterable[str], search_list: List[str]) -> List[str]:
+    module_names = set(module_names)
+    return [module_name for module_name in search_list if module_name in module_names]
+
+
+imported_object_index = ImportedObjectIndex()
@@ -1,10 +1,9 @@
-from typing import List, Any, Tuple, Iterator
+from typing import List, Any, Tuple, Iterator, Optional
 from types import ModuleType
 import sys
 
 from pyfileconf.exceptions.imports import CouldNotDetermineModuleForObjectException
-from pyfileconf.imports.logic.load.skipmodules import skip_modules
-from pyfileconf.sectionpath.sectionpath import SectionPath
+from pyfileconf.imports.logic.load.index import imported_object_index, should_skip_module
 
 
 def get_imported_obj_variable_name(obj, module: ModuleType) -> str:
@@ -13,69 +12,75 @@ def get_imported_obj_variable_name(obj, module: ModuleType) -> str:
 
 
 def get_module_and_name_imported_from(obj, search_list: List[str]=None) -> Tuple[ModuleType, str]:
+    """
+    Find the first module in sys.modules, or in search_list if passed, which has obj
+
+    So a re-exported object is found in whichever module comes first, which is not
+    necessarily the module it was defined in.
+    """
+    module_and_name = imported_object_index.find_obj(obj, search_list)
+    if module_and_name is not None:
+        return module_and_name
+
+    # Functions and classes redefined under an existing name, e.g. interactively, are not
+    # in the index until their module is reindexed, but they know where they were defined
+    module_and_name = _get_module_and_name_defined_in(obj, search_list)
+    if module_and_name is not None:
+        return module_and_name
+
+    # The index misses other objects rebound to an existing name after their module was indexed,
+    # so confirm the object is not in any module before giving up
     if search_list is None:
         search_list = list(sys.modules.keys())
 
     for module_name in search_list:
 
         # skip modules which were causing issues
-        if _should_skip_module(module_name):
+        if should_skip_module(module_name):
             continue
 
-        module = sys.modules[module_name]
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
         if _obj_in_module(obj, module):
+            imported_object_index.reindex(module_name)
             return module, module_name
 
     raise CouldNotDetermineModuleForObjectException(f'could not find {obj} in {search_list}')
 
 def is_imported_name(name: str, search_list: List[str]=None) -> bool:
-    if search_list is None:
-        search_list = list(sys.modules.keys())
-
-    for module_name in search_list:
-
-        # skip modules which were causing issues
-        if _should_skip_module(module_name):
-            continue
-
-        module = sys.modules[module_name]
-        if _name_in_module(name, module):
-            return True
-
-    return False
+    return len(_is_imported_from(name, search_list)) > 0
 
 def is_imported_obj(obj, search_list: List[str]=None) -> bool:
-    if search_list is None:
-        search_list = list(sys.modules.keys())
-
-    for module_name in search_list:
-
-        # skip modules which were causing issues
-        if _should_skip_module(module_name):
-            continue
-
-        module = sys.modules[module_name]
-        if _obj_in_module(obj, module):
-            return True
-
-    return False
+    try:
+        get_module_and_name_imported_from(obj, search_list)
+    except CouldNotDetermineModuleForObjectException:
+        return False
+    return True
 
 def _is_imported_from(name: str, search_list: List[str]=None) -> List[str]:
-    if search_list is None:
-        search_list = list(sys.modules.keys())
-
-    matched_modules = []
-    for module_name in search_list:
+    return imported_object_index.modules_with_name(name, search_list)
 
-        # skip modules which were causing issues
-        if _should_skip_module(module_name):
-            continue
 
-        module = sys.modules[module_name]
-        if _name_in_module(name, module):
-            matched_modules.append(module_name)
+def _get_module_and_name_defined_in(obj, search_list: List[str]=None) -> Optional[Tuple[ModuleType, str]]:
+    """
+    Module in which a function or class was defined, if it is still there
+    """
+    module_name = getattr(obj, '__module__', None)
+    qualname = getattr(obj, '__qualname__', None)
+    if not isinstance(module_name, str) or not isinstance(qualname, str) or '.' in qualname:
+        return None
+    if search_list is not None and module_name not in search_list:
+        return None
+    if should_skip_module(module_name):
+        return None
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+    if getattr(module, qualname, None) is not obj:
+        return None
+    return module, module_name
 
-    return matched_modules
 
 def _get_key_matching_value(value, key_list, value_list) -> str:
     for i, match_value in enumerate(value_list):
@@ -115,15 +120,3 @@ def _obj_in_module(obj, module: ModuleType) -> bool:
 
 def _name_in_module(name: str, module: ModuleType) -> bool:
     return name in dir(module)
-
-
-def _should_skip_module(name: str) -> bool:
-    """
-    Check if module section path ends with a section path in skip_models
-    """
-    module_section_path = SectionPath(name)
-    for skip_name in skip_modules:
-        skip_sp = SectionPath(skip_name)
-        if module_section_path.endswith(skip_sp):
-            return True
-    return False
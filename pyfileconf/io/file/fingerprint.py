@@ -0,0 +1,190 @@
+import os
+import threading
+from typing import Optional, Tuple, Dict, Set, Iterable
+
+FileFingerprint = Tuple[int, int]
+# Fingerprint of a file which may have changed, which differs from the fingerprint of any file
+UNKNOWN_FINGERPRINT: FileFingerprint = (-1, -1)
+# Modification times lag the clock by up to the resolution of the file system
+MTIME_RESOLUTION_NS = 2 * 10 ** 9
+
+
+def file_fingerprint(filepath: str) -> Optional[FileFingerprint]:
+    """
+    Cheap fingerprint of a file's contents using a single stat call
+
+    :param filepath: path of file
+    :return: modification time in nanoseconds and size in bytes, or None
+        if the file does not exist
+    """
+    try:
+        stat = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileSnapshotDiff:
+    """
+    Files which were added, removed or modified between two snapshots
+    """
+
+    def __init__(self, added: Set[str], removed: Set[str], modified: Set[str]):
+        self.added = added
+        self.removed = removed
+        self.modified = modified
+
+    @property
+    def changed(self) -> Set[str]:
+        return self.added | self.removed | self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self) -> str:
+        return f'<FileSnapshotDiff(added={sorted(self.added)}, removed={sorted(self.removed)}, ' \
+               f'modified={sorted(self.modified)})>'
+
+
+class FileSnapshot:
+    """
+    Fingerprints of a group of files at a point in time, which can be
+    compared to a later snapshot to find which files changed
+    """
+
+    def __init__(self, fingerprints: Optional[Dict[str, FileFingerprint]] = None):
+        if fingerprints is None:
+            fingerprints = {}
+        self.fingerprints = fingerprints
+
+    @classmethod
+    def from_files(cls, filepaths: Iterable[str]) -> 'FileSnapshot':
+        """
+        Snapshot specific files. Files which do not exist are not included.
+        """
+        fingerprints = {}
+        for filepath in filepaths:
+            fingerprint = file_fingerprint(filepath)
+            if fingerprint is not None:
+                fingerprints[filepath] = fingerprint
+        return cls(fingerprints)
+
+    @classmethod
+    def from_folder(cls, folder: str, extension: str = '.py',
+                    skip_folder_prefixes: Tuple[str, ...] = ('_', '.')) -> 'FileSnapshot':
+        """
+        Snapshot all files with the extension in a folder and its subfolders
+
+        :param folder: folder to snapshot
+        :param extension: only files ending with this extension are included
+        :param skip_folder_prefixes: subfolders starting with these are not included
+        :return:
+        """
+        fingerprints: Dict[str, FileFingerprint] = {}
+        folders = [folder]
+        while folders:
+            current_folder = folders.pop()
+            try:
+                entries = list(os.scandir(current_folder))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith(skip_folder_prefixes):
+                        folders.append(entry.path)
+                elif entry.name.endswith(extension):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    fingerprints[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return cls(fingerprints)
+
+    def updated(self, filepaths: Iterable[str]) -> 'FileSnapshot':
+        """
+        Create a new snapshot with only the passed files taken again, which
+        avoids listing folders when it is already known which files changed
+        """
+        fingerprints = dict(self.fingerprints)
+        for filepath in filepaths:
+            fingerprint = file_fingerprint(filepath)
+            if fingerprint is None:
+                fingerprints.pop(filepath, None)
+            else:
+                fingerprints[filepath] = fingerprint
+        return FileSnapshot(fingerprints)
+
+    def forget_changes_since(self, time_ns: int) -> 'FileSnapshot':
+        """
+        Create a new snapshot where files modified since the time have an unknown fingerprint,
+        so that they show as modified compared to any later snapshot. Used when a snapshot
+        is taken after the files were read, as they may have been changed in between.
+        Files as pyfileconf last wrote them are kept.
+
+        :param time_ns: time in nanoseconds since the epoch, such as from time.time_ns
+        :return:
+        """
+        fingerprints = {
+            path: (
+                UNKNOWN_FINGERPRINT
+                if fingerprint[0] >= time_ns - MTIME_RESOLUTION_NS and
+                not written_files.is_unchanged_since_written(path)
+                else fingerprint
+            )
+            for path, fingerprint in self.fingerprints.items()
+        }
+        return FileSnapshot(fingerprints)
+
+    @property
+    def unknown_filepaths(self) -> Set[str]:
+        return {path for path, fingerprint in self.fingerprints.items() if fingerprint == UNKNOWN_FINGERPRINT}
+
+    def diff(self, later: 'FileSnapshot') -> FileSnapshotDiff:
+        """
+        Find the files which changed between this snapshot and a later one
+        """
+        current_paths = set(self.fingerprints)
+        later_paths = set(later.fingerprints)
+        modified = {
+            path for path in current_paths & later_paths
+            if self.fingerprints[path] != later.fingerprints[path]
+        }
+        return FileSnapshotDiff(later_paths - current_paths, current_paths - later_paths, modified)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def __repr__(self) -> str:
+        return f'<FileSnapshot(num_files={len(self)})>'
+
+
+class WrittenFiles:
+    """
+    Fingerprints of the files which pyfileconf last wrote itself, such as scaffolded configs,
+    so that watchers can tell them apart from changes made by the user
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, FileFingerprint] = {}
+
+    def record(self, filepath: str) -> None:
+        """
+        Record a file which was just written
+        """
+        fingerprint = file_fingerprint(filepath)
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._fingerprints[os.path.abspath(filepath)] = fingerprint
+
+    def is_unchanged_since_written(self, filepath: str) -> bool:
+        """
+        Whether the file is as pyfileconf last wrote it
+        """
+        with self._lock:
+            written_fingerprint = self._fingerprints.get(os.path.abspath(filepath))
+        return written_fingerprint is not None and file_fingerprint(filepath) == written_fingerprint
+
+
+written_files = WrittenFiles()
@@ -4,6 +4,7 @@ if TYPE_CHECKING:
 
 from pyfileconf.io.file.load.lazy.config import ConfigFileLoader
 from pyfileconf.io.file.write.config import ConfigFileStr
+from pyfileconf.io.file.write.deferred import save_config_file
 
 class ConfigFileInterface(ConfigFileLoader):
 
@@ -14,6 +15,4 @@ class ConfigFileInterface(ConfigFileLoader):
             existing_imports=self.imports,
             existing_body=self.assignment_body
         )
-
-        with open(self.filepath, 'w', newline='\n', encoding='utf8') as f:
-            f.write(file_str_obj.file_str)
\ No newline at end of file
+        save_config_file(self.filepath, file_str_obj.file_str)
@@ -6,6 +6,7 @@ if TYPE_CHECKING:
 from pyfileconf.assignments.models.container import AssignmentStatementContainer
 from pyfileconf.io.file.load.lazy.datadict import SpecificClassDictLoader
 from pyfileconf.io.file.write.base import FileStr
+from pyfileconf.io.file.fingerprint import written_files
 
 
 class SpecificClassDictInterface(SpecificClassDictLoader):
@@ -20,4 +21,5 @@ class SpecificClassDictInterface(SpecificClassDictLoader):
         )
 
         with open(self.filepath, 'w', newline='\n', encoding='utf8') as f:
-            f.write(file_str_obj.file_str)
\ No newline at end of file
+            f.write(file_str_obj.file_str)
+        written_files.record(self.filepath)
@@ -0,0 +1,137 @@
+"""
+Fast path for loading config files which only contain imports, literal assignments
+and the standard Selector boilerplate, building the user defined dict from the already
+parsed ast rather than executing the file as a module.
+"""
+import ast
+import importlib
+import threading
+from typing import Optional, Dict, Any
+
+from pyfileconf.io.file.load.active.userdef import _get_user_defined_dict_from_namespace
+
+
+class NotLiteralConfigException(Exception):
+    pass
+
+
+class ConfigLoadPathStats:
+    """
+    Tracks how many config files were loaded from literals and how many had to be executed
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.literal = 0
+        self.executed = 0
+
+    def __repr__(self):
+        return f'<ConfigLoadPathStats(literal={self.literal}, executed={self.executed})>'
+
+    def record_literal(self):
+        with self._lock:
+            self.literal += 1
+
+    def record_executed(self):
+        with self._lock:
+            self.executed += 1
+
+    def reset(self):
+        with self._lock:
+            self.literal = 0
+            self.executed = 0
+
+    @property
+    def total(self) -> int:
+        return self.literal + self.executed
+
+
+config_load_path_stats = ConfigLoadPathStats()
+
+
+def get_user_defined_dict_from_literal_ast(module_ast: ast.Module, filepath: str = '<config>') -> Optional[dict]:
+    """
+    Build the same dict as get_user_defined_dict_from_filepath without executing the file,
+    if the file only has imports, assignments of literals and assignments of Selector()
+
+    :param module_ast: parsed config file
+    :param filepath: path of config file, used in tracebacks of annotations
+    :return: user defined dict, or None if the file needs to be executed
+    """
+    namespace: Dict[str, Any] = {}
+    try:
+        for node in module_ast.body:
+            _add_node_to_namespace(node, namespace, filepath)
+    except NotLiteralConfigException:
+        return None
+    except Exception:
+        # Failed imports or annotations, let execution of the file raise the error as usual
+        return None
+
+    return _get_user_defined_dict_from_namespace(namespace)
+
+
+def _add_node_to_namespace(node: ast.stmt, namespace: Dict[str, Any], filepath: str):
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+        # Docstring
+        return
+    if isinstance(node, ast.ImportFrom):
+        if node.level != 0 or node.module is None:
+            raise NotLiteralConfigException('relative imports are resolved by executing the file')
+        module = importlib.import_module(node.module)
+        for alias in node.names:
+            if alias.name == '*':
+                raise NotLiteralConfigException('star imports are resolved by executing the file')
+            try:
+                value = getattr(module, alias.name)
+            except AttributeError:
+                # Submodule which has not been imported yet
+                value = importlib.import_module(f'{node.module}.{alias.name}')
+            namespace[alias.asname or alias.name] = value
+        return
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            module = importlib.import_module(alias.name)
+            if alias.asname is not None:
+                namespace[alias.asname] = module
+            else:
+                root_name = alias.name.split('.')[0]
+                namespace[root_name] = importlib.import_module(root_name)
+        return
+    if isinstance(node, ast.Assign):
+        if not all(isinstance(target, ast.Name) for target in node.targets):
+            raise NotLiteralConfigException('only assignments to names can be evaluated as literals')
+        value = _literal_value(node.value, namespace)
+        for target in node.targets:
+            namespace[target.id] = value  # type: ignore
+        return
+    if isinstance(node, ast.AnnAssign):
+        if not isinstance(node.target, ast.Name):
+            raise NotLiteralConfigException('only assignments to names can be evaluated as literals')
+        value = _literal_value(node.value, namespace) if node.value is not None else None
+        # Module level annotations are evaluated when executing, so they may raise errors
+        annotation = eval(compile(ast.Expression(node.annotation), filepath, 'eval'), namespace)
+        namespace.setdefault('__annotations__', {})[node.target.id] = annotation
+        if node.value is not None:
+            namespace[node.target.id] = value
+        return
+    raise NotLiteralConfigException(f'{type(node).__name__} statements are evaluated by executing the file')
+
+
+def _literal_value(node: ast.expr, namespace: Dict[str, Any]) -> Any:
+    from pyfileconf.selector.models.selector import Selector
+
+    if (
+        isinstance(node, ast.Call) and
+        isinstance(node.func, ast.Name) and
+        not node.args and
+        not node.keywords and
+        namespace.get(node.func.id) is Selector
+    ):
+        # Standard s = Selector() boilerplate
+        return Selector()
+
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise NotLiteralConfigException(f'{ast.dump(node)} is not a literal')
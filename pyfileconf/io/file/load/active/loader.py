@@ -1,3 +1,4 @@
+from pyfileconf.io.file.load.active.literal import get_user_defined_dict_from_literal_ast, config_load_path_stats
 from pyfileconf.io.file.load.active.userdef import get_user_defined_dict_from_filepath
 from pyfileconf.io.file.load.lazy.base.impassign import ImportAssignmentLazyLoader
 from pyfileconf.pmcontext.actions import PyfileconfActions
@@ -11,9 +12,17 @@ class ActiveConfigFileLoader(ImportAssignmentLazyLoader):
         # Get ast, imports, assigns
         super().register()
 
-        # Actually import module
         with StackTracker(file_path=self.filepath, action=PyfileconfActions.LOAD_FILE_EXECUTE):
-            self._user_defined_dict = get_user_defined_dict_from_filepath(self.filepath)
+            # Files with only literals can be loaded from the ast, otherwise actually import module
+            user_defined_dict = None
+            if self.ast is not None:
+                user_defined_dict = get_user_defined_dict_from_literal_ast(self.ast, self.filepath)
+            if user_defined_dict is not None:
+                config_load_path_stats.record_literal()
+            else:
+                config_load_path_stats.record_executed()
+                user_defined_dict = get_user_defined_dict_from_filepath(self.filepath)
+            self._user_defined_dict = user_defined_dict
 
         return self._user_defined_dict
 
@@ -6,6 +6,7 @@ from typing import Optional
 
 from pyfileconf.exceptions.imports import CouldNotImportException
 from pyfileconf.imports.models.statements.container import ImportStatementContainer
+from pyfileconf.io.file.load.bytecode import bytecode_cache
 
 def get_user_defined_dict_from_filepath(filepath: str, module_name: str=None, remove_imports=False,
                                         imports: ImportStatementContainer=None) -> dict:
@@ -22,8 +23,11 @@ def get_user_defined_dict_from_filepath(filepath: str, module_name: str=None, re
         return user_defined_dict
 
 def _get_user_defined_dict_from_module(module: ModuleType) -> dict:
+    return _get_user_defined_dict_from_namespace(module.__dict__)
+
+def _get_user_defined_dict_from_namespace(namespace: dict) -> dict:
     out_dict = {}
-    for key, value in module.__dict__.items():
+    for key, value in namespace.items():
         if key.startswith('__') or isinstance(value, ModuleType):
             continue
         out_dict.update({key: value})
@@ -44,7 +48,11 @@ def _load_file_as_module(filepath: str, name: Optional[str] = 'module.name') ->
         raise CouldNotImportException(
             f'got no spec.loader after calling importlib.util.spec_from_file_location on {filepath}'
         )
-    spec.loader.exec_module(module)
+    code = bytecode_cache.get_code(filepath)
+    if code is not None:
+        exec(code, module.__dict__)
+    else:
+        spec.loader.exec_module(module)
 
     if add_to_sys:
         sys.modules.update({name: module})
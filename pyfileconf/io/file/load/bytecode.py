@@ -0,0 +1,104 @@
+"""
+Persistent on-disk cache of compiled config files.
+
+Config files which can not be loaded from literals are executed on every load and
+refresh. This stores the compiled code object for each file path along with a hash of the
+source and the Python bytecode version, so while neither changes the code only needs to
+be unmarshalled rather than parsed and compiled again. Only active when the cache_folder
+option is set.
+"""
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+from types import CodeType
+from typing import Optional
+
+from pyfileconf.basemodels.cache import CacheStats
+from pyfileconf.logger.logger import logger
+
+
+class BytecodeCache:
+    subfolder = 'bytecode'
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @property
+    def folder(self) -> Optional[str]:
+        from pyfileconf.opts import options
+        if options.cache_folder is None:
+            return None
+        return os.path.join(options.cache_folder, self.subfolder)
+
+    @property
+    def enabled(self) -> bool:
+        return self.folder is not None
+
+    def get_code(self, filepath: str) -> Optional[CodeType]:
+        """
+        Get the compiled code for a file, compiling it and storing it in the cache if
+        the file was not compiled before or has changed
+
+        :param filepath: path of the source file
+        :return: code object, or None if the cache is not enabled
+        """
+        if not self.enabled:
+            return None
+
+        with open(filepath, 'rb') as f:
+            source = f.read()
+
+        header = importlib.util.MAGIC_NUMBER + hashlib.sha1(source).digest()
+        cache_path = self._cache_path(filepath)
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f'Could not read bytecode cache for {filepath}: {e}')
+        else:
+            if data[:len(header)] == header:
+                try:
+                    code = marshal.loads(data[len(header):])
+                except Exception as e:
+                    # Corrupt cache file, will be overwritten by the compiled file
+                    logger.debug(f'Could not load bytecode cache for {filepath}: {e}')
+                else:
+                    self.stats.record_hit()
+                    return code
+
+        self.stats.record_miss()
+        code = compile(source, filepath, 'exec', dont_inherit=True)
+        self._write(cache_path, header, code)
+        return code
+
+    def _write(self, cache_path: str, header: bytes, code: CodeType) -> None:
+        folder = os.path.dirname(cache_path)
+        if not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        # Write to a temporary file then move it into place so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                f.write(marshal.dumps(code))
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logger.debug(f'Could not write bytecode cache {cache_path}: {e}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _cache_path(self, filepath: str) -> str:
+        folder = self.folder
+        if folder is None:
+            raise ValueError('cache_folder option must be set to use the bytecode cache')
+        # Path is used as passed as it is stored in the code object for tracebacks
+        path_hash = hashlib.sha1(filepath.encode('utf8')).hexdigest()
+        return os.path.join(folder, path_hash + '.pyc')
+
+
+bytecode_cache = BytecodeCache()
@@ -0,0 +1,117 @@
+"""
+Persistent on-disk cache of parsed config files.
+
+Stores the ast, body lines, imports and assignments extracted for a file, keyed by the
+file path and its fingerprint (modification time and size) so that unchanged files do
+not need to be parsed again. Only active when the cache_folder option is set.
+"""
+import ast
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Tuple, List, Optional, Any
+
+from pyfileconf.assignments.models.container import AssignmentStatementContainer
+from pyfileconf.basemodels.cache import CacheStats
+from pyfileconf.imports.models.statements.container import ImportStatementContainer
+from pyfileconf.io.file.fingerprint import FileFingerprint
+from pyfileconf.logger.logger import logger
+
+ParsedFile = Tuple[ast.Module, List[str], ImportStatementContainer, AssignmentStatementContainer]
+
+# Bump when the structure of the cached objects changes, to invalidate old caches
+CACHE_FORMAT_VERSION = 1
+CACHE_KEY = (CACHE_FORMAT_VERSION, sys.version_info[:2])
+
+
+class ParsedFileCache:
+    subfolder = 'ast'
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @property
+    def folder(self) -> Optional[str]:
+        from pyfileconf.opts import options
+        if options.cache_folder is None:
+            return None
+        return os.path.join(options.cache_folder, self.subfolder)
+
+    @property
+    def enabled(self) -> bool:
+        return self.folder is not None
+
+    def get(self, filepath: str, fingerprint: Optional[FileFingerprint]) -> Optional[ParsedFile]:
+        """
+        Get the parsed contents of a file, if they were cached with the same fingerprint
+
+        :param filepath: path of file which was parsed
+        :param fingerprint: current fingerprint of file
+        :return: parsed file or None if there is no valid cache entry
+        """
+        if not self.enabled or fingerprint is None:
+            return None
+
+        cache_path = self._cache_path(filepath)
+        try:
+            with open(cache_path, 'rb') as f:
+                cache_key, cached_filepath, cached_fingerprint, parsed = pickle.load(f)
+        except FileNotFoundError:
+            self.stats.record_miss()
+            return None
+        except Exception as e:
+            # Corrupt or incompatible cache file, will be overwritten by the parsed file
+            logger.debug(f'Could not read parsed file cache for {filepath}: {e}')
+            self.stats.record_miss()
+            return None
+
+        if (
+            cache_key != CACHE_KEY or
+            cached_filepath != os.path.abspath(filepath) or
+            tuple(cached_fingerprint) != tuple(fingerprint)
+        ):
+            self.stats.record_miss()
+            return None
+
+        self.stats.record_hit()
+        return parsed
+
+    def set(self, filepath: str, fingerprint: Optional[FileFingerprint], parsed: ParsedFile) -> None:
+        """
+        Store the parsed contents of a file
+
+        :param filepath: path of file which was parsed
+        :param fingerprint: fingerprint of file taken before it was read
+        :param parsed: ast, body, imports and assigns of the file
+        :return: None
+        """
+        folder = self.folder
+        if folder is None or fingerprint is None:
+            return
+
+        if not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        contents = (CACHE_KEY, os.path.abspath(filepath), fingerprint, parsed)
+        # Write to a temporary file then move it into place so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(contents, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_path(filepath))
+        except Exception as e:
+            logger.debug(f'Could not write parsed file cache for {filepath}: {e}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _cache_path(self, filepath: str) -> str:
+        folder = self.folder
+        if folder is None:
+            raise ValueError('cache_folder option must be set to use the parsed file cache')
+        path_hash = hashlib.sha1(os.path.abspath(filepath).encode('utf8')).hexdigest()
+        return os.path.join(folder, path_hash + '.pkl')
+
+
+parsed_file_cache = ParsedFileCache()
@@ -1,3 +1,5 @@
+from pyfileconf.io.file.fingerprint import file_fingerprint
+from pyfileconf.io.file.load.cache import parsed_file_cache
 from pyfileconf.io.file.load.lazy.base.loader import LazyLoader
 from pyfileconf.io.file.load.parsers.imp import extract_imports_from_ast
 from pyfileconf.io.file.load.parsers.assign import extract_assignments_from_ast
@@ -9,6 +11,14 @@ from pyfileconf.imports.models.statements.container import ImportStatementContai
 class ImportAssignmentLazyLoader(LazyLoader):
 
     def register(self):
+        # Take fingerprint before reading so that a file changed during parsing is never
+        # stored under its new fingerprint
+        fingerprint = file_fingerprint(self.filepath) if parsed_file_cache.enabled else None
+        cached = parsed_file_cache.get(self.filepath, fingerprint)
+        if cached is not None:
+            self._ast, self._body, self._imports, self._assigns = cached
+            return
+
         # Store ast representation of file and file body
         super().register()
 
@@ -16,6 +26,9 @@ class ImportAssignmentLazyLoader(LazyLoader):
         if self._ast is not None:
             self._imports = extract_imports_from_ast(self._ast)
             self._assigns = extract_assignments_from_ast(self._ast)
+            parsed_file_cache.set(
+                self.filepath, fingerprint, (self._ast, self._body, self._imports, self._assigns)
+            )
         else:
             self._imports = ImportStatementContainer([])
             self._assigns = AssignmentStatementContainer([])
@@ -26,4 +39,4 @@ class ImportAssignmentLazyLoader(LazyLoader):
 
     @property
     def assigns(self) -> AssignmentStatementContainer:
-        return self._try_getattr_else_register('_assigns')
\ No newline at end of file
+        return self._try_getattr_else_register('_assigns')
@@ -1,8 +1,8 @@
 import ast
 from typing import List, Union
 
-FunctionDefOrNone = Union[ast.FunctionDef, None]
-FunctionDefs = List[ast.FunctionDef]
+FunctionDefOrNone = Union[ast.FunctionDef, ast.AsyncFunctionDef, None]
+FunctionDefs = List[Union[ast.FunctionDef, ast.AsyncFunctionDef]]
 
 class FunctionDefinitionExtractor(ast.NodeVisitor):
 
@@ -13,6 +13,10 @@ class FunctionDefinitionExtractor(ast.NodeVisitor):
         self.defs.append(node)
         # don't go into children, so won't extract nested functions
 
+    def visit_AsyncFunctionDef(self, node):
+        # Coroutine functions are configured the same as functions
+        self.visit_FunctionDef(node)
+
     def visit_ClassDef(self, node):
         pass
         # don't go into children, so won't extract class methods
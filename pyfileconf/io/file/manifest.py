@@ -0,0 +1,127 @@
+"""
+Manifest of scaffolded config files.
+
+Records, for each config file output while scaffolding, the inputs used to create it
+(the fingerprints of the files defining the object whose signature was extracted and,
+for classes, its base classes, the name of the object and the always import and assign
+strs), the registrar which output it as well as the fingerprint of the config file after
+it was written. When nothing has changed, the config file does not need to be loaded,
+merged and written again.
+"""
+import json
+import os
+import tempfile
+from typing import Dict, Any, Optional, List, Iterable
+
+from pyfileconf.io.file.fingerprint import file_fingerprint
+from pyfileconf.logger.logger import logger
+
+# Bump when the structure of manifest entries or the scaffolded output changes, to rescaffold everything
+MANIFEST_FORMAT_VERSION = 3
+SCAFFOLD_MANIFEST_FILENAME = '_scaffold_manifest.json'
+
+ScaffoldInputs = List[Any]
+
+
+class ScaffoldManifest:
+
+    def __init__(self, path: str, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        if entries is None:
+            entries = {}
+
+        self.path = path
+        self.entries = entries
+
+    @classmethod
+    def load(cls, path: str) -> 'ScaffoldManifest':
+        """
+        Load the manifest from a file. A missing, corrupt or outdated manifest
+        results in an empty manifest so that all files are scaffolded.
+        """
+        try:
+            with open(path, 'r') as f:
+                contents = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except Exception as e:
+            logger.debug(f'Could not read scaffold manifest {path}: {e}')
+            return cls(path)
+
+        if not isinstance(contents, dict) or contents.get('version') != MANIFEST_FORMAT_VERSION:
+            return cls(path)
+
+        return cls(path, contents.get('entries', {}))
+
+    def is_current(self, filepath: str, inputs: Optional[ScaffoldInputs]) -> bool:
+        """
+        Whether the config file at filepath was scaffolded from the same inputs and has not
+        been changed since
+
+        :param filepath: path of config file
+        :param inputs: inputs which would be used to scaffold the file, None if they could not be determined
+        :return:
+        """
+        if inputs is None:
+            return False
+
+        try:
+            entry = self.entries[self._key(filepath)]
+        except KeyError:
+            return False
+
+        fingerprint = file_fingerprint(filepath)
+        if fingerprint is None:
+            return False
+
+        return entry['inputs'] == inputs and entry['config'] == list(fingerprint)
+
+    def record(self, filepath: str, inputs: Optional[ScaffoldInputs], registrar_name: str) -> None:
+        """
+        Record the inputs and current fingerprint of a scaffolded config file.
+        Files for which the inputs could not be determined are not recorded.
+        """
+        key = self._key(filepath)
+        fingerprint = file_fingerprint(filepath)
+        if inputs is None or fingerprint is None:
+            self.entries.pop(key, None)
+            return
+
+        self.entries[key] = dict(inputs=inputs, config=list(fingerprint), registrar=registrar_name)
+
+    def prune(self, registrar_names: Iterable[str], filepaths: Iterable[str]) -> None:
+        """
+        Remove entries for config files which no longer exist, and for config files of the
+        passed registrars which are not among the passed file paths as their items were removed
+
+        :param registrar_names: names of registrars which were scaffolded
+        :param filepaths: paths of all the config files output by those registrars
+        :return:
+        """
+        registrar_names = set(registrar_names)
+        keep_keys = {self._key(filepath) for filepath in filepaths}
+        base_folder = os.path.dirname(os.path.abspath(self.path))
+        for key, entry in list(self.entries.items()):
+            if key in keep_keys:
+                continue
+            if entry.get('registrar') in registrar_names or not os.path.exists(os.path.join(base_folder, key)):
+                del self.entries[key]
+
+    def save(self) -> None:
+        folder = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        contents = dict(version=MANIFEST_FORMAT_VERSION, entries=self.entries)
+        # Write to a temporary file then move it into place so a partial manifest is never read
+        fd, temp_path = tempfile.mkstemp(dir=folder or None, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(contents, f, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.debug(f'Could not write scaffold manifest {self.path}: {e}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _key(self, filepath: str) -> str:
+        return os.path.relpath(os.path.abspath(filepath), os.path.dirname(os.path.abspath(self.path)))
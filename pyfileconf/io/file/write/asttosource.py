@@ -1,5 +1,4 @@
 import ast
-import astor
 
 def ast_node_to_source(ast_node: ast.AST) -> str:
     """
@@ -15,6 +14,9 @@ def ast_node_to_source(ast_node: ast.AST) -> str:
 
     """
 
+    # astor is only needed when writing files
+    import astor
+
     # Must be a module to output to source. Wrap in module if not already
     if not isinstance(ast_node, ast.Module):
         ast_node = ast.Module([ast_node])
@@ -0,0 +1,66 @@
+"""
+Deferring writes of config files, so that their contents can be created in worker
+processes and written out by the calling process.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from pyfileconf.io.file.fingerprint import written_files
+
+
+class DeferredWrites:
+    """
+    Contents of config files to be written, by file path, in the order they were first output
+    """
+
+    def __init__(self):
+        self.contents: Dict[str, str] = {}
+
+    def __repr__(self):
+        return f'<DeferredWrites(num_files={len(self.contents)})>'
+
+    def add(self, filepath: str, contents: str) -> None:
+        self.contents[filepath] = contents
+
+    def flush(self, filepath: str) -> None:
+        """
+        Writes the pending contents of a file now, such as before the file is loaded again
+        """
+        contents = self.contents.pop(filepath, None)
+        if contents is not None:
+            write_config_file(filepath, contents)
+
+
+_deferred_writes: ContextVar[Optional[DeferredWrites]] = ContextVar('pyfileconf_deferred_writes', default=None)
+
+
+@contextmanager
+def defer_config_file_writes() -> Iterator[DeferredWrites]:
+    """
+    Collect the contents of config files saved within the block rather than writing them.
+    The caller is responsible for writing out the collected contents.
+    """
+    deferred = DeferredWrites()
+    token = _deferred_writes.set(deferred)
+    try:
+        yield deferred
+    finally:
+        _deferred_writes.reset(token)
+
+
+def save_config_file(filepath: str, contents: str) -> None:
+    """
+    Writes the config file, or adds it to the deferred writes when within defer_config_file_writes
+    """
+    deferred = _deferred_writes.get()
+    if deferred is not None:
+        deferred.add(filepath, contents)
+        return
+    write_config_file(filepath, contents)
+
+
+def write_config_file(filepath: str, contents: str) -> None:
+    with open(filepath, 'w', newline='\n', encoding='utf8') as f:
+        f.write(contents)
+    written_files.record(filepath)
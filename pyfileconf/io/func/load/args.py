@@ -1,4 +1,5 @@
 import ast
+import copy
 from typing import TYPE_CHECKING, Tuple, Optional, cast
 
 from pyfileconf.exceptions.imports import NoImportStatementException
@@ -14,7 +15,8 @@ from pyfileconf.imports.models.statements.interfaces import (
 )
 
 from pyfileconf.io.file.load.parsers.funcdef import extract_function_definition_or_class_init_from_ast_by_name
-from pyfileconf.io.file.load.lazy.base.impassign import ImportAssignmentLazyLoader
+from pyfileconf.io.func.load.cache import source_module_cache
+from pyfileconf.profile import profile_phase, PHASE_ARGUMENT_EXTRACTION
 from pyfileconf.imports.models.statements.container import ImportStatementContainer
 
 ArgumentsAndImports = Tuple[ast.arguments, ImportStatementContainer]
@@ -34,6 +36,13 @@ class FunctionArgsExtractor:
 
 def extract_function_args_and_arg_imports_from_import(function_name: str, imp: Optional[AnyImportStatement],
                                                       import_section_path_str: Optional[str] = None) -> ArgumentsAndImports:
+    with profile_phase(PHASE_ARGUMENT_EXTRACTION, function_name):
+        return _extract_function_args_and_arg_imports_from_import(function_name, imp, import_section_path_str)
+
+
+def _extract_function_args_and_arg_imports_from_import(function_name: str, imp: Optional[AnyImportStatement],
+                                                       import_section_path_str: Optional[str] = None
+                                                       ) -> ArgumentsAndImports:
     from pyfileconf.io.func.load.extractimp import extract_import_statements_from_function_args_imports_and_assigns
 
     if imp is None:
@@ -49,7 +58,11 @@ def extract_function_args_and_arg_imports_from_import(function_name: str, imp: O
         # Get original name from rename statement
         function_name = imp.renames.reverse_name_map[function_name]
 
-    loader = ImportAssignmentLazyLoader(filepath)
+    cached_args_and_imports = source_module_cache.get_args(filepath, function_name, imp.module)
+    if cached_args_and_imports is not None:
+        return cached_args_and_imports
+
+    loader = source_module_cache.get_loader(filepath)
 
     # TODO [#44]: handle relative nested imports such as from .this import that
     #
@@ -66,16 +79,25 @@ def extract_function_args_and_arg_imports_from_import(function_name: str, imp: O
     if ast_function_def is not None:
         # Found function definition in this import
         # TODO [#12]: handle other class methods - also update extract_function_definition function
+        args = ast_function_def.args
         if ast_function_def.name == '__init__':
-            # Got class init
-            del ast_function_def.args.args[0]  # delete first arg (self)
+            # Got class init. Copy rather than modify the args as the parsed module is shared
+            args = copy.copy(args)
+            args.args = args.args[1:]  # remove first arg (self)
         function_arg_imports = extract_import_statements_from_function_args_imports_and_assigns(
-            ast_function_def.args,
+            args,
             loader.imports,
             loader.assigns,
             imp.module
         )
-        return ast_function_def.args, function_arg_imports
+        source_module_cache.set_args(
+            filepath,
+            function_name,
+            imp.module,
+            (args, function_arg_imports),
+            fingerprint=source_module_cache.loader_fingerprint(filepath)
+        )
+        return args, function_arg_imports
 
     # Else, this function must have been imported into this file as well.
     # Must find the matching import, the extract args from that import
@@ -90,7 +112,7 @@ def extract_function_args_and_arg_imports_from_import(function_name: str, imp: O
     else:
         new_section_path = None
 
-    return extract_function_args_and_arg_imports_from_import(
+    return _extract_function_args_and_arg_imports_from_import(
         function_name,
         imp=next_level_import,
         import_section_path_str=new_section_path
@@ -0,0 +1,120 @@
+"""
+Process-wide in-memory cache of parsed source modules and the arguments and argument
+imports extracted from the functions and classes in them.
+
+Scaffolding extracts the arguments of every item from the module it was imported from.
+Many items usually come from the same few modules, and multiple PipelineManagers may point
+at the same code, so parsed modules and extracted arguments are shared. Entries are keyed
+by the file path and its fingerprint (modification time and size), so a changed module
+is parsed again.
+"""
+import copy
+import os
+import threading
+from typing import Dict, Tuple, Optional, TYPE_CHECKING
+
+from pyfileconf.basemodels.cache import CacheStats
+from pyfileconf.io.file.fingerprint import file_fingerprint, FileFingerprint
+from pyfileconf.io.file.load.lazy.base.impassign import ImportAssignmentLazyLoader
+
+if TYPE_CHECKING:
+    from pyfileconf.io.func.load.args import ArgumentsAndImports
+
+
+class SourceModuleCache:
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaders: Dict[str, Tuple[Optional[FileFingerprint], ImportAssignmentLazyLoader]] = {}
+        self._args: Dict[Tuple[str, Optional[FileFingerprint], str, str], 'ArgumentsAndImports'] = {}
+        self.stats = CacheStats()
+
+    def get_loader(self, filepath: str) -> ImportAssignmentLazyLoader:
+        """
+        Get a loader for the module file which has already parsed the file, if the file
+        has not changed since it was last parsed
+        """
+        filepath = os.path.abspath(filepath)
+        # Take fingerprint before parsing so that a file changed during parsing is never
+        # stored under its new fingerprint
+        fingerprint = file_fingerprint(filepath)
+        with self._lock:
+            cached = self._loaders.get(filepath)
+            if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+                return cached[1]
+
+        loader = ImportAssignmentLazyLoader(filepath)
+        loader.register()
+        with self._lock:
+            self._loaders[filepath] = (fingerprint, loader)
+            # Arguments extracted from previous versions of the file will never be used again
+            for key in [key for key in self._args if key[0] == filepath and key[1] != fingerprint]:
+                del self._args[key]
+        return loader
+
+    def get_args(self, filepath: str, function_name: str, module: str) -> Optional['ArgumentsAndImports']:
+        """
+        Get the arguments and argument imports previously extracted for a function
+
+        :param filepath: path of the module file in which the function is defined
+        :param function_name: name of the function or class
+        :param module: import path of the module, used to create imports of names assigned in the module
+        :return: copies of the arguments and imports, or None if they have not been extracted for the
+            current version of the file
+        """
+        key = self._args_key(filepath, function_name, module)
+        if key is None:
+            self.stats.record_miss()
+            return None
+        with self._lock:
+            cached = self._args.get(key)
+        if cached is None:
+            self.stats.record_miss()
+            return None
+        self.stats.record_hit()
+        return copy.deepcopy(cached)
+
+    def set_args(self, filepath: str, function_name: str, module: str,
+                 args_and_imports: 'ArgumentsAndImports', fingerprint: Optional[FileFingerprint] = None) -> None:
+        """
+        Store extracted arguments and argument imports for a function
+
+        :param filepath: path of the module file in which the function is defined
+        :param function_name: name of the function or class
+        :param module: import path of the module, used to create imports of names assigned in the module
+        :param args_and_imports: extracted arguments and imports, a copy will be stored
+        :param fingerprint: fingerprint of the file when it was parsed, defaults to the current fingerprint
+        """
+        key = self._args_key(filepath, function_name, module, fingerprint=fingerprint)
+        if key is None:
+            return
+        with self._lock:
+            self._args[key] = copy.deepcopy(args_and_imports)
+
+    def loader_fingerprint(self, filepath: str) -> Optional[FileFingerprint]:
+        """
+        Fingerprint of the file when the cached loader parsed it
+        """
+        with self._lock:
+            cached = self._loaders.get(os.path.abspath(filepath))
+        if cached is None:
+            return None
+        return cached[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaders.clear()
+            self._args.clear()
+            self.stats.reset()
+
+    def _args_key(self, filepath: str, function_name: str, module: str,
+                  fingerprint: Optional[FileFingerprint] = None
+                  ) -> Optional[Tuple[str, Optional[FileFingerprint], str, str]]:
+        if fingerprint is None:
+            fingerprint = file_fingerprint(filepath)
+        if fingerprint is None:
+            return None
+        return os.path.abspath(filepath), fingerprint, function_name, module
+
+
+source_module_cache = SourceModuleCache()
@@ -1,5 +1,7 @@
 import sys
+import threading
 from contextlib import contextmanager
+from typing import Dict
 
 from pyfileconf.logger.logger import logger
 
@@ -8,20 +10,41 @@ from pyfileconf.logger.logger import logger
 def stdout_also_logged():
     stdout_logger = StdoutLogger()
     sys.stdout = stdout_logger  # type: ignore
-    yield stdout_logger
-    sys.stdout = stdout_logger.terminal
+    try:
+        yield stdout_logger
+    finally:
+        stdout_logger.flush()
+        sys.stdout = stdout_logger.terminal
 
 
 class StdoutLogger(object):
+    """
+    Logs what is written to stdout, one record per line. Partial lines are
+    buffered per thread until the rest of the line is written or stdout is
+    flushed, so lines printed by items running in other threads are not mixed.
+    """
+
     def __init__(self):
         self.terminal = sys.stdout
+        self._lock = threading.Lock()
+        self._buffers: Dict[int, str] = {}
 
     def write(self, message):
-        if message != '\n':
-            logger.info(message)
+        thread_id = threading.get_ident()
+        with self._lock:
+            buffer = self._buffers.get(thread_id, '') + message
+            if '\n' not in message:
+                self._buffers[thread_id] = buffer
+                return
+            *lines, self._buffers[thread_id] = buffer.split('\n')
+        for line in lines:
+            if line:
+                logger.info(line)
 
     def flush(self):
-        #this flush method is needed for python 3 compatibility.
-        #this handles the flush command by doing nothing.
-        #you might want to specify some extra behavior here.
-        pass
+        with self._lock:
+            buffers = list(self._buffers.values())
+            self._buffers.clear()
+        for buffer in buffers:
+            if buffer:
+                logger.info(buffer)
@@ -1,7 +1,12 @@
+import atexit
+import copy
 import logging
 import os
+import queue
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+from typing import List, Optional
 
 
 class CustomFormatter(logging.Formatter):
@@ -40,15 +45,104 @@ def add_file_handler():
     )
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(CustomFormatter())
-    logger.addHandler(fh)
+    _set_output_handlers(_get_output_handlers() + [fh])
 
 
 def remove_file_handler():
-    timed_handlers = [h for h in logger.handlers if isinstance(h, TimedRotatingFileHandler)]
+    handlers = _get_output_handlers()
+    timed_handlers = [h for h in handlers if isinstance(h, TimedRotatingFileHandler)]
     if len(timed_handlers) != 1:
         raise ValueError(f'Could not remove pyfileconf TimedRotatingFileHandler. '
                          f'Expected 1 registered TimedRotatingFileHandler, '
                          f'got {len(timed_handlers)}')
     timed_handler = timed_handlers[0]
+    if _queue_listener is not None:
+        # Write out anything queued for the file before closing it
+        flush_log_queue()
     timed_handler.close()
-    logger.handlers = [h for h in logger.handlers if h is not timed_handler]
+    _set_output_handlers([h for h in handlers if h is not timed_handler])
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Puts records on the queue with their message rendered, so the listener thread never
+    reads the logged objects, which may have changed or still be in use by then. Unlike
+    QueueHandler, the output handlers still add the level, time and any traceback.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records only get here after passing the logger's level check, so only
+        # messages which are logged are rendered
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: Optional[QueueListener] = None
+_queue_lock = threading.RLock()
+_stop_at_exit_registered = False
+
+
+def start_log_queue():
+    """
+    Moves the output handlers of the pyfileconf logger to a background thread,
+    so logging only puts records on a queue in the calling thread
+    """
+    global _queue_listener, _stop_at_exit_registered
+    with _queue_lock:
+        if _queue_listener is not None:
+            return
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+        logger.handlers = [_RecordQueueHandler(log_queue)]
+        listener.start()
+        _queue_listener = listener
+        if not _stop_at_exit_registered:
+            atexit.register(stop_log_queue)
+            _stop_at_exit_registered = True
+
+
+def stop_log_queue():
+    """
+    Writes out all queued records then moves the output handlers back to the pyfileconf logger
+    """
+    global _queue_listener
+    with _queue_lock:
+        if _queue_listener is None:
+            return
+        listener = _queue_listener
+        _queue_listener = None
+        queue_handlers = [h for h in logger.handlers if isinstance(h, _RecordQueueHandler)]
+        other_handlers = [h for h in logger.handlers if not isinstance(h, _RecordQueueHandler)]
+        listener.stop()
+        logger.handlers = list(listener.handlers) + other_handlers
+        for handler in queue_handlers:
+            handler.close()
+
+
+def flush_log_queue():
+    """
+    Waits until all queued records have been written by the output handlers
+    """
+    with _queue_lock:
+        if _queue_listener is None:
+            return
+        # Stopping the listener processes everything queued before it
+        _queue_listener.stop()
+        _queue_listener.start()
+
+
+def _get_output_handlers() -> List[logging.Handler]:
+    with _queue_lock:
+        if _queue_listener is not None:
+            return list(_queue_listener.handlers)
+        return list(logger.handlers)
+
+
+def _set_output_handlers(handlers: List[logging.Handler]):
+    with _queue_lock:
+        if _queue_listener is not None:
+            _queue_listener.handlers = tuple(handlers)
+        else:
+            logger.handlers = handlers
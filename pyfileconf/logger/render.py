@@ -0,0 +1,88 @@
+"""
+Deferred rendering of configs and results in the log when running items.
+
+Messages are only built when a handler emits the record, so nothing is rendered
+when the logger level filters it out, and are abbreviated to the log_max_length option.
+"""
+import logging
+import reprlib
+from typing import Any, Callable, Optional
+
+from pyfileconf.logger.logger import logger
+
+
+class LazyStr:
+    """
+    Calls the render function with the args only when converted to a string
+    """
+
+    def __init__(self, render: Callable[..., str], *args):
+        self.render = render
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.render(*self.args)
+
+    def __reduce__(self):
+        # Render before sending to another process, as the args may not be picklable
+        if logger.isEnabledFor(logging.INFO):
+            return str, (str(self),)
+        return str, ('',)
+
+
+def run_description(kind: str, section_path_str: str, config_dict: dict) -> LazyStr:
+    """
+    Description of an item to be run, such as function stuff.a_function(a = 1), rendered when logged
+    """
+    return LazyStr(render_run_description, kind, section_path_str, config_dict)
+
+
+def log_result(result: Any) -> None:
+    from pyfileconf.opts import options
+    if options.log_results:
+        logger.info('Result:\n%s\n', LazyStr(render_result, result))
+
+
+def render_run_description(kind: str, section_path_str: str, config_dict: dict) -> str:
+    from pyfileconf.assignments.logic.write import _assignment_output_repr
+    from pyfileconf.opts import options
+
+    max_length = options.log_max_length
+    lines = []
+    for key, value in config_dict.items():
+        value_repr = _assignment_output_repr(value)
+        if max_length is not None and not isinstance(value_repr, str):
+            # Builtin values such as containers are rendered with limits like results
+            value_repr = _limited_repr(max_length).repr(value_repr)
+        lines.append(f'{key} = {_abbreviate(str(value_repr), max_length)}')
+    kwarg_str = '\n\t' + ',\n\t'.join(lines) + '\n'
+    return f'{kind} {section_path_str}({kwarg_str})'
+
+
+def render_result(result: Any) -> str:
+    from pyfileconf.opts import options
+
+    max_length = options.log_max_length
+    if max_length is None:
+        return str(result)
+    if isinstance(result, str):
+        return _abbreviate(result, max_length)
+
+    return _abbreviate(_limited_repr(max_length).repr(result), max_length)
+
+
+def _limited_repr(max_length: int) -> reprlib.Repr:
+    # Limits the items rendered from containers rather than rendering them all then abbreviating
+    limited_repr = reprlib.Repr()
+    limited_repr.maxstring = max_length
+    limited_repr.maxother = max_length
+    limited_repr.maxlong = max_length
+    return limited_repr
+
+
+def _abbreviate(value: str, max_length: Optional[int]) -> str:
+    if max_length is None or len(value) <= max_length:
+        return value
+    if max_length <= 3:
+        return value[:max_length]
+    return value[:max_length - 3] + '...'
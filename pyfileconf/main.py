@@ -2,6 +2,7 @@ import ast
 import itertools
 import sys
 import os
+import time
 import traceback
 from collections import defaultdict
 from functools import partial
@@ -30,6 +31,12 @@ from pyfileconf.logic.combine import \
 from pyfileconf.pipelines.models.collection import PipelineCollection
 from pyfileconf.pipelines.models.dictconfig import PipelineDictConfig
 from pyfileconf.plugin import manager as plugin_manager
+from pyfileconf.profile import LoadProfile, profiling, profile_phase, PHASE_PIPELINE_DICT, \
+    PHASE_SPECIFIC_CLASS_DICT, PHASE_FROM_DICT
+from pyfileconf.io.file.manifest import SCAFFOLD_MANIFEST_FILENAME
+from pyfileconf.reload import IncrementalReloader, PipelineManagerSnapshot
+from pyfileconf.scaffold import ConfigScaffolder
+from pyfileconf.watcher import FileWatcher
 from pyfileconf.views.object import ObjectView
 
 if TYPE_CHECKING:
@@ -76,6 +83,10 @@ class PipelineManager:
 
         self._registrars: Optional[Sequence[Registrar]] = None
         self._general_registrar: Optional[PipelineRegistrar] = None
+        self._load_snapshot: Optional[PipelineManagerSnapshot] = None
+        self._load_started_ns: Optional[int] = None
+        self._watcher: Optional[FileWatcher] = None
+        self.load_profile: Optional[LoadProfile] = None
 
         self._validate_options()
         context.active_managers[self.name] = self
@@ -95,12 +106,16 @@ class PipelineManager:
     def __dir__(self):
         exposed_methods = [
             'run',
+            'arun',
+            'run_stale',
             'run_product',
             'run_product_gen',
             'get',
             'update',
             'load',
             'reload',
+            'watch',
+            'stop_watching',
             'refresh',
             'reset',
         ]
@@ -122,7 +137,8 @@ class PipelineManager:
             exposed += register_attrs
         return exposed
 
-    def run(self, section_path_str_or_list: 'RunnerArgs') -> ResultOrResults:
+    def run(self, section_path_str_or_list: 'RunnerArgs', executor: str = 'serial',
+            workers: Optional[int] = None, only_stale: bool = False) -> ResultOrResults:
         """
         Use to run registered pipelines/functions/sections. Pass a single section path or a list
         of section paths. If a list is passed, the return value will also be a list, with each
@@ -139,9 +155,19 @@ class PipelineManager:
                     ['main.data', 'main.analysis.reg.1']
                 These sections/functions are based on the structure of your pipeline_dict
 
+            executor: 'serial' to run items one after another, 'thread' to run independent items
+                in a thread pool or 'process' to run them in a process pool. Items are configured before
+                running either way and results have the same structure and order. With a process pool,
+                the configured items and their results must be picklable
+            workers: number of threads or processes, defaults to the pool's default
+            only_stale: only run items which have not been run with only_stale before or for which
+                the source, config or config of any item they depend on has changed since then.
+                The last results are returned for the other items, see :meth:`run_stale`
+
         Returns: result or list of results
 
         """
+        self._reload_watched_changes()
         str_or_list_only: Union[str, List[str]] = self._convert_list_or_single_item_view_or_str_to_strs(
             section_path_str_or_list
         )
@@ -155,9 +181,64 @@ class PipelineManager:
 
         if options.log_stdout:
             with stdout_also_logged():
-                return self._run_depending_on_settings(str_or_list_only)
+                return self._run_depending_on_settings(
+                    str_or_list_only, executor=executor, workers=workers, only_stale=only_stale
+                )
         else:
-            return self._run_depending_on_settings(str_or_list_only)
+            return self._run_depending_on_settings(
+                str_or_list_only, executor=executor, workers=workers, only_stale=only_stale
+            )
+
+    async def arun(self, section_path_str_or_list: 'RunnerArgs', concurrency: Optional[int] = None,
+                   only_stale: bool = False) -> ResultOrResults:
+        """
+        Run registered pipelines/functions/sections in the running event loop. Results and
+        plugin hooks are the same as :meth:`run`.
+
+        All the items are configured first, then run concurrently. Coroutine functions and classes
+        with an async execute method are awaited in the event loop, other items are run in the
+        default thread executor of the loop. auto_pdb and force_continue are not applied.
+
+        :param section_path_str_or_list: . separated name of path of function or section, or list thereof.
+        :param concurrency: maximum number of items running at once, unlimited if not passed
+        :param only_stale: only run items which are not up to date, see :meth:`run_stale`
+        :return: result or list of results
+        """
+        self._reload_watched_changes()
+        str_or_list_only: Union[str, List[str]] = self._convert_list_or_single_item_view_or_str_to_strs(
+            section_path_str_or_list
+        )
+        additional_items = plugin_manager.plm.hook.pyfileconf_pre_run(
+            section_path_str_or_list=section_path_str_or_list, pm=self
+        )
+        # Will be converted into list always
+        str_or_list_only = combine_items_into_list_whether_they_are_lists_or_not_then_extract_from_list_if_only_one_item(
+            str_or_list_only, additional_items
+        )
+
+        if options.log_stdout:
+            with stdout_also_logged():
+                return await self.runner.arun(str_or_list_only, concurrency=concurrency, only_stale=only_stale)
+        else:
+            return await self.runner.arun(str_or_list_only, concurrency=concurrency, only_stale=only_stale)
+
+    def run_stale(self, section_path_str_or_list: 'RunnerArgs', executor: str = 'serial',
+                  workers: Optional[int] = None) -> ResultOrResults:
+        """
+        Run registered pipelines/functions/sections, only running the items which are stale and
+        returning the last results for the others. Results have the same structure as :meth:`run`.
+
+        An item is stale when it has not been run by run_stale before, or when the source of its
+        function or class, its config or the config of any item it depends on has changed since
+        its last run. Dependencies include items in its config and items got while running it.
+        Items whose config can not be pickled are always stale.
+
+        :param section_path_str_or_list: . separated name of path of function or section, or list thereof.
+        :param executor: 'serial', 'thread' or 'process', see :meth:`run`
+        :param workers: number of threads or processes, defaults to the pool's default
+        :return: result or list of results
+        """
+        return self.run(section_path_str_or_list, executor=executor, workers=workers, only_stale=True)
 
     def run_product(self, section_path_str_or_list: 'RunnerArgs', config_updates: Sequence[Dict[str, Any]],
                     collect_results: bool = True) -> 'IterativeResults':
@@ -196,23 +277,32 @@ class PipelineManager:
         return iterative_runner.run_gen()
 
 
-    def _run_depending_on_settings(self, section_path_str_or_list: Union[str, List[str]]) -> ResultOrResults:
+    def _run_depending_on_settings(self, section_path_str_or_list: Union[str, List[str]], executor: str = 'serial',
+                                   workers: Optional[int] = None, only_stale: bool = False) -> ResultOrResults:
         if self.auto_pdb:
-            return self._run_with_auto_pdb(section_path_str_or_list)
+            return self._run_with_auto_pdb(
+                section_path_str_or_list, executor=executor, workers=workers, only_stale=only_stale
+            )
 
         if self.force_continue:
-            return self._run_with_force_continue(section_path_str_or_list)
+            return self._run_with_force_continue(
+                section_path_str_or_list, executor=executor, workers=workers, only_stale=only_stale
+            )
 
-        return self.runner.run(section_path_str_or_list)
+        return self.runner.run(section_path_str_or_list, executor=executor, workers=workers, only_stale=only_stale)
 
-    def _run_with_auto_pdb(self, section_path_str_or_list: 'RunnerArgs'):
+    def _run_with_auto_pdb(self, section_path_str_or_list: 'RunnerArgs', executor: str = 'serial',
+                           workers: Optional[int] = None, only_stale: bool = False):
         pm_func = partial(pdb_post_mortem_or_passed_debug_fn, debug_fn=self.auto_pdb)
 
         result, successful = _try_except_run_func_except_user_interrupts(
             self.runner.run,
             except_func=pm_func,
             try_func_kwargs=dict(
-                section_path_str_or_list=section_path_str_or_list
+                section_path_str_or_list=section_path_str_or_list,
+                executor=executor,
+                workers=workers,
+                only_stale=only_stale,
             ),
         )
 
@@ -221,7 +311,13 @@ class PipelineManager:
         else:
             return None
 
-    def _run_with_force_continue(self, section_path_str_or_list: Union[str, List[str]]):
+    def _run_with_force_continue(self, section_path_str_or_list: Union[str, List[str]], executor: str = 'serial',
+                                 workers: Optional[int] = None, only_stale: bool = False):
+        if executor != 'serial':
+            return self._run_in_pool_with_force_continue(
+                section_path_str_or_list, executor=executor, workers=workers, only_stale=only_stale
+            )
+
         if not isinstance(section_path_str_or_list, list):
             section_path_str_or_list = [section_path_str_or_list]
             strip_list_at_end = True
@@ -236,7 +332,10 @@ class PipelineManager:
                 self.runner.run,
                 except_func=_return_with_traceback,
                 try_func_kwargs=dict(
-                    section_path_str_or_list=section_path_str
+                    section_path_str_or_list=section_path_str,
+                    executor=executor,
+                    workers=workers,
+                    only_stale=only_stale,
                 ),
                 print_traceback=False
             )
@@ -262,8 +361,53 @@ class PipelineManager:
         else:
             return results
 
+    def _run_in_pool_with_force_continue(self, section_path_str_or_list: Union[str, List[str]], executor: str,
+                                         workers: Optional[int] = None, only_stale: bool = False):
+        """
+        Runs all the items with one executor so that they still run in parallel, then drops the
+        results of the section paths which raised errors, the same as when running serially
+        """
+        result, successful = _try_except_run_func_except_user_interrupts(
+            self.runner.run,
+            except_func=_return_with_traceback,
+            try_func_kwargs=dict(
+                section_path_str_or_list=section_path_str_or_list,
+                executor=executor,
+                workers=workers,
+                only_stale=only_stale,
+                return_exceptions=True,
+            ),
+            print_traceback=False
+        )
+        if not successful:
+            exception, tb = result
+            re = RunnerException(exception, section_path_str=section_path_str_or_list, trace_back=tb)
+            logger.error(re)
+            report_runner_exceptions([re])
+            return []
+
+        exceptions: List[RunnerException] = []
+        if not isinstance(section_path_str_or_list, list):
+            exceptions = _get_runner_exceptions(result, section_path_str_or_list)
+            results = [] if exceptions else result
+        else:
+            results = []
+            for i, section_result in enumerate(result):
+                # Results after those of the section paths were added by plugins
+                section_path_str = section_path_str_or_list[i] if i < len(section_path_str_or_list) else None
+                section_exceptions = _get_runner_exceptions(section_result, section_path_str)
+                if section_exceptions:
+                    exceptions.extend(section_exceptions)
+                else:
+                    results.append(section_result)
+        for re in exceptions:
+            logger.error(re)
+        report_runner_exceptions(exceptions)
+        return results
+
     # TODO [#13]: multiple section path strs
     def get(self, section_path_str_or_view: 'StrOrView'):
+        self._reload_watched_changes()
         section_path_str = self._get_section_path_str_from_section_path_str_or_view(section_path_str_or_view)
         return self.runner.get(section_path_str)
 
@@ -281,7 +425,7 @@ class PipelineManager:
         self.runner.reset(section_path_str, allow_create=allow_create)
         logger.debug(f'Finished resetting config for {section_path_str_or_view}')
 
-    def reload(self) -> None:
+    def reload(self, incremental: bool = False) -> None:
         """
         Useful for getting file system changes without having to start a new Python session. Also resets
         any locally defined configuration.
@@ -289,23 +433,81 @@ class PipelineManager:
         Reloads functions from pipeline dict, scaffolds config files for any new functions,
         and updates configuration from files.
 
-        Returns: None
-
+        :param incremental: whether to reload only what was affected by files changed since the last load.
+            Only changed registrars and configs are reloaded and only the affected loaded objects are
+            dropped, so locally defined configuration is kept, and updates to changed configs are
+            applied again. Falls back to a full reload when any source module imported during loading
+            has changed.
+        :return: None
         """
         logger.info(f'Reloading {self.name}')
+        if incremental and IncrementalReloader(self).reload():
+            logger.debug(f'Finished incrementally reloading {self.name}')
+            return
+
         self._wipe_loaded_modules()
         self.load()
+        if incremental and self._load_snapshot is None:
+            # Files were not fingerprinted on load, so track them from now on
+            self._load_snapshot = self._snapshot_after_load()
         logger.debug(f'Finished reloading {self.name}')
 
-    def load(self) -> None:
+    def watch(self, interval: float = 0.5, debounce: float = 0.2, backend: str = 'auto') -> None:
+        """
+        Start watching this manager's pipeline dict, specific class dict and config files in
+        a background thread. Changed files are reloaded incrementally on the next get or run,
+        so it is not necessary to call .reload() after changing them. This includes files
+        changed between loading and starting to watch.
+
+        Changes to source modules are not watched, call .reload() after changing those.
+
+        :param interval: seconds between checks for changes
+        :param debounce: seconds without further changes before reloading, so that
+            many saves in quick succession cause only one reload
+        :param backend: 'poll', 'inotify' (requires inotify_simple on Linux) or 'auto'
+            to use inotify when available
+        :return: None
+        """
+        self.stop_watching()
+        if self._load_snapshot is None:
+            self._load_snapshot = self._snapshot_after_load()
+        self._watcher = FileWatcher(self, interval=interval, debounce=debounce, backend=backend)
+        self._watcher.start()
+        # Files which may have been changed between loading and watching are reloaded on the next get or run
+        self._watcher._add_changes(self._load_snapshot.unknown_filepaths)
+
+    def stop_watching(self) -> None:
+        """
+        Stop watching files for changes, after which .reload() must be used to get changes
+        """
+        if self._watcher is None:
+            return
+        self._watcher.stop()
+        self._watcher = None
+
+    def load(self, profile: Optional[bool] = None) -> None:
         """
         Wrapper to track imported modules so that can reimport them upon reloading
+
+        :param profile: whether to record how long each phase of loading takes,
+            defaults to the profile_load option. The report is available as .load_profile.
+            Config sections are listed lazily when first accessed, so time spent on them
+            after load is not included
         """
         logger.debug(f'Running load for {self.name}')
+        self._load_started_ns = time.time_ns()
         self._import_tracker = ImportTracker()
+        if profile is None:
+            profile = options.profile_load
 
         try:
-            self._load_pipeline_config_and_runner()
+            if profile:
+                with profiling(LoadProfile(self.name)) as load_profile:
+                    self._load_pipeline_config_and_runner()
+                self.load_profile = load_profile
+                logger.info(load_profile.report())
+            else:
+                self._load_pipeline_config_and_runner()
         except Exception as e:
             # Reset loaded modules from import, completely canceling load so it can be tried again
             self._loaded_modules = self._import_tracker.imported_modules
@@ -314,6 +516,11 @@ class PipelineManager:
             raise e
 
         self._loaded_modules = self._import_tracker.imported_modules
+        # Fingerprinting lists the whole defaults folder, so is only done when changes will be reloaded
+        if options.incremental_reload or self._watcher is not None:
+            self._load_snapshot = PipelineManagerSnapshot.from_manager(self)
+        else:
+            self._load_snapshot = None
         logger.debug(f'Finished running load for {self.name}')
 
     def update(self, d_: dict=None, section_path_str: str=None, pyfileconf_persist: bool = True, **kwargs):
@@ -567,6 +774,29 @@ class PipelineManager:
             name=self.name,
         )
 
+    def _snapshot_after_load(self) -> PipelineManagerSnapshot:
+        """
+        Fingerprint the files when they were not fingerprinted on load. Files modified since
+        loading started may have changed after they were read, so are treated as changed.
+        """
+        snapshot = PipelineManagerSnapshot.from_manager(self)
+        if self._load_started_ns is None:
+            return snapshot
+        return snapshot.forget_changes_since(self._load_started_ns)
+
+    def _reload_watched_changes(self):
+        if self._watcher is None:
+            return
+        has_changes, changed_filepaths = self._watcher.pop_changes()
+        if not has_changes or self._load_snapshot is None:
+            return
+
+        logger.info(f'Reloading {self.name} for changed files')
+        if not IncrementalReloader(self).reload(changed_filepaths):
+            self._wipe_loaded_modules()
+            self.load()
+        logger.debug(f'Finished reloading {self.name} for changed files')
+
     def _wipe_loaded_modules(self):
         [sys.modules.pop(module) for module in self._loaded_modules]
 
@@ -613,6 +843,10 @@ class PipelineManager:
         ])
 
     def __del__(self):
+        watcher = getattr(self, '_watcher', None)
+        if watcher is not None:
+            watcher.stop(wait=False)
+
         try:
             current_manager_under_this_key = context.active_managers[self.name]
         except KeyError:
@@ -675,6 +909,18 @@ def _try_except_run_func_except_user_interrupts(try_func: Callable, except_func:
 def _return_with_traceback(any: Any) -> Tuple[Any, str]:
     return any, traceback.format_exc()
 
+
+def _get_runner_exceptions(result: Any, section_path_str: Optional[str]) -> List['RunnerException']:
+    """
+    Gets the errors returned in place of results when running with return_exceptions
+    """
+    if isinstance(result, list):
+        return [re for sub_result in result for re in _get_runner_exceptions(sub_result, section_path_str)]
+    if not isinstance(result, Exception):
+        return []
+    tb = ''.join(traceback.format_exception(type(result), result, result.__traceback__))
+    return [RunnerException(result, section_path_str=section_path_str, trace_back=tb)]
+
 class RunnerException(Exception):
 
     def __init__(self, *args, section_path_str: 'StrOrView' = None, trace_back: str = None):
@@ -759,9 +1005,11 @@ def create_registrars(specific_class_config_dicts: List[SpecificClassConfigDict]
     registrars = cast(List[SpecificRegistrar], registrars)
     general_registrar = cast(PipelineRegistrar, general_registrar)
     _validate_registrars(registrars, general_registrar)
-    for registrar in registrars:
-        registrar.scaffold_config()
-    general_registrar.scaffold_config()
+    scaffolder = ConfigScaffolder(
+        [*registrars, general_registrar],
+        manifest_path=os.path.join(basepath, SCAFFOLD_MANIFEST_FILENAME)
+    )
+    scaffolder.scaffold()
 
     return registrars, general_registrar
 
@@ -791,54 +1039,79 @@ def _create_registrars_or_collections_from_dict(
         Union[List[SpecificRegistrar], List[SpecificClassCollection]],
         Union[PipelineRegistrar, PipelineCollection]
     ]:
+    # Load dynamically instead of passing dict to ensure modules are loaded into sys now
+    general_obj = _create_general_registrar_or_collection(
+        basepath, pipeline_dict_path, registrar=registrar, manager_name=manager_name
+    )
+
+    objs: Union[List[SpecificRegistrar], List[SpecificClassCollection]] = []
+    for specific_class_config_dict in specific_class_config_dicts:
+        obj = _create_specific_class_registrar_or_collection(
+            specific_class_config_dict, basepath, pipeline_folder, registrar=registrar
+        )
+        objs.append(obj)  # type: ignore
+
+    return objs, general_obj
+
+
+def _create_general_registrar_or_collection(
+    basepath: str, pipeline_dict_path: str, registrar: bool = True, manager_name: Optional[str] = None
+) -> Union[PipelineRegistrar, PipelineCollection]:
     pipeline_class: Union[Type[PipelineRegistrar], Type[PipelineCollection]]
-    specific_class_class: Union[Type[SpecificRegistrar], Type[SpecificClassCollection]]
     if registrar:
         pipeline_class = PipelineRegistrar
-        specific_class_class = SpecificRegistrar
     else:
         pipeline_class = PipelineCollection
-        specific_class_class = SpecificClassCollection
 
-    # Load dynamically instead of passing dict to ensure modules are loaded into sys now
     pipeline_dict_file = PipelineDictFile(pipeline_dict_path, name='pipeline_dict')
-    pipeline_dict = pipeline_dict_file.load()
-
-    objs: Union[List[SpecificRegistrar], List[SpecificClassCollection]] = []
-    for specific_class_config_dict in specific_class_config_dicts:
+    with profile_phase(PHASE_PIPELINE_DICT, pipeline_dict_path):
+        pipeline_dict = pipeline_dict_file.load()
 
-        # Set defaults then update with actual config
-        config_dict: Dict[str, Optional[Union[str, Type, List[str]]]] = dict(
-            always_assign_strs=None,
-            always_import_strs=None,
+    with profile_phase(PHASE_FROM_DICT, manager_name or 'pipeline_dict'):
+        return pipeline_class.from_dict(
+            pipeline_dict,
+            basepath=basepath,
+            name=manager_name,
+            imports=pipeline_dict_file.interface.imports
         )
-        config_dict.update(specific_class_config_dict)  # type: ignore
 
-        for key in ('name', 'class'):
-            if key not in config_dict or config_dict[key] is None:
-                raise ValueError(f'{key} is required in {config_dict}')
 
-        # Kwargs require 'klass' while config dict is 'class'
-        kwargs_dict = deepcopy(config_dict)
-        kwargs_dict['klass'] = config_dict['class']
-        kwargs_dict.pop('class')
+def _create_specific_class_registrar_or_collection(
+    specific_class_config_dict: SpecificClassConfigDict, basepath: str, pipeline_folder: str,
+    registrar: bool = True
+) -> Union[SpecificRegistrar, SpecificClassCollection]:
+    specific_class_class: Union[Type[SpecificRegistrar], Type[SpecificClassCollection]]
+    if registrar:
+        specific_class_class = SpecificRegistrar
+    else:
+        specific_class_class = SpecificClassCollection
+
+    # Set defaults then update with actual config
+    config_dict: Dict[str, Optional[Union[str, Type, List[str]]]] = dict(
+        always_assign_strs=None,
+        always_import_strs=None,
+    )
+    config_dict.update(specific_class_config_dict)  # type: ignore
 
-        name = cast(str, config_dict['name'])
-        file_path = os.path.join(pipeline_folder, f'{name}_dict.py')
-        specific_class_dict_file = SpecificClassDictFile(file_path, name=name + '_dict')
+    for key in ('name', 'class'):
+        if key not in config_dict or config_dict[key] is None:
+            raise ValueError(f'{key} is required in {config_dict}')
+
+    # Kwargs require 'klass' while config dict is 'class'
+    kwargs_dict = deepcopy(config_dict)
+    kwargs_dict['klass'] = config_dict['class']
+    kwargs_dict.pop('class')
+
+    name = cast(str, config_dict['name'])
+    file_path = os.path.join(pipeline_folder, f'{name}_dict.py')
+    specific_class_dict_file = SpecificClassDictFile(file_path, name=name + '_dict')
+    with profile_phase(PHASE_SPECIFIC_CLASS_DICT, file_path):
         specific_dict = specific_class_dict_file.load()
-        obj = specific_class_class.from_dict(
+
+    with profile_phase(PHASE_FROM_DICT, name):
+        return specific_class_class.from_dict(
             specific_dict,
             basepath=os.path.join(basepath, name),
             imports=specific_class_dict_file.interface.imports,
             **kwargs_dict  # type: ignore
         )
-        objs.append(obj)
-
-    general_obj = pipeline_class.from_dict(
-        pipeline_dict,
-        basepath=basepath,
-        name=manager_name,
-        imports=pipeline_dict_file.interface.imports
-    )
-    return objs, general_obj
@@ -16,6 +16,7 @@ from typing import Any, Tuple, Dict, Type, Iterable, List, Optional, Callable
 
 from pyfileconf.logger.logger import logger
 from pyfileconf.opts.filelog import add_file_handler_if_log_folder_exists_else_remove_handler
+from pyfileconf.opts.queuelog import start_log_queue_if_enabled_else_stop
 
 
 class PyfileconfOptions:
@@ -23,24 +24,67 @@ class PyfileconfOptions:
     log_folder: Optional[str]
     log_file_rollover_freq: str
     log_file_num_keep: int
+    cache_folder: Optional[str]
+    scaffold_workers: int
+    profile_load: bool
+    cache_results: bool
+    result_cache_max_bytes: Optional[int]
+    loaded_objects_policy: str
+    loaded_objects_max_count: Optional[int]
+    loaded_objects_max_bytes: Optional[int]
+    log_results: bool
+    log_max_length: Optional[int]
+    log_queue: bool
+    incremental_reload: bool
 
     option_attrs: Tuple[str, ...] = (
         'log_stdout',
         'log_folder',
         'log_file_rollover_freq',
         'log_file_num_keep',
+        'cache_folder',
+        'scaffold_workers',
+        'profile_load',
+        'cache_results',
+        'result_cache_max_bytes',
+        'loaded_objects_policy',
+        'loaded_objects_max_count',
+        'loaded_objects_max_bytes',
+        'log_results',
+        'log_max_length',
+        'log_queue',
+        'incremental_reload',
     )
 
     option_callbacks: Dict[str, Callable[[str, Any], None]] = {
-        'log_folder': add_file_handler_if_log_folder_exists_else_remove_handler
+        'log_folder': add_file_handler_if_log_folder_exists_else_remove_handler,
+        'log_queue': start_log_queue_if_enabled_else_stop,
     }
 
     def __init__(self, log_stdout: bool = False, log_folder: Optional[str] = None,
-                 log_file_rollover_freq: str = 'D', log_file_num_keep: int = 0):
+                 log_file_rollover_freq: str = 'D', log_file_num_keep: int = 0,
+                 cache_folder: Optional[str] = None, scaffold_workers: int = 1,
+                 profile_load: bool = False, cache_results: bool = False,
+                 result_cache_max_bytes: Optional[int] = None, loaded_objects_policy: str = 'unbounded',
+                 loaded_objects_max_count: Optional[int] = None, loaded_objects_max_bytes: Optional[int] = None,
+                 log_results: bool = True, log_max_length: Optional[int] = None, log_queue: bool = False,
+                 incremental_reload: bool = False):
         self.log_stdout = log_stdout
         self.log_folder = log_folder
         self.log_file_rollover_freq = log_file_rollover_freq
         self.log_file_num_keep = log_file_num_keep
+        self.cache_folder = cache_folder
+        self.scaffold_workers = scaffold_workers
+        self.profile_load = profile_load
+        self.cache_results = cache_results
+        self.result_cache_max_bytes = result_cache_max_bytes
+        self.loaded_objects_policy = loaded_objects_policy
+        self.loaded_objects_max_count = loaded_objects_max_count
+        self.loaded_objects_max_bytes = loaded_objects_max_bytes
+        self.log_results = log_results
+        self.log_max_length = log_max_length
+        self.log_queue = log_queue
+        self.incremental_reload = incremental_reload
 
     def update(self, opts: 'PyfileconfOptions'):
         for attr in self.option_attrs:
@@ -146,6 +190,50 @@ class PyfileconfOptionsManager:
         when option
     :param log_file_num_keep: Number of log files to keep, see
         :py:class:`logging.handlers.TimedRotatingFileHandler` backupCount option
+    :param cache_folder: The folder in which pyfileconf should persist its caches,
+        such as parsed and compiled config files. Caching to disk is disabled when not set
+    :type cache_folder: Optional[str]
+    :param scaffold_workers: Number of processes to use when creating config files
+        for registered items on load, which requires that the items can be pickled.
+        1 creates them serially in the calling process
+    :type scaffold_workers: int
+    :param profile_load: Whether to record how long each phase of loading a
+        PipelineManager takes, available as PipelineManager.load_profile. Config
+        sections listed lazily after load are not included
+    :type profile_load: bool
+    :param cache_results: Whether to store the results of running items in the cache_folder
+        and reuse them while the config and source of the item and the items it depends on
+        are unchanged. Items can opt in or out individually by setting _pyfileconf_cache_result_
+        on the class or function or in the config
+    :type cache_results: bool
+    :param result_cache_max_bytes: Total size of stored results after which the least
+        recently used results are removed. Unlimited when not set
+    :type result_cache_max_bytes: Optional[int]
+    :param loaded_objects_policy: How the configured functions and objects kept by each
+        PipelineManager are evicted. 'unbounded' keeps them all, 'lru' keeps the most recently
+        used loaded_objects_max_count, 'memory' keeps the most recently used up to an approximate
+        total of loaded_objects_max_bytes, and 'weak' keeps them only while they are referenced
+        elsewhere. Evicted objects are created and configured again when next used
+    :type loaded_objects_policy: str
+    :param loaded_objects_max_count: Number of loaded objects to keep with the 'lru' policy
+    :type loaded_objects_max_count: Optional[int]
+    :param loaded_objects_max_bytes: Approximate total size of loaded objects to keep with
+        the 'memory' policy
+    :type loaded_objects_max_bytes: Optional[int]
+    :param log_results: Whether to log the result of each item which is run
+    :type log_results: bool
+    :param log_max_length: Maximum length of each config value and of results in the
+        log when running items, longer ones are abbreviated. Unlimited when not set
+    :type log_max_length: Optional[int]
+    :param log_queue: Whether to write logs from a background thread, so that logging
+        and captured stdout only put records on a queue in the running thread. Queued
+        logs are written out when this is turned off, on reset and on exit
+    :type log_queue: bool
+    :param incremental_reload: Whether to fingerprint the dict, config and source files when
+        loading, so that reload(incremental=True) only reloads what changed since the load.
+        Otherwise files are only fingerprinted once watching or after the first incremental
+        reload, which is then a full reload
+    :type incremental_reload: bool
 
     """
     def __init__(self):
@@ -0,0 +1,8 @@
+from pyfileconf.logger.logger import start_log_queue, stop_log_queue
+
+
+def start_log_queue_if_enabled_else_stop(attr_name: str, log_queue: bool):
+    if log_queue:
+        start_log_queue()
+    else:
+        stop_log_queue()
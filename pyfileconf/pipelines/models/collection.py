@@ -1,5 +1,6 @@
 import os
 
+from pyfileconf.io.file.fingerprint import written_files
 from pyfileconf.pipelines.models.config import FunctionConfig
 from pyfileconf.logic.get import _get_public_name_or_special_name
 from pyfileconf.pipelines.models.interfaces import ObjectViewOrCollection
@@ -9,12 +10,8 @@ from pyfileconf.basemodels.collection import Collection
 
 class PipelineCollection(Collection):
 
-    def _set_name_map(self):
-        pipeline_map = {}
-        for pipeline_or_collection in self:
-            pipeline_name = _get_public_name_or_special_name(pipeline_or_collection)
-            pipeline_map[pipeline_name] = pipeline_or_collection
-        self.name_dict = pipeline_map
+    def _name_for_item(self, item) -> str:
+        return _get_public_name_or_special_name(item)
 
     def _transform_item(self, item):
         """
@@ -32,13 +29,17 @@ class PipelineCollection(Collection):
         # If item, convert to object view
         return ObjectView.from_ast_and_imports(item, self.imports)
 
-    def _output_config_files(self):
-
+    def _prepare_config_output(self):
         if not os.path.exists(self.basepath):
-            os.makedirs(self.basepath)
+            os.makedirs(self.basepath, exist_ok=True)
 
         self._output_section_config_file()
-        [self._output_config_file(item) for item in self]
+
+    def _config_filepath_for(self, item: ObjectView) -> str:
+        return os.path.join(self.basepath, item.output_name + '.py')
+
+    def _config_source_for(self, item: ObjectView):
+        return item.item
 
     def _output_config_file(self, item: ObjectViewOrCollection):
         if isinstance(item, PipelineCollection):
@@ -50,7 +51,7 @@ class PipelineCollection(Collection):
                              f'type {type(item)}')
 
         # Dealing with ObjectView
-        item_filepath = os.path.join(self.basepath, item.output_name + '.py')
+        item_filepath = self._config_filepath_for(item)
 
         if os.path.exists(item_filepath):
             # if config file already exists, load confguration from file, use to update function defaults
@@ -74,6 +75,7 @@ class PipelineCollection(Collection):
 
         with open(outpath, 'w') as f:
             f.write('\n')
+        written_files.record(outpath)
 
 
 
@@ -1,3 +1,10 @@
 from pyfileconf.plugin.manager_utils import get_plugin_manager
 
-plm = get_plugin_manager()
\ No newline at end of file
+
+def __getattr__(name: str):
+    # Discovering installed plugins is slow, so only create the plugin manager once it is used
+    if name == 'plm':
+        global plm
+        plm = get_plugin_manager()
+        return plm
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from contextvars import ContextVar
 from typing import Dict, Set, Optional, Union, TYPE_CHECKING
 
 from pyfileconf.interfaces import SectionPathLike
@@ -9,12 +10,15 @@ if TYPE_CHECKING:
     from pyfileconf.sectionpath.sectionpath import SectionPath
     from pyfileconf.selector.models.itemview import ItemView
 
+# Stack is stored per thread/async task, so that items being loaded or run
+# concurrently each track only their own frames
+_stack_var: ContextVar[PyfileconfStack] = ContextVar('pyfileconf_stack')
+
 
 class PyFileConfContext:
     config_dependencies: Dict[str, Set['SectionPath']]
     active_managers: Dict[str, 'PipelineManager']
     force_update_dependencies: Dict[str, Set['SectionPath']]
-    stack: PyfileconfStack
 
     def __init__(self, config_dependencies: Optional[Dict[str, Set['SectionPath']]] = None,
                  active_managers: Optional[Dict[str, 'PipelineManager']] = None,
@@ -41,6 +45,20 @@ class PyFileConfContext:
         self.force_update_dependencies = defaultdict(lambda: set())
         self.stack = PyfileconfStack([])
 
+    @property
+    def stack(self) -> PyfileconfStack:
+        try:
+            return _stack_var.get()
+        except LookupError:
+            # First access in this thread, start an empty stack
+            stack = PyfileconfStack([])
+            _stack_var.set(stack)
+            return stack
+
+    @stack.setter
+    def stack(self, stack: PyfileconfStack):
+        _stack_var.set(stack)
+
     @property
     def currently_running_section_path_str(self) -> Optional[str]:
         return self.stack.currently_running_section_path_str
@@ -0,0 +1,190 @@
+"""
+Profiling of PipelineManager.load, to show which phases, files and items the time is spent on.
+
+Code paths are wrapped in profile_phase, which does nothing unless a profile is active, so
+the instrumentation has close to no overhead when profiling is disabled. The active profile
+is tracked per thread and asyncio task, so concurrent loads record into their own profiles.
+
+Config sections are listed lazily when their items are first accessed, which is usually after
+load, so the time spent in the config_section phase then is not included in the load profile.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, List, Iterator, Any
+
+PHASE_PIPELINE_DICT = 'pipeline_dict'
+PHASE_SPECIFIC_CLASS_DICT = 'specific_class_dict'
+PHASE_FROM_DICT = 'from_dict'
+PHASE_SCAFFOLD = 'scaffold'
+PHASE_SCAFFOLD_COLLECTION = 'scaffold_collection'
+PHASE_SCAFFOLD_ITEM = 'scaffold_item'
+PHASE_ARGUMENT_EXTRACTION = 'argument_extraction'
+PHASE_CONFIG_SECTION = 'config_section'
+PHASE_MODULE_IMPORT = 'module_import'
+
+
+class PhaseStats:
+    """
+    Total wall time and number of times a phase was entered
+    """
+
+    def __init__(self, seconds: float = 0.0, count: int = 0):
+        self.seconds = seconds
+        self.count = count
+
+    def __repr__(self):
+        return f'<PhaseStats(seconds={self.seconds:.4f}, count={self.count})>'
+
+
+class ProfileEntry:
+    """
+    Wall time of one named file or item within a phase
+    """
+
+    def __init__(self, phase: str, name: str, seconds: float):
+        self.phase = phase
+        self.name = name
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f'<ProfileEntry(phase={self.phase}, name={self.name}, seconds={self.seconds:.4f})>'
+
+
+class LoadProfile:
+    """
+    Per-phase wall times and counts, as well as the times of individual files and
+    items, recorded while loading a PipelineManager.
+
+    Phases may be nested, e.g. argument extraction and module imports happen while scaffolding,
+    so phase times overlap and do not add up to the total.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name
+        self.phases: Dict[str, PhaseStats] = {}
+        self.entries: List[ProfileEntry] = []
+        self.total_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float, name: Optional[str] = None) -> None:
+        with self._lock:
+            stats = self.phases.setdefault(phase, PhaseStats())
+            stats.seconds += seconds
+            stats.count += 1
+            if name is not None:
+                self.entries.append(ProfileEntry(phase, name, seconds))
+
+    def slowest(self, n: int = 10, phase: Optional[str] = None) -> List[ProfileEntry]:
+        """
+        :param n: number of entries to return
+        :param phase: only include entries of this phase, defaults to all phases
+        :return: the slowest files and items, slowest first
+        """
+        entries = [entry for entry in self.entries if phase is None or entry.phase == phase]
+        return sorted(entries, key=lambda entry: entry.seconds, reverse=True)[:n]
+
+    def to_dict(self, n: int = 10) -> Dict[str, Any]:
+        return dict(
+            name=self.name,
+            total_seconds=self.total_seconds,
+            phases={
+                phase: dict(seconds=stats.seconds, count=stats.count) for phase, stats in self.phases.items()
+            },
+            slowest=[
+                dict(phase=entry.phase, name=entry.name, seconds=entry.seconds) for entry in self.slowest(n)
+            ],
+        )
+
+    def report(self, n: int = 10) -> str:
+        lines = [f'Load profile for {self.name}: {self.total_seconds:.3f}s total']
+        for phase, stats in self.phases.items():
+            lines.append(f'  {phase}: {stats.seconds:.3f}s over {stats.count} calls')
+        slowest = self.slowest(n)
+        if slowest:
+            lines.append(f'  Slowest {len(slowest)}:')
+            for entry in slowest:
+                lines.append(f'    {entry.seconds:.3f}s {entry.phase} {entry.name}')
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def __repr__(self) -> str:
+        return f'<LoadProfile(name={self.name}, total_seconds={self.total_seconds:.4f}, ' \
+               f'phases={list(self.phases)})>'
+
+
+_active_profile: ContextVar[Optional[LoadProfile]] = ContextVar('pyfileconf_active_profile', default=None)
+
+
+class _PhaseTimer:
+
+    def __init__(self, profile: LoadProfile, phase: str, name: Optional[str] = None):
+        self.profile = profile
+        self.phase = phase
+        self.name = name
+        self.seconds = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.seconds = time.perf_counter() - self._start
+        self.profile.record(self.phase, self.seconds, self.name)
+
+
+class _NullTimer:
+    seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+def profile_phase(phase: str, name: Optional[str] = None):
+    """
+    Context manager to time a phase in the active profile, does nothing when not profiling
+
+    :param phase: phase being timed
+    :param name: file or item being processed, to be included in the slowest entries
+    :return: timer with the seconds taken after exiting
+    """
+    profile = _active_profile.get()
+    if profile is None:
+        return _null_timer
+    return _PhaseTimer(profile, phase, name)
+
+
+def record_phase(phase: str, seconds: float, name: Optional[str] = None) -> None:
+    """
+    Record an already measured time in the active profile, does nothing when not profiling
+    """
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.record(phase, seconds, name)
+
+
+def is_profiling() -> bool:
+    return _active_profile.get() is not None
+
+
+@contextmanager
+def profiling(profile: LoadProfile) -> Iterator[LoadProfile]:
+    """
+    Make profile the active profile while in the context, recording its total time
+    """
+    token = _active_profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_seconds = time.perf_counter() - start
+        _active_profile.reset(token)
@@ -0,0 +1,359 @@
+"""
+Incremental reloading of a PipelineManager, which reloads only the parts
+affected by files changed since the last load
+"""
+import ast
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Set, Iterable, List, Optional, Tuple
+
+from pyfileconf.basemodels.collection import Collection
+from pyfileconf.basemodels.registrar import Registrar
+from pyfileconf.imports.models.tracker import ImportTracker
+from pyfileconf.io.file.fingerprint import FileSnapshot, FileSnapshotDiff
+from pyfileconf.io.file.manifest import SCAFFOLD_MANIFEST_FILENAME
+from pyfileconf.logger.logger import logger
+from pyfileconf.scaffold import ConfigScaffolder
+from pyfileconf.sectionpath.sectionpath import SectionPath, _is_in_any_section_path
+from pyfileconf.views.object import ObjectView
+
+if TYPE_CHECKING:
+    from pyfileconf.main import PipelineManager
+
+
+class PipelineManagerSnapshot:
+    """
+    Fingerprints of the files used to load a PipelineManager
+
+    :param dict_files: pipeline dict and specific class dict files
+    :param config_files: config files in the defaults folder
+    :param module_files: source files of modules imported while loading
+    """
+
+    def __init__(self, dict_files: FileSnapshot, config_files: FileSnapshot, module_files: FileSnapshot):
+        self.dict_files = dict_files
+        self.config_files = config_files
+        self.module_files = module_files
+
+    @classmethod
+    def from_manager(cls, manager: 'PipelineManager') -> 'PipelineManagerSnapshot':
+        return cls(
+            _dict_file_snapshot(manager),
+            FileSnapshot.from_folder(manager.default_config_path),
+            _module_file_snapshot(manager._loaded_modules),
+        )
+
+    def forget_changes_since(self, time_ns: int) -> 'PipelineManagerSnapshot':
+        """
+        Create a new snapshot where files modified since the time have an unknown fingerprint,
+        see :meth:`FileSnapshot.forget_changes_since`
+        """
+        return PipelineManagerSnapshot(
+            self.dict_files.forget_changes_since(time_ns),
+            self.config_files.forget_changes_since(time_ns),
+            self.module_files.forget_changes_since(time_ns),
+        )
+
+    @property
+    def unknown_filepaths(self) -> Set[str]:
+        """
+        Dict and config files which may have changed since the snapshot
+        """
+        return self.dict_files.unknown_filepaths | self.config_files.unknown_filepaths
+
+    def __repr__(self) -> str:
+        return f'<PipelineManagerSnapshot(dict_files={self.dict_files}, config_files={self.config_files}, ' \
+               f'module_files={self.module_files})>'
+
+
+class IncrementalReloader:
+    """
+    Reloads only what changed since a PipelineManager was last loaded:
+
+    - Registrars are rebuilt only when their dict file changed, and loaded objects
+      are dropped only for items which were added, removed or changed in the dict
+    - Configs are replaced only for changed config files. Changes to section configs
+      or to the files in a section replace the whole section
+    - Loaded objects and dependency edges are dropped only for changed items and any
+      items which depend on them, which also have their configs refreshed
+
+    A change to any source module imported while loading cannot be applied
+    incrementally, and so requires a full reload.
+    """
+
+    def __init__(self, manager: 'PipelineManager'):
+        self.manager = manager
+
+    def reload(self, changed_filepaths: Optional[Iterable[str]] = None) -> bool:
+        """
+        Reload changed files
+
+        :param changed_filepaths: config and dict files which are already known to have changed,
+            such as from a watcher. When passed, the defaults folder does not need to be listed
+            unless a dict file changed. By default, all files are checked
+        :return: whether the reload was successful. If False, nothing was
+            changed and a full reload is needed
+        """
+        manager = self.manager
+        prior = manager._load_snapshot
+        if prior is None:
+            return False
+
+        module_files = FileSnapshot.from_files(prior.module_files.fingerprints)
+        changed_modules = prior.module_files.diff(module_files)
+        if changed_modules:
+            logger.debug(f'Source modules changed, cannot reload {manager.name} incrementally: {changed_modules}')
+            return False
+
+        invalidated: Set[str] = set()
+        dict_files = _dict_file_snapshot(manager)
+        dict_diff = prior.dict_files.diff(dict_files)
+        if dict_diff:
+            import_tracker = ImportTracker()
+            invalidated.update(self._reload_registrars(dict_diff.changed))
+            manager._loaded_modules.extend(import_tracker.imported_modules)
+
+        # Take config snapshot after any scaffolding so that new config files are picked up
+        if changed_filepaths is None or dict_diff:
+            config_files = FileSnapshot.from_folder(manager.default_config_path)
+        else:
+            config_files = prior.config_files.updated(
+                filepath for filepath in changed_filepaths if filepath not in dict_files.fingerprints
+            )
+        config_diff = prior.config_files.diff(config_files)
+        if config_diff:
+            config_section_path_strs = _remove_nested_section_paths(
+                _section_path_strs_for_config_changes(config_diff, prior.config_files, config_files,
+                                                      manager.default_config_path)
+            )
+            manager.config.reload_from_files(config_section_path_strs)
+            invalidated.update(config_section_path_strs)
+
+        logger.debug(f'Incrementally reloading {manager.name} for changes in {sorted(invalidated)}')
+        _drop_loaded_objects_and_dependents(manager, invalidated)
+        manager._load_snapshot = PipelineManagerSnapshot(
+            dict_files, config_files, _module_file_snapshot(manager._loaded_modules)
+        )
+        return True
+
+    def _reload_registrars(self, changed_filepaths: Set[str]) -> Set[str]:
+        """
+        Rebuild and scaffold the registrars with changed dict files
+
+        :return: section paths of items which changed
+        """
+        from pyfileconf.main import _create_general_registrar_or_collection, \
+            _create_specific_class_registrar_or_collection, _validate_registrars
+
+        manager = self.manager
+        assert manager._registrars is not None and manager._general_registrar is not None
+        config_dicts = {config_dict['name']: config_dict for config_dict in manager.specific_class_config_dicts}
+
+        old_registrars: List[Registrar] = []
+        new_registrars: List[Registrar] = []
+        registrars = []
+        for registrar in manager._registrars:
+            if _specific_class_dict_path(manager, registrar.name) in changed_filepaths:
+                new_registrar = _create_specific_class_registrar_or_collection(
+                    config_dicts[registrar.name], manager.default_config_path, manager.folder
+                )
+                old_registrars.append(registrar)
+                new_registrars.append(new_registrar)  # type: ignore
+                registrar = new_registrar
+            registrars.append(registrar)
+
+        general_registrar = manager._general_registrar
+        if manager.pipeline_dict_path in changed_filepaths:
+            general_registrar = _create_general_registrar_or_collection(
+                manager.default_config_path, manager.pipeline_dict_path, manager_name=manager.name
+            )  # type: ignore
+            old_registrars.append(manager._general_registrar)
+            new_registrars.append(general_registrar)
+
+        _validate_registrars(registrars, general_registrar)  # type: ignore
+        ConfigScaffolder(
+            new_registrars,
+            manifest_path=os.path.join(manager.default_config_path, SCAFFOLD_MANIFEST_FILENAME)
+        ).scaffold()
+
+        changed_section_path_strs: Set[str] = set()
+        for old_registrar, new_registrar in zip(old_registrars, new_registrars):
+            old_signatures = _item_signatures(old_registrar)
+            new_signatures = _item_signatures(new_registrar)
+            for section_path_str in old_signatures.keys() | new_signatures.keys():
+                if old_signatures.get(section_path_str) != new_signatures.get(section_path_str):
+                    changed_section_path_strs.add(section_path_str)
+
+        manager._registrars = registrars
+        manager._general_registrar = general_registrar  # type: ignore
+        manager.runner.set_registrars(registrars, general_registrar)  # type: ignore
+        return changed_section_path_strs
+
+
+def _drop_loaded_objects_and_dependents(manager: 'PipelineManager', section_path_strs: Set[str]) -> None:
+    """
+    Drop loaded objects in the sections, as well as dependency edges where the
+    dependent is in the sections. Then do the same for every item which depended on
+    any item in the sections, also refreshing the dependent configs.
+    """
+    from pyfileconf import context
+
+    to_drop: List[Tuple['PipelineManager', Set[str]]] = [(manager, section_path_strs)]
+    dropped_full_section_path_strs: Set[str] = set()
+    while to_drop:
+        current_manager, current_section_path_strs = to_drop.pop()
+        if not current_section_path_strs:
+            continue
+        current_manager.runner.drop_loaded_objects(current_section_path_strs)
+        full_section_path_strs = {
+            SectionPath.join(current_manager.name, section_path_str).path_str if section_path_str
+            else current_manager.name
+            for section_path_str in current_section_path_strs
+        }
+        dropped_full_section_path_strs.update(full_section_path_strs)
+
+        dependents: Set[SectionPath] = set()
+        for depends_on, depends_on_dependents in context.config_dependencies.items():
+            if _is_in_any_section_path(depends_on, full_section_path_strs):
+                dependents.update(depends_on_dependents)
+
+        # Dependencies of dropped items will be tracked again when they are loaded again
+        for dependencies in (context.config_dependencies, context.force_update_dependencies):
+            for depends_on_dependents in dependencies.values():
+                for dependent in list(depends_on_dependents):
+                    if _is_in_any_section_path(dependent.path_str, full_section_path_strs):
+                        depends_on_dependents.discard(dependent)
+
+        dependents_by_manager: Dict[str, Set[str]] = {}
+        for dependent in dependents:
+            if _is_in_any_section_path(dependent.path_str, dropped_full_section_path_strs):
+                continue
+            relative_section_path_str = SectionPath.from_section_str_list(dependent[1:]).path_str
+            dependents_by_manager.setdefault(dependent[0], set()).add(relative_section_path_str)
+
+        for manager_name, dependent_section_path_strs in dependents_by_manager.items():
+            dependent_manager = context.active_managers.get(manager_name)
+            if dependent_manager is None:
+                continue
+            for dependent_section_path_str in list(dependent_section_path_strs):
+                # Config may hold values taken from changed items, so load it again, keeping any updates
+                try:
+                    dependent_manager.runner.refresh(dependent_section_path_str)
+                except KeyError:
+                    # Dependent item no longer exists
+                    dependent_section_path_strs.discard(dependent_section_path_str)
+            to_drop.append((dependent_manager, dependent_section_path_strs))
+
+
+def _section_path_strs_for_config_changes(diff: FileSnapshotDiff, prior: FileSnapshot,
+                                          later: FileSnapshot, basepath: str) -> Set[str]:
+    """
+    Get the section paths of configs and sections which must be reloaded for changed config files.
+    Modified config files reload only that config while modified section configs reload the whole
+    section. Added or removed files reload the highest folder which was added or removed, or
+    otherwise only that config.
+    """
+    prior_folders = _folders_containing_files(prior, basepath)
+    later_folders = _folders_containing_files(later, basepath)
+
+    section_path_strs: Set[str] = set()
+    for filepath in diff.changed:
+        sections = _config_filepath_to_sections(filepath, basepath)
+        if filepath in diff.modified:
+            if sections[-1] == 'section':
+                # Section config applies to everything in the section
+                sections = sections[:-1]
+            section_path_strs.add('.'.join(sections))
+            continue
+
+        # File was added or removed
+        if sections[-1] == 'section':
+            section_path_strs.add('.'.join(sections[:-1]))
+            continue
+        folders = prior_folders if filepath in diff.added else later_folders
+        for i in range(1, len(sections)):
+            folder_sections = tuple(sections[:i])
+            if folder_sections not in folders:
+                # Folder was created or removed entirely, reload from the top of the new or removed tree
+                section_path_strs.add('.'.join(folder_sections))
+                break
+        else:
+            section_path_strs.add('.'.join(sections))
+    return section_path_strs
+
+
+def _remove_nested_section_paths(section_path_strs: Set[str]) -> Set[str]:
+    """
+    Remove section paths which are within other section paths, as reloading
+    the higher section already reloads everything within it
+    """
+    if '' in section_path_strs:
+        return {''}
+    return {
+        section_path_str for section_path_str in section_path_strs
+        if not _is_in_any_section_path(section_path_str, section_path_strs - {section_path_str})
+    }
+
+
+def _folders_containing_files(snapshot: FileSnapshot, basepath: str) -> Set[Tuple[str, ...]]:
+    folders: Set[Tuple[str, ...]] = set()
+    for filepath in snapshot.fingerprints:
+        sections = _config_filepath_to_sections(filepath, basepath)
+        for i in range(1, len(sections)):
+            folders.add(tuple(sections[:i]))
+    return folders
+
+
+def _config_filepath_to_sections(filepath: str, basepath: str) -> List[str]:
+    relative_path = os.path.relpath(filepath, basepath)
+    sections = relative_path.split(os.path.sep)
+    sections[-1] = os.path.splitext(sections[-1])[0]
+    return sections
+
+
+def _item_signatures(registrar: Registrar) -> Dict[str, Any]:
+    """
+    Get a comparable signature for every item in a registrar by its section path in the manager
+    """
+    # Items in the pipeline dict are at the top level of the manager, specific class items are under their name
+    from pyfileconf.pipelines.models.registrar import PipelineRegistrar
+    if isinstance(registrar, PipelineRegistrar):
+        base_section_path_str = ''
+    else:
+        base_section_path_str = registrar.name
+    return _collection_item_signatures(registrar.collection, base_section_path_str)
+
+
+def _collection_item_signatures(collection: Collection, base_section_path_str: str) -> Dict[str, Any]:
+    signatures: Dict[str, Any] = {}
+    for name, item in collection.name_dict.items():
+        section_path_str = f'{base_section_path_str}.{name}' if base_section_path_str else name
+        if isinstance(item, Collection):
+            signatures.update(_collection_item_signatures(item, section_path_str))
+        elif isinstance(item, ObjectView):
+            signatures[section_path_str] = (ast.dump(item.obj_ast), str(item.import_statement))
+        else:
+            # Specific class items are only a placeholder for the config, so only their presence matters
+            signatures[section_path_str] = type(item)
+    return signatures
+
+
+def _dict_file_snapshot(manager: 'PipelineManager') -> FileSnapshot:
+    return FileSnapshot.from_files([
+        manager.pipeline_dict_path,
+        *[_specific_class_dict_path(manager, name) for name in manager.specific_class_names]
+    ])
+
+
+def _specific_class_dict_path(manager: 'PipelineManager', name: str) -> str:
+    return os.path.join(manager.folder, f'{name}_dict.py')
+
+
+def _module_file_snapshot(module_names: Iterable[str]) -> FileSnapshot:
+    filepaths = []
+    for module_name in module_names:
+        module = sys.modules.get(module_name)
+        filepath: Optional[str] = getattr(module, '__file__', None)
+        if filepath is not None and filepath.endswith('.py'):
+            filepaths.append(filepath)
+    return FileSnapshot.from_files(filepaths)
@@ -0,0 +1,193 @@
+"""
+Execution of prepared run tasks serially, in a thread pool, in a process pool or with asyncio.
+
+Configs are resolved and items are configured in the calling thread, only the
+configured callables are run by the executor, so config loading is never concurrent.
+"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor, Future
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from pyfileconf.logger.logger import logger
+from pyfileconf.logger.render import log_result
+from pyfileconf.pmcontext.stack import PyfileconfFrame, PyfileconfStack
+from pyfileconf.runner.models.interfaces import Result, Results
+
+EXECUTOR_SERIAL = 'serial'
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+EXECUTORS = (EXECUTOR_SERIAL, EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+
+class RunTask:
+    """
+    A configured callable for one item, ready to be run by an executor
+
+    Must be picklable along with the callable to be run in a process pool.
+    """
+
+    def __init__(self, section_path_str: str, func: Callable, description: Any,
+                 frames: Sequence[PyfileconfFrame] = ()):
+        """
+        :param section_path_str: full section path of the item, including the manager name
+        :param func: configured callable which runs the item
+        :param description: how the item is shown in the log when running, rendered when logged
+        :param frames: context stack frames of the caller, so that the item is tracked within them
+        """
+        self.section_path_str = section_path_str
+        self.func = func
+        self.description = description
+        self.frames = list(frames)
+
+    def __repr__(self):
+        return f'<RunTask(section_path_str={self.section_path_str}, description={self.description})>'
+
+
+def run_task(task: RunTask) -> Result:
+    """
+    Runs a task in a worker with a stack of the caller's frames plus the running item
+    """
+    from pyfileconf import context
+    from pyfileconf.pmcontext.tracing import StackTracker
+
+    prior_stack = context.stack
+    context.stack = PyfileconfStack(task.frames)
+    try:
+        with StackTracker(task.section_path_str):
+            logger.info('Running %s', task.description)
+            result = task.func()
+            if not inspect.isawaitable(result):
+                log_result(result)
+    finally:
+        context.stack = prior_stack
+    return result
+
+
+def validate_executor(executor: str, workers: Optional[int] = None) -> None:
+    if executor not in EXECUTORS:
+        raise ValueError(f'executor must be one of {EXECUTORS}, got {executor}')
+    if workers is not None and workers < 1:
+        raise ValueError(f'must have at least one worker, got {workers}')
+
+
+def run_tasks(tasks: Sequence[RunTask], executor: str = EXECUTOR_SERIAL, workers: Optional[int] = None,
+              return_exceptions: bool = False) -> Results:
+    """
+    Runs tasks with the executor, returning results in the order of the tasks
+
+    On the first error in task order, tasks which have not started are cancelled and the error is raised,
+    unless return_exceptions is passed.
+
+    :param tasks: tasks to run
+    :param executor: 'serial', 'thread' or 'process'
+    :param workers: number of threads or processes, defaults to the executor's default
+    :param return_exceptions: return exceptions raised by tasks in place of their results
+        and keep running the other tasks, rather than raising the first error
+    :return: results of tasks
+    """
+    validate_executor(executor, workers)
+    if executor == EXECUTOR_SERIAL or len(tasks) <= 1:
+        if return_exceptions:
+            return [_get_result_or_exception(functools.partial(run_task, task)) for task in tasks]
+        return [run_task(task) for task in tasks]
+
+    pool: Executor
+    if executor == EXECUTOR_THREAD:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+    with pool:
+        futures: List[Future] = [pool.submit(run_task, task) for task in tasks]
+        if return_exceptions:
+            return [_get_result_or_exception(future.result) for future in futures]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def arun_task(task: RunTask) -> Result:
+    """
+    Awaits a task whose callable is a coroutine function in the event loop,
+    otherwise runs the task in the default thread executor of the loop. Awaitables
+    returned by other callables, such as sync decorators of coroutine functions,
+    are then awaited in the loop.
+    """
+    if not _is_coroutine_callable(task.func):
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, run_task, task)
+        if not inspect.isawaitable(result):
+            return result
+        return await _await_task_result(task, lambda: result)
+
+    logger.info('Running %s', task.description)
+    return await _await_task_result(task, task.func)
+
+
+async def _await_task_result(task: RunTask, get_result: Callable[[], Any]) -> Result:
+    from pyfileconf import context
+    from pyfileconf.pmcontext.tracing import StackTracker
+
+    # Each asyncio task has its own copy of the context, so setting the stack only affects this task
+    prior_stack = context.stack
+    context.stack = PyfileconfStack(task.frames)
+    try:
+        with StackTracker(task.section_path_str):
+            result = get_result()
+            if inspect.isawaitable(result):
+                result = await result
+            log_result(result)
+    finally:
+        context.stack = prior_stack
+    return result
+
+
+async def arun_tasks(tasks: Sequence[RunTask], concurrency: Optional[int] = None) -> Results:
+    """
+    Runs tasks concurrently in the running event loop, returning results in the order of the tasks
+
+    On the first error, tasks which have not finished are cancelled and the error is raised.
+
+    :param tasks: tasks to run
+    :param concurrency: maximum number of tasks running at once, unlimited if not passed
+    :return: results of tasks
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f'concurrency must be at least one, got {concurrency}')
+    semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    async def arun_limited_task(task: RunTask) -> Result:
+        if semaphore is None:
+            return await arun_task(task)
+        async with semaphore:
+            return await arun_task(task)
+
+    futures = [asyncio.ensure_future(arun_limited_task(task)) for task in tasks]
+    try:
+        return list(await asyncio.gather(*futures))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def _get_result_or_exception(get_result: Callable[[], Result]) -> Union[Result, Exception]:
+    try:
+        return get_result()
+    except Exception as e:
+        return e
+
+
+def _is_coroutine_callable(func: Callable) -> bool:
+    # Configured functions are partials, which iscoroutinefunction only unwraps from Python 3.8
+    while isinstance(func, functools.partial):
+        func = func.func
+    if inspect.iscoroutinefunction(func):
+        return True
+    # Configured class instances may define async __call__
+    return inspect.iscoroutinefunction(getattr(func, '__call__', None))
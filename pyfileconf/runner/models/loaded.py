@@ -0,0 +1,228 @@
+"""
+Configured functions and objects which a runner has loaded, evicted according to the
+loaded_objects_policy option. Evicted objects are created and configured again by the
+runner the next time they are used.
+"""
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from pyfileconf.basemodels.cache import CacheStats
+
+LOADED_OBJECTS_UNBOUNDED = 'unbounded'
+LOADED_OBJECTS_LRU = 'lru'
+LOADED_OBJECTS_MEMORY = 'memory'
+LOADED_OBJECTS_WEAK = 'weak'
+LOADED_OBJECTS_POLICIES = (
+    LOADED_OBJECTS_UNBOUNDED,
+    LOADED_OBJECTS_LRU,
+    LOADED_OBJECTS_MEMORY,
+    LOADED_OBJECTS_WEAK,
+)
+
+EVICT_ATTR = '_pyfileconf_evict_'
+
+
+class _WeakEntry:
+    """
+    Weak reference to a loaded object, kept only while it is referenced elsewhere
+    """
+
+    def __init__(self, ref: weakref.ref):
+        self.ref = ref
+
+
+class LoadedObjectCache:
+    """
+    Loaded objects by section path, ordered from least to most recently used
+
+    Policy and limits are read from the options whenever an object is added,
+    so changes to the options apply from the next added object.
+    """
+
+    def __init__(self):
+        self._objects: 'OrderedDict[str, Any]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # Section paths of objects which were evicted and have not been loaded again
+        self._evicted: Set[str] = set()
+        self._lock = threading.RLock()
+        self.stats = CacheStats()
+        self.size_bytes = 0
+
+    def __repr__(self):
+        return f'<LoadedObjectCache(size={len(self)}, size_bytes={self.size_bytes}, stats={self.stats})>'
+
+    def __contains__(self, section_path_str: str) -> bool:
+        with self._lock:
+            return self._get_live(section_path_str) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._objects)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._objects))
+
+    def __delitem__(self, section_path_str: str) -> None:
+        with self._lock:
+            del self._objects[section_path_str]
+            self.size_bytes -= self._sizes.pop(section_path_str, 0)
+            self._evicted.discard(section_path_str)
+
+    def __setitem__(self, section_path_str: str, obj: Any) -> None:
+        from pyfileconf.opts import options
+        policy = options.loaded_objects_policy
+        if policy not in LOADED_OBJECTS_POLICIES:
+            raise ValueError(f'loaded_objects_policy must be one of {LOADED_OBJECTS_POLICIES}, got {policy}')
+
+        with self._lock:
+            if section_path_str in self._objects:
+                del self[section_path_str]
+            self._evicted.discard(section_path_str)
+
+            if policy == LOADED_OBJECTS_WEAK:
+                try:
+                    entry = _WeakEntry(weakref.ref(obj, self._get_weak_callback(section_path_str)))
+                except TypeError:
+                    # Object does not support weak references, so must keep it
+                    entry = obj
+                self._objects[section_path_str] = entry
+                return
+
+            self._objects[section_path_str] = obj
+            if policy == LOADED_OBJECTS_MEMORY:
+                size = approximate_size(obj)
+                self._sizes[section_path_str] = size
+                self.size_bytes += size
+            self._evict_if_necessary(policy, options.loaded_objects_max_count, options.loaded_objects_max_bytes)
+
+    def get(self, section_path_str: str, default: Any = None) -> Any:
+        """
+        Gets a loaded object, marking it as most recently used
+
+        :param section_path_str: section path of the item
+        :param default: returned when the object has not been loaded or was evicted
+        :return: the loaded object
+        """
+        with self._lock:
+            obj = self._get_live(section_path_str)
+            if obj is None:
+                self.stats.record_miss()
+                return default
+            self._objects.move_to_end(section_path_str)
+            self.stats.record_hit()
+            return obj
+
+    def peek(self, section_path_str: str, default: Any = None) -> Any:
+        """
+        Gets a loaded object without marking it as used or recording a hit or miss
+
+        :param section_path_str: section path of the item
+        :param default: returned when the object has not been loaded or was evicted
+        :return: the loaded object
+        """
+        with self._lock:
+            obj = self._get_live(section_path_str)
+            if obj is None:
+                return default
+            return obj
+
+    def was_evicted(self, section_path_str: str) -> bool:
+        """
+        Whether the object was loaded then evicted, and has not been loaded again since
+        """
+        with self._lock:
+            if section_path_str in self._evicted:
+                return True
+            entry = self._objects.get(section_path_str)
+            # Weakly referenced objects which were collected but not yet removed
+            return isinstance(entry, _WeakEntry) and entry.ref() is None
+
+    def _get_live(self, section_path_str: str) -> Any:
+        entry = self._objects.get(section_path_str)
+        if isinstance(entry, _WeakEntry):
+            return entry.ref()
+        return entry
+
+    def _get_weak_callback(self, section_path_str: str):
+        cache_ref = weakref.ref(self)
+
+        def remove_collected(ref: weakref.ref):
+            cache = cache_ref()
+            if cache is None:
+                return
+            with cache._lock:
+                entry = cache._objects.get(section_path_str)
+                if isinstance(entry, _WeakEntry) and entry.ref is ref:
+                    del cache._objects[section_path_str]
+                    cache._evicted.add(section_path_str)
+                    cache.stats.record_eviction()
+
+        return remove_collected
+
+    def _evict_if_necessary(self, policy: str, max_count: Optional[int], max_bytes: Optional[int]) -> None:
+        evicted: List[Any] = []
+        # Most recently added object is always kept, as it is about to be used
+        while len(self._objects) > 1 and self._is_over_limit(policy, max_count, max_bytes):
+            section_path_str, entry = self._objects.popitem(last=False)
+            self.size_bytes -= self._sizes.pop(section_path_str, 0)
+            self._evicted.add(section_path_str)
+            self.stats.record_eviction()
+            if not isinstance(entry, _WeakEntry):
+                evicted.append(entry)
+
+        for obj in evicted:
+            evict = getattr(obj, EVICT_ATTR, None)
+            if evict is not None:
+                evict()
+
+    def _is_over_limit(self, policy: str, max_count: Optional[int], max_bytes: Optional[int]) -> bool:
+        if policy == LOADED_OBJECTS_LRU and max_count is not None:
+            return len(self._objects) > max_count
+        if policy == LOADED_OBJECTS_MEMORY and max_bytes is not None:
+            return self.size_bytes > max_bytes
+        return False
+
+
+def approximate_size(obj: Any, max_depth: int = 3) -> int:
+    """
+    Approximate memory size of an object in bytes, including its attributes,
+    partial arguments and container items up to max_depth levels deep.
+    Objects which report their full size through __sizeof__, such as DataFrames, are exact.
+    """
+    return _approximate_size(obj, max_depth, set())
+
+
+def _approximate_size(obj: Any, depth: int, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    try:
+        size = sys.getsizeof(obj)
+    except TypeError:
+        size = 0
+    if depth <= 0:
+        return size
+
+    children: List[Any] = []
+    if isinstance(obj, dict):
+        children.extend(obj.keys())
+        children.extend(obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        children.extend(obj)
+    elif isinstance(obj, partial):
+        children.extend(obj.args)
+        children.extend(obj.keywords.values())
+    # Avoid __getattr__ of proxies such as item views
+    try:
+        children.append(object.__getattribute__(obj, '__dict__'))
+    except AttributeError:
+        pass
+
+    for child in children:
+        size += _approximate_size(child, depth - 1, seen)
+    return size
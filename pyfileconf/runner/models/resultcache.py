@@ -0,0 +1,479 @@
+"""
+Persistent on-disk cache of the results of running items.
+
+Results are stored by a key which is a hash of the item's resolved config, the file and
+qualified name of the function or class, and the keys of the items it depends on, whether
+through item views in its config or items it got while running. So a changed config only
+causes the changed item and the items downstream of it to be run again.
+
+Only active when the cache_folder option is set. Items are cached when the cache_results
+option is set, unless they set _pyfileconf_cache_result_ to False on the function or class
+or in the config. Setting it to True marks the item as pure, its result depending only on
+the above, so it is cached even without the option.
+"""
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import tempfile
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Tuple, Dict, Mapping, Set, List, Iterator, TYPE_CHECKING
+
+from pyfileconf.basemodels.cache import CacheStats
+from pyfileconf.io.file.fingerprint import file_fingerprint, FileFingerprint
+from pyfileconf.logger.logger import logger
+
+if TYPE_CHECKING:
+    from pyfileconf.runner.models.runner import Runner
+
+CACHE_RESULT_ATTR = '_pyfileconf_cache_result_'
+
+
+class NotCacheableException(Exception):
+    pass
+
+
+class PickleSerializer:
+    """
+    Stores results with pickle, with item views stored as their section paths.
+    Other serializers must have the same dumps and loads methods.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        buffer = io.BytesIO()
+        _ResultPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+
+    def loads(self, data: bytes) -> Any:
+        return _ResultUnpickler(io.BytesIO(data)).load()
+
+
+class _ResultPickler(pickle.Pickler):
+
+    def persistent_id(self, obj):
+        from pyfileconf.selector.models.itemview import is_item_view
+        if is_item_view(obj):
+            return 'item_view', obj.section_path_str
+        return None
+
+
+class _ResultUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        from pyfileconf.selector.models.itemview import ItemView
+        kind, section_path_str = pid
+        if kind != 'item_view':
+            raise pickle.UnpicklingError(f'unsupported persistent object {pid}')
+        return ItemView(section_path_str)
+
+
+class ResultCache:
+    subfolder = 'results'
+    suffix = '.result'
+
+    def __init__(self, serializer: Optional[Any] = None):
+        if serializer is None:
+            serializer = PickleSerializer()
+        self.serializer = serializer
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._source_hashes: Dict[str, Tuple[Optional[FileFingerprint], str]] = {}
+
+    @property
+    def folder(self) -> Optional[str]:
+        from pyfileconf.opts import options
+        if options.cache_folder is None:
+            return None
+        return os.path.join(options.cache_folder, self.subfolder)
+
+    @property
+    def enabled(self) -> bool:
+        return self.folder is not None
+
+    def should_cache(self, func_or_class: Any, config: Mapping[str, Any]) -> bool:
+        """
+        Whether the result of the item should be cached, set by _pyfileconf_cache_result_ in
+        the config, then on the function or class, then by the cache_results option
+        """
+        from pyfileconf.opts import options
+        if not self.enabled:
+            return False
+        cache_result = config.get(CACHE_RESULT_ATTR)
+        if cache_result is None:
+            cache_result = getattr(func_or_class, CACHE_RESULT_ATTR, None)
+        if cache_result is None:
+            cache_result = options.cache_results
+        return bool(cache_result)
+
+    def get(self, key: Optional[str]) -> Tuple[bool, Any]:
+        """
+        :param key: result key, None for items which are not cached
+        :return: whether the result was found, and the result
+        """
+        if key is None:
+            return False, None
+        path = self._result_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            result = self.serializer.loads(data)
+        except FileNotFoundError:
+            self.stats.record_miss()
+            return False, None
+        except Exception as e:
+            logger.debug(f'Could not load cached result {path}: {e}')
+            self.stats.record_miss()
+            return False, None
+
+        # Modification time tracks use, so the least recently used results are removed first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.stats.record_hit()
+        return True, result
+
+    def set(self, key: Optional[str], result: Any) -> None:
+        if key is None:
+            return
+        try:
+            data = self.serializer.dumps(result)
+        except Exception as e:
+            logger.debug(f'Could not serialize result for cache key {key}: {e}')
+            return
+
+        path = self._result_path(key)
+        folder = os.path.dirname(path)
+        if not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        # Write to a temporary file then move it into place so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.debug(f'Could not write cached result {path}: {e}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self._remove_least_recently_used()
+
+    def clear(self) -> None:
+        folder = self.folder
+        if folder is not None and os.path.exists(folder):
+            for file_name in os.listdir(folder):
+                if file_name.endswith(self.suffix):
+                    os.remove(os.path.join(folder, file_name))
+        self.stats.reset()
+
+    def source_hash(self, func_or_class: Any) -> str:
+        """
+        Hash of the file in which the function or class is defined along with its qualified name
+        """
+        func_or_class = inspect.unwrap(func_or_class)
+        name = f'{getattr(func_or_class, "__module__", None)}.{getattr(func_or_class, "__qualname__", None)}'
+        try:
+            filepath = inspect.getsourcefile(func_or_class)
+        except TypeError:
+            filepath = None
+        if filepath is None:
+            return name
+
+        fingerprint = file_fingerprint(filepath)
+        with self._lock:
+            cached = self._source_hashes.get(filepath)
+        if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+            file_hash = cached[1]
+        else:
+            with open(filepath, 'rb') as f:
+                file_hash = hashlib.sha256(f.read()).hexdigest()
+            with self._lock:
+                self._source_hashes[filepath] = (fingerprint, file_hash)
+        return f'{file_hash}:{name}'
+
+    def _result_path(self, key: str) -> str:
+        folder = self.folder
+        if folder is None:
+            raise ValueError('cache_folder option must be set to use the result cache')
+        return os.path.join(folder, key + self.suffix)
+
+    def _remove_least_recently_used(self) -> None:
+        from pyfileconf.opts import options
+        max_bytes = options.result_cache_max_bytes
+        folder = self.folder
+        if max_bytes is None or folder is None:
+            return
+
+        with self._lock:
+            entries = []
+            for file_name in os.listdir(folder):
+                if not file_name.endswith(self.suffix):
+                    continue
+                path = os.path.join(folder, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                else:
+                    self.stats.record_eviction()
+                total_bytes -= size
+
+
+result_cache = ResultCache()
+
+
+class ResultKeyMemo:
+    """
+    Keys of the upstream items computed during a run, so that items which many items
+    depend on are only hashed once, along with which items each item depends on.
+
+    Keys include the dependencies recorded between items, so everything is forgotten
+    once dependencies are added or removed, such as by running an item for the first time.
+    Configs are not expected to change during a run.
+    """
+
+    def __init__(self):
+        self.keys: Dict[str, str] = {}
+        self._run_dependencies: Dict[str, Set[str]] = {}
+        self._dependencies_state: Optional[Tuple[int, int, int]] = None
+
+    def validate(self) -> None:
+        state = config_dependencies_state()
+        if state == self._dependencies_state:
+            return
+        self.keys.clear()
+        self._run_dependencies = _get_all_run_dependencies()
+        self._dependencies_state = state
+
+    def run_dependencies(self, full_section_path_str: str) -> Set[str]:
+        return self._run_dependencies.get(full_section_path_str, set())
+
+
+def config_dependencies_state() -> Tuple[int, int, int]:
+    """
+    Changes when dependencies between items are added or removed, so that keys which
+    include the dependencies can be reused until then
+    """
+    from pyfileconf import context
+    dependencies = context.config_dependencies
+    return id(dependencies), len(dependencies), sum(len(dependents) for dependents in dependencies.values())
+
+
+_key_memo: ContextVar[Optional[ResultKeyMemo]] = ContextVar('pyfileconf_result_key_memo', default=None)
+
+
+@contextmanager
+def memoize_result_keys() -> Iterator[ResultKeyMemo]:
+    """
+    Reuse keys of upstream items within the block, such as for one run.
+    Nested blocks use the memo of the outermost block.
+    """
+    memo = _key_memo.get()
+    if memo is not None:
+        yield memo
+        return
+    memo = ResultKeyMemo()
+    token = _key_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _key_memo.reset(token)
+
+
+def get_result_key(runner: 'Runner', section_path_str: str, func_or_class: Any,
+                   config_dict: Mapping[str, Any]) -> Optional[str]:
+    """
+    Key of the result of running an item, or None if the result should not be cached
+    or can not be identified
+
+    :param runner: runner of the manager of the item
+    :param section_path_str: section path of the item, relative to the manager
+    :param func_or_class: function or class of the item
+    :param config_dict: config which is passed to the function or class
+    """
+    if not result_cache.enabled:
+        return None
+    config = runner._get_config(section_path_str)
+    if not result_cache.should_cache(func_or_class, config):
+        return None
+    return get_item_key(runner, section_path_str, func_or_class, config_dict)
+
+
+def get_item_key(runner: 'Runner', section_path_str: str, func_or_class: Any,
+                 config_dict: Mapping[str, Any]) -> Optional[str]:
+    """
+    Hash of everything which determines the result of running an item, or None if it
+    can not be identified
+
+    :param runner: runner of the manager of the item
+    :param section_path_str: section path of the item, relative to the manager
+    :param func_or_class: function or class of the item
+    :param config_dict: config which is passed to the function or class
+    """
+    full_section_path_str = f'{runner._manager_name}.{section_path_str}'
+    memo = _key_memo.get()
+    if memo is None:
+        memo = ResultKeyMemo()
+    memo.validate()
+    try:
+        return _get_key(full_section_path_str, func_or_class, config_dict, {full_section_path_str}, memo)
+    except NotCacheableException as e:
+        logger.debug(f'Can not identify result of {full_section_path_str}: {e}')
+        return None
+
+
+def _get_key(full_section_path_str: str, func_or_class: Any, config_dict: Mapping[str, Any],
+             seen: Set[str], memo: ResultKeyMemo) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(result_cache.source_hash(func_or_class).encode('utf8'))
+    hasher.update(_config_fingerprint(config_dict, seen, memo))
+    for depends_on in sorted(memo.run_dependencies(full_section_path_str)):
+        hasher.update(_get_upstream_key(depends_on, seen, memo).encode('utf8'))
+    return hasher.hexdigest()
+
+
+def _config_fingerprint(config_dict: Mapping[str, Any], seen: Set[str], memo: ResultKeyMemo) -> bytes:
+    return _pickle_digest(_canonicalize(dict(config_dict), seen, memo), seen, memo)
+
+
+def _pickle_digest(value: Any, seen: Set[str], memo: ResultKeyMemo) -> bytes:
+    buffer = io.BytesIO()
+    pickler = _ConfigPickler(buffer, seen, memo)
+    try:
+        pickler.dump(value)
+    except NotCacheableException:
+        raise
+    except Exception as e:
+        raise NotCacheableException(f'could not pickle config: {e}')
+    return hashlib.sha256(buffer.getvalue()).digest()
+
+
+_SORTABLE_TYPES = (str, bytes, int, float, bool)
+
+
+def _canonicalize(value: Any, seen: Set[str], memo: ResultKeyMemo) -> Any:
+    """
+    Put the items of dicts and sets in a consistent order, as their order depends on insertion
+    order and on string hash randomization, which differs between sessions
+    """
+    if _get_item_section_path_str(value) is not None:
+        # Item views and configured items are pickled as the keys of their results
+        return value
+    if isinstance(value, dict):
+        items = [(_canonicalize(key, seen, memo), _canonicalize(item, seen, memo)) for key, item in value.items()]
+        return _qualified_type_name(value), _sorted_consistently(items, seen, memo, key=lambda item: item[0])
+    if isinstance(value, (set, frozenset)):
+        return _qualified_type_name(value), _sorted_consistently(
+            [_canonicalize(item, seen, memo) for item in value], seen, memo
+        )
+    if isinstance(value, (list, tuple)):
+        items = [_canonicalize(item, seen, memo) for item in value]
+        if all(item is orig_item for item, orig_item in zip(items, value)):
+            return value
+        return _qualified_type_name(value), items
+    return value
+
+
+def _sorted_consistently(values: List[Any], seen: Set[str], memo: ResultKeyMemo,
+                         key: Callable[[Any], Any] = lambda value: value) -> List[Any]:
+    sort_values = [key(value) for value in values]
+    if all(type(sort_value) is type(sort_values[0]) and isinstance(sort_value, _SORTABLE_TYPES)
+           for sort_value in sort_values):
+        return sorted(values, key=key)
+    return sorted(values, key=lambda value: _pickle_digest(key(value), seen, memo))
+
+
+def _qualified_type_name(value: Any) -> str:
+    return f'{type(value).__module__}.{type(value).__qualname__}'
+
+
+class _ConfigPickler(pickle.Pickler):
+    """
+    Pickles items from pyfileconf, whether item views or configured items, as the keys of
+    their results rather than their contents
+    """
+
+    def __init__(self, file, seen: Set[str], memo: ResultKeyMemo):
+        super().__init__(file, protocol=4)
+        self.seen = seen
+        self.key_memo = memo
+
+    def persistent_id(self, obj):
+        section_path_str = _get_item_section_path_str(obj)
+        if section_path_str is None:
+            return None
+        return 'pyfileconf', _get_upstream_key(section_path_str, self.seen, self.key_memo)
+
+
+def _get_item_section_path_str(obj: Any) -> Optional[str]:
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return None
+    try:
+        section_path_str = obj.__dict__.get('_section_path_str')
+    except Exception:
+        return None
+    if not isinstance(section_path_str, str):
+        return None
+    return section_path_str
+
+
+def _get_all_run_dependencies() -> Dict[str, Set[str]]:
+    """
+    Items which each item has been recorded as depending on
+    """
+    from pyfileconf import context
+
+    run_dependencies: Dict[str, Set[str]] = {}
+    for depends_on, dependents in context.config_dependencies.items():
+        for dependent in dependents:
+            run_dependencies.setdefault(dependent.path_str, set()).add(depends_on)
+    return run_dependencies
+
+
+def _get_upstream_key(full_section_path_str: str, seen: Set[str], memo: ResultKeyMemo) -> str:
+    from pyfileconf.basemodels.collection import Collection
+    from pyfileconf.main import PipelineManager
+    from pyfileconf.sectionpath.sectionpath import SectionPath
+
+    if full_section_path_str in seen:
+        raise NotCacheableException(f'{full_section_path_str} depends on itself')
+    key = memo.keys.get(full_section_path_str)
+    if key is not None:
+        return key
+    seen = seen | {full_section_path_str}
+
+    try:
+        manager = PipelineManager.get_manager_by_section_path_str(full_section_path_str)
+        section_path_str = SectionPath.from_section_str_list(SectionPath(full_section_path_str)[1:]).path_str
+        runner = manager.runner
+        func_or_collection = runner._get_func_or_collection(section_path_str)
+    except Exception as e:
+        raise NotCacheableException(f'could not get {full_section_path_str}: {e}')
+
+    if isinstance(func_or_collection, Collection):
+        hasher = hashlib.sha256()
+        for nested_path, nested_item in func_or_collection.path_index.items():
+            if not isinstance(nested_item, Collection):
+                hasher.update(
+                    _get_upstream_key(f'{full_section_path_str}.{nested_path}', seen, memo).encode('utf8')
+                )
+        key = hasher.hexdigest()
+    else:
+        func_or_class, config_dict = runner._get_func_or_class_and_config(section_path_str, func_or_collection)
+        key = _get_key(full_section_path_str, func_or_class, config_dict, seen, memo)
+    memo.keys[full_section_path_str] = key
+    return key
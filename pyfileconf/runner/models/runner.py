@@ -1,5 +1,5 @@
 import inspect
-from typing import Callable, Tuple, cast, Sequence, Type, Union, Dict, Any, List
+from typing import Callable, Tuple, cast, Sequence, Type, Union, Dict, Any, List, Iterable, Set, Optional
 from functools import partial
 
 from mixins.repr import ReprMixin
@@ -7,13 +7,18 @@ from mixins.repr import ReprMixin
 from pyfileconf.basemodels.collection import Collection
 from pyfileconf.basemodels.registrar import Registrar
 from pyfileconf.config.logic.apply import apply_config
-from pyfileconf.config.models.manager import ConfigManager, ActiveFunctionConfig
+from pyfileconf.config.models.manager import ConfigManager
+from pyfileconf.config.models.resolved import ResolvedConfig
 from pyfileconf.data.models.collection import SpecificClassCollection
 from pyfileconf.exceptions.config import ConfigManagerNotLoadedException
 from pyfileconf.logger.logger import logger
 from pyfileconf.pipelines.models.registrar import PipelineRegistrar, PipelineCollection
 from pyfileconf.logic.get import _get_public_name_or_special_name
 from pyfileconf.plugin import manager
+from pyfileconf.runner.models.loaded import LoadedObjectCache
+from pyfileconf.runner.models.executor import EXECUTOR_SERIAL, RunTask, run_tasks, arun_tasks, validate_executor
+from pyfileconf.runner.models.resultcache import result_cache, get_result_key, get_item_key, memoize_result_keys, \
+    config_dependencies_state
 from pyfileconf.runner.models.interfaces import (
     StrOrListOfStrs,
     Result,
@@ -23,25 +28,44 @@ from pyfileconf.runner.models.interfaces import (
 from pyfileconf.pipelines.models.interfaces import (
     FunctionOrCollection,
 )
-from pyfileconf.sectionpath.sectionpath import SectionPath
-from pyfileconf.config.logic.write import dict_as_function_kwarg_str
+from pyfileconf.sectionpath.sectionpath import SectionPath, _is_in_any_section_path
+from pyfileconf.logger.render import run_description, log_result
 from pyfileconf.pmcontext.tracing import StackTracker
 from pyfileconf.views.object import ObjectView
 
+
+class _UpToDateResult:
+    """
+    Result of an item which does not need to be run again, either its last result
+    when it is up to date or its cached result
+    """
+
+    def __init__(self, result: Result):
+        self.result = result
+
+
+# Index of the task for an item, or the result of an item which is up to date or cached,
+# or nested lists of those for sections
+RunPlan = Union[int, _UpToDateResult, List[Any]]
+
+
 class Runner(ReprMixin):
     repr_cols = ['_config', '_pipelines']
 
     def __init__(self, config: ConfigManager, registrars: Sequence[Registrar], general_registrar: PipelineRegistrar,
                  name: str):
         self._config = config
-        self._registrars = registrars
-        self._general_registrar = general_registrar
         self._manager_name = name
+        self.set_registrars(registrars, general_registrar)
 
         self._full_getattr = ''
-        self._all_specific_classes = tuple([registrar.klass for registrar in self._registrars])
-        self._specific_class_registrar_map = {registrar.klass: registrar for registrar in self._registrars}
-        self._loaded_objects: Dict[str, Any] = {}
+        self._loaded_objects = LoadedObjectCache()
+        # Fingerprint of everything which determined the result, and the result, of the last
+        # run of each item run with only_stale
+        self._run_states: Dict[str, Tuple[str, Result]] = {}
+        # Result keys of items which were not found in the result cache and are about to run, along
+        # with the state of the dependencies when the key was computed, to store their results
+        self._pending_result_keys: Dict[str, Tuple[str, Tuple[int, int, int]]] = {}
 
     def __getattr__(self, item):
         # TODO [#14]: find way of doing runner look ups with fewer side effects
@@ -86,7 +110,9 @@ class Runner(ReprMixin):
     #     return exposed_methods + pipeline_attrs
 
 
-    def run(self, section_path_str_or_list: StrOrListOfStrs) -> ResultOrResults:
+    def run(self, section_path_str_or_list: StrOrListOfStrs, executor: str = EXECUTOR_SERIAL,
+            workers: Optional[int] = None, only_stale: bool = False,
+            return_exceptions: bool = False) -> ResultOrResults:
         """
         Use to run registered pipelines/functions/sections. Pass a single section path or a list
         of section paths. If a list is passed, the return value will also be a list, with each
@@ -102,53 +128,136 @@ class Runner(ReprMixin):
                 or when running multiple functions/sections, e.g.
                     ['main.data', 'main.analysis.reg.1']
                 These sections/functions are based on the structure of your pipeline_dict
+            executor: 'serial' to run items one after another, 'thread' to run items in a thread pool
+                or 'process' to run items in a process pool. Items are configured in the calling
+                thread either way and results have the same structure and order
+            workers: number of threads or processes, defaults to the pool's default
+            only_stale: only run items which have not been run with only_stale before or for which
+                the source, config or config of any item they depend on has changed since then.
+                The last results are returned for the other items
+            return_exceptions: return errors in place of results rather than raising the first one,
+                so that the other items still run. With 'thread' or 'process' executors an error
+                replaces the result of the item which raised it, running serially it replaces the
+                result of the whole section path. Post-run hooks receive the errors as well
+
+        Returns: result or list of results
+
+        """
+        validate_executor(executor, workers)
+        # Keys of upstream items are reused by all the items they are upstream of
+        with memoize_result_keys():
+            multiple_results = False
+            if isinstance(section_path_str_or_list, str):
+                # Running single function/class
+                if executor == EXECUTOR_SERIAL:
+                    result = self._run_serial(section_path_str_or_list, only_stale, return_exceptions)
+                else:
+                    result = self._run_with_executor(
+                        [section_path_str_or_list], executor, workers, only_stale=only_stale,
+                        return_exceptions=return_exceptions
+                    )[0]
+            elif isinstance(section_path_str_or_list, list):
+                multiple_results = True
+                if executor == EXECUTOR_SERIAL:
+                    result = [
+                        self._run_serial(section_path_str, only_stale, return_exceptions)
+                        for section_path_str in section_path_str_or_list
+                    ]
+                else:
+                    result = self._run_with_executor(
+                        section_path_str_or_list, executor, workers, only_stale=only_stale,
+                        return_exceptions=return_exceptions
+                    )
+            else:
+                raise ValueError('must pass str or list of strs of section paths to Runner.run')
+
+        return self._add_post_run_results(result, multiple_results)
+
+    async def arun(self, section_path_str_or_list: StrOrListOfStrs, concurrency: Optional[int] = None,
+                   only_stale: bool = False) -> ResultOrResults:
+        """
+        Run registered pipelines/functions/sections in the running event loop, with the same
+        results as :meth:`run`.
+
+        Items are configured first, then run concurrently. Coroutine functions and classes with
+        an async execute method are awaited in the event loop, other items are run in the default
+        thread executor of the loop.
+
+        Args:
+            section_path_str_or_list: . separated name of path of function or section, or list thereof.
+            concurrency: maximum number of items running at once, unlimited if not passed
+            only_stale: only run items which are not up to date, see :meth:`run`
 
         Returns: result or list of results
 
         """
-        multiple_results = False
         if isinstance(section_path_str_or_list, str):
-            # Running single function/class
-            result = self._run(section_path_str_or_list)
+            multiple_results = False
+            section_path_strs = [section_path_str_or_list]
         elif isinstance(section_path_str_or_list, list):
             multiple_results = True
-            result = [self._run(section_path_str) for section_path_str in section_path_str_or_list]
+            section_path_strs = section_path_str_or_list
         else:
-            raise ValueError('must pass str or list of strs of section paths to Runner.run')
-
+            raise ValueError('must pass str or list of strs of section paths to Runner.arun')
+
+        tasks: List[RunTask] = []
+        task_section_path_strs: List[str] = []
+        with memoize_result_keys():
+            plans = [
+                self._plan_run(section_path_str, tasks, task_section_path_strs, only_stale=only_stale)
+                for section_path_str in section_path_strs
+            ]
+            task_results = await arun_tasks(tasks, concurrency=concurrency)
+            self._finish_tasks(task_section_path_strs, task_results, only_stale=only_stale)
+        results = [_fill_plan_with_results(plan, task_results) for plan in plans]
+
+        result = results if multiple_results else results[0]
+        return self._add_post_run_results(result, multiple_results)
+
+    def _add_post_run_results(self, result: ResultOrResults, multiple_results: bool) -> ResultOrResults:
         additional_results = manager.plm.hook.pyfileconf_post_run(results=result, runner=self)
         if additional_results and multiple_results:
-            result.extend(additional_results)
+            result.extend(additional_results)  # type: ignore
         elif additional_results and not multiple_results:
             result = [result, *additional_results]
 
         return result
 
-    def _run(self, section_path_str: str) -> ResultOrResults:
+    def _run_serial(self, section_path_str: str, only_stale: bool = False,
+                    return_exceptions: bool = False) -> ResultOrResults:
+        if not return_exceptions:
+            return self._run(section_path_str, only_stale=only_stale)
+        try:
+            return self._run(section_path_str, only_stale=only_stale)
+        except Exception as e:
+            return e
+
+    def _run(self, section_path_str: str, only_stale: bool = False) -> ResultOrResults:
         """
         Internal run function for running a single section path string. Handles both running
         sections and running individual functions/classes
 
         Args:
             section_path_str:
+            only_stale: only run items which are not up to date
 
         Returns:
 
         """
         func_or_collection = self._get_func_or_collection(section_path_str)
         if isinstance(func_or_collection, PipelineCollection):
-            return self._run_section(section_path_str)
+            return self._run_section(section_path_str, only_stale=only_stale)
         elif self._is_specific_class(func_or_collection):
-            return self._run_one_specific_class(section_path_str)
+            return self._run_one_specific_class(section_path_str, only_stale=only_stale)
         elif inspect.isclass(func_or_collection):
-            return self._run_one_class(section_path_str)
+            return self._run_one_class(section_path_str, only_stale=only_stale)
         elif callable(func_or_collection):
-            return self._run_one_func(section_path_str)
+            return self._run_one_func(section_path_str, only_stale=only_stale)
         else:
             raise ValueError(f'could not run section {section_path_str}. expected PipelineCollection or function,'
                              f'got {func_or_collection} of type {type(func_or_collection)}')
 
-    def _run_section(self, section_path_str: str) -> Results:
+    def _run_section(self, section_path_str: str, only_stale: bool = False) -> Results:
         section = self._get_func_or_collection(section_path_str)
         section = cast(PipelineCollection, section)
         results = []
@@ -166,14 +275,14 @@ class Runner(ReprMixin):
 
             if isinstance(section_or_callable, PipelineCollection):
                 # got another section within this section. recursively call run section
-                results.append(self._run_section(subsection_path_str))
+                results.append(self._run_section(subsection_path_str, only_stale=only_stale))
             elif self._is_specific_class(section_or_callable):
-                results.append(self._run_one_specific_class(section_path_str))
+                results.append(self._run_one_specific_class(subsection_path_str, only_stale=only_stale))
             elif inspect.isclass(section_or_callable):
-                results.append(self._run_one_class(section_path_str))
+                results.append(self._run_one_class(subsection_path_str, only_stale=only_stale))
             elif callable(section_or_callable):
                 # run function
-                results.append(self._run_one_func(subsection_path_str))
+                results.append(self._run_one_func(subsection_path_str, only_stale=only_stale))
             else:
                 raise ValueError(f'could not run section {subsection_path_str}. expected PipelineCollection or '
                                  f'function or class,'
@@ -182,42 +291,265 @@ class Runner(ReprMixin):
         return results
 
 
-    def _run_one_func(self, section_path_str: str) -> Result:
+    def _run_with_executor(self, section_path_strs: Sequence[str], executor: str,
+                           workers: Optional[int] = None, only_stale: bool = False,
+                           return_exceptions: bool = False) -> Results:
+        """
+        Configures all the items in the section paths, then runs them with the executor,
+        and puts the results into the same structure as running serially
+
+        With return_exceptions, errors are returned in place of the results of the items which
+        raised them, or in place of the whole section path when it could not be configured
+        """
+        tasks: List[RunTask] = []
+        task_section_path_strs: List[str] = []
+        plans: List[Union[RunPlan, Exception]] = []
+        for section_path_str in section_path_strs:
+            num_tasks = len(tasks)
+            try:
+                plans.append(self._plan_run(section_path_str, tasks, task_section_path_strs, only_stale=only_stale))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                # Do not run the items of the section path configured before the error
+                del tasks[num_tasks:]
+                del task_section_path_strs[num_tasks:]
+                plans.append(e)
+        task_results = run_tasks(tasks, executor=executor, workers=workers, return_exceptions=return_exceptions)
+        self._finish_tasks(task_section_path_strs, task_results, only_stale=only_stale)
+        return [plan if isinstance(plan, Exception) else _fill_plan_with_results(plan, task_results) for plan in plans]
+
+    def _finish_tasks(self, task_section_path_strs: Sequence[str], task_results: Results,
+                      only_stale: bool = False) -> None:
+        for section_path_str, result in zip(task_section_path_strs, task_results):
+            if isinstance(result, Exception):
+                # Only when returning exceptions, the item did not finish
+                self._pending_result_keys.pop(section_path_str, None)
+                continue
+            self._store_result(section_path_str, result)
+            self._add_to_config_dependencies_if_necessary(section_path_str)
+            if only_stale:
+                func_or_class, config_dict = self._get_func_or_class_and_config(section_path_str)
+                self._record_run_state(section_path_str, func_or_class, config_dict, result)
+
+    def _plan_run(self, section_path_str: str, tasks: List[RunTask], task_section_path_strs: List[str],
+                  func_or_collection: Optional[Any] = None, only_stale: bool = False) -> RunPlan:
+        """
+        Adds tasks for the items in the section path, returning the index of the task for an
+        item, or a nested list of indices for a section
+        """
+        if func_or_collection is None:
+            func_or_collection = self._get_func_or_collection(section_path_str)
+
+        if isinstance(func_or_collection, PipelineCollection):
+            plans: List[RunPlan] = []
+            for section_or_object_view in func_or_collection:
+                # Get section path by which to call this item
+                subsection_name = _get_public_name_or_special_name(section_or_object_view, accept_output_names=False)
+                subsection_path_str = SectionPath.join(section_path_str, subsection_name).path_str
+
+                # Get from object view if necessary
+                if isinstance(section_or_object_view, ObjectView):
+                    section_or_callable = section_or_object_view.item
+                else:
+                    section_or_callable = section_or_object_view
+                plans.append(
+                    self._plan_run(
+                        subsection_path_str, tasks, task_section_path_strs, section_or_callable, only_stale=only_stale
+                    )
+                )
+            return plans
+
+        task_or_result = self._get_run_task_or_result(section_path_str, func_or_collection, only_stale=only_stale)
+        if isinstance(task_or_result, _UpToDateResult):
+            return task_or_result
+
+        tasks.append(task_or_result)
+        task_section_path_strs.append(section_path_str)
+        return len(tasks) - 1
+
+    def _get_run_task_or_result(self, section_path_str: str, func_or_class: Optional[Any] = None,
+                                only_stale: bool = False) -> Union[RunTask, _UpToDateResult]:
+        """
+        Gets the task to run an item, or its result if it is up to date or cached.
+        The result of the task should be passed to _store_result after running it.
+        """
+        if func_or_class is None:
+            func_or_class = self._get_func_or_collection(section_path_str)
+
+        if only_stale or result_cache.enabled:
+            func_or_class_, config_dict = self._get_func_or_class_and_config(section_path_str, func_or_class)
+            if only_stale:
+                is_up_to_date, result = self._get_up_to_date_result(section_path_str, func_or_class_, config_dict)
+                if is_up_to_date:
+                    logger.info('Using last result of %s as it is up to date', section_path_str)
+                    return _UpToDateResult(result)
+
+            found, result = self._get_cached_result(section_path_str, func_or_class_, config_dict)
+            if found:
+                logger.info('Using cached result of %s', section_path_str)
+                log_result(result)
+                return _UpToDateResult(result)
+
+        return self._get_run_task(section_path_str, func_or_class)
+
+    def _get_run_task(self, section_path_str: str, func_or_class: Optional[Any] = None) -> RunTask:
+        from pyfileconf import context
+
+        if func_or_class is None:
+            func_or_class = self._get_func_or_collection(section_path_str)
+
+        frames = list(context.stack.frames)
         with StackTracker(section_path_str, base_section_path_str=self._manager_name):
-            _, config_dict = self._get_func_and_config(section_path_str)
-            func = self._get_one_func_with_config(section_path_str)
+            if self._is_specific_class(func_or_class):
+                klass, config_dict = self._get_class_and_config(section_path_str)
+                obj = self._get_one_obj_with_config(section_path_str)
+                registrar = self._specific_class_registrar_map[klass]
+                func = getattr(obj, registrar.execute_attr)
+                kind = 'class'
+            elif inspect.isclass(func_or_class):
+                _, config_dict = self._get_func_and_config(section_path_str)
+                func = self._get_one_obj_with_config(section_path_str)
+                kind = 'class'
+            elif callable(func_or_class):
+                _, config_dict = self._get_func_and_config(section_path_str)
+                func = self._get_one_func_with_config(section_path_str)
+                kind = 'function'
+            else:
+                raise ValueError(f'could not run section {section_path_str}. expected PipelineCollection or '
+                                 f'function or class,'
+                                 f'got {func_or_class} of type {type(func_or_class)}')
 
-            logger.info(f'Running function {section_path_str}({dict_as_function_kwarg_str(config_dict)})')
-            result = func()
-            logger.info(f'Result:\n{result}\n')
+        return RunTask(
+            SectionPath.join(self._manager_name, section_path_str).path_str,
+            func,
+            run_description(kind, section_path_str, config_dict),
+            frames=frames,
+        )
+
+    def _run_one_func(self, section_path_str: str, only_stale: bool = False) -> Result:
+        with StackTracker(section_path_str, base_section_path_str=self._manager_name):
+            func, config_dict = self._get_func_and_config(section_path_str)
+            result = self._run_or_get_cached_result(
+                section_path_str,
+                func,
+                config_dict,
+                'function',
+                lambda: self._get_one_func_with_config(section_path_str),
+                only_stale=only_stale,
+            )
         self._add_to_config_dependencies_if_necessary(section_path_str)
         return result
 
-    def _run_one_class(self, section_path_str: str) -> Result:
+    def _run_one_class(self, section_path_str: str, only_stale: bool = False) -> Result:
         with StackTracker(section_path_str, base_section_path_str=self._manager_name):
             klass, config_dict = self._get_func_and_config(section_path_str)
-            obj = self._get_one_obj_with_config(section_path_str)
-
-            logger.info(f'Running class {section_path_str}({dict_as_function_kwarg_str(config_dict)})')
-            result = obj()
-            logger.info(f'Result:\n{result}\n')
+            result = self._run_or_get_cached_result(
+                section_path_str,
+                klass,
+                config_dict,
+                'class',
+                lambda: self._get_one_obj_with_config(section_path_str),
+                only_stale=only_stale,
+            )
         self._add_to_config_dependencies_if_necessary(section_path_str)
         return result
 
-    def _run_one_specific_class(self, section_path_str: str) -> Result:
+    def _run_one_specific_class(self, section_path_str: str, only_stale: bool = False) -> Result:
         with StackTracker(section_path_str, base_section_path_str=self._manager_name):
             klass, config_dict = self._get_class_and_config(section_path_str)
-            obj = self._get_one_obj_with_config(section_path_str)
-            registrar = self._specific_class_registrar_map[klass]
-            execute_attr = registrar.execute_attr
-            func = getattr(obj, execute_attr)
-
-            logger.info(f'Running class {section_path_str}({dict_as_function_kwarg_str(config_dict)})')
-            result = func()
-            logger.info(f'Result:\n{result}\n')
+
+            def get_execute_func():
+                obj = self._get_one_obj_with_config(section_path_str)
+                registrar = self._specific_class_registrar_map[klass]
+                return getattr(obj, registrar.execute_attr)
+
+            result = self._run_or_get_cached_result(
+                section_path_str,
+                klass,
+                config_dict,
+                'class',
+                get_execute_func,
+                only_stale=only_stale,
+            )
         self._add_to_config_dependencies_if_necessary(section_path_str)
         return result
 
+    def _run_or_get_cached_result(self, section_path_str: str, func_or_class: Any, config_dict: dict,
+                                  kind: str, get_run_func: Callable[[], Callable], only_stale: bool = False) -> Result:
+        description = run_description(kind, section_path_str, config_dict)
+        if only_stale:
+            is_up_to_date, result = self._get_up_to_date_result(section_path_str, func_or_class, config_dict)
+            if is_up_to_date:
+                logger.info('Using last result of %s as it is up to date', description)
+                return result
+
+        found, result = self._get_cached_result(section_path_str, func_or_class, config_dict)
+        if found:
+            logger.info('Using cached result of %s', description)
+            log_result(result)
+            return result
+
+        run_func = get_run_func()
+        logger.info('Running %s', description)
+        result = run_func()
+        log_result(result)
+        self._store_result(section_path_str, result, func_or_class, config_dict)
+        if only_stale:
+            self._record_run_state(section_path_str, func_or_class, config_dict, result)
+        return result
+
+    def _get_cached_result(self, section_path_str: str, func_or_class: Any, config_dict: dict) -> Tuple[bool, Result]:
+        """
+        Looks up the result of an item in the result cache. When not found, the key is kept
+        so that the result can be stored by _store_result after running the item.
+
+        :return: whether the result was found, and the result
+        """
+        result_key = get_result_key(self, section_path_str, func_or_class, config_dict)
+        found, result = result_cache.get(result_key)
+        if not found and result_key is not None:
+            self._pending_result_keys[section_path_str] = (result_key, config_dependencies_state())
+        return found, result
+
+    def _store_result(self, section_path_str: str, result: Result, func_or_class: Optional[Any] = None,
+                      config_dict: Optional[dict] = None) -> None:
+        """
+        Stores the result of an item in the result cache, if it was looked up and should be cached
+        """
+        pending = self._pending_result_keys.pop(section_path_str, None)
+        if pending is None:
+            return
+        result_key, dependencies_state = pending
+        if config_dependencies_state() != dependencies_state:
+            # Items got while running have now been recorded as dependencies, so must be included
+            if func_or_class is None or config_dict is None:
+                func_or_class, config_dict = self._get_func_or_class_and_config(section_path_str)
+            result_key = get_result_key(self, section_path_str, func_or_class, config_dict)
+        result_cache.set(result_key, result)
+
+    def _get_up_to_date_result(self, section_path_str: str, func_or_class: Any,
+                               config_dict: dict) -> Tuple[bool, Result]:
+        """
+        :return: whether the item is up to date, and if so its last result
+        """
+        if section_path_str not in self._run_states:
+            return False, None
+        fingerprint = get_item_key(self, section_path_str, func_or_class, config_dict)
+        last_fingerprint, last_result = self._run_states[section_path_str]
+        if fingerprint is None or fingerprint != last_fingerprint:
+            return False, None
+        return True, last_result
+
+    def _record_run_state(self, section_path_str: str, func_or_class: Any, config_dict: dict,
+                          result: Result) -> None:
+        # Items got while running have now been recorded as dependencies, so are included
+        fingerprint = get_item_key(self, section_path_str, func_or_class, config_dict)
+        if fingerprint is None:
+            self._run_states.pop(section_path_str, None)
+        else:
+            self._run_states[section_path_str] = (fingerprint, result)
+
     def get(self, section_path_str: str):
         logger.debug(f'Getting {section_path_str} in runner')
         func_or_collection = self._get_func_or_collection(section_path_str)
@@ -296,9 +628,18 @@ class Runner(ReprMixin):
 
         return results
 
+    @property
+    def loaded_objects(self) -> LoadedObjectCache:
+        """
+        Configured functions and objects which have been loaded, with their count,
+        approximate size and stats including evictions
+        """
+        return self._loaded_objects
+
     def _get_one_func_with_config(self, section_path_str: str) -> Callable:
-        if section_path_str in self._loaded_objects:
-            return self._loaded_objects[section_path_str]
+        loaded = self._loaded_objects.get(section_path_str)
+        if loaded is not None:
+            return loaded
 
         func, config_dict = self._get_func_and_config(section_path_str)
 
@@ -310,8 +651,9 @@ class Runner(ReprMixin):
         return full_func
 
     def _get_one_obj_with_config(self, section_path_str: str) -> Any:
-        if section_path_str in self._loaded_objects:
-            return self._loaded_objects[section_path_str]
+        loaded = self._loaded_objects.get(section_path_str)
+        if loaded is not None:
+            return loaded
 
         obj = self._get_func_or_collection(section_path_str)
         klass, config_dict = self._get_class_and_config(section_path_str)
@@ -326,31 +668,27 @@ class Runner(ReprMixin):
 
         return obj
 
-    def _get_config(self, section_path_str: str) -> ActiveFunctionConfig:
+    def _get_config(self, section_path_str: str) -> ResolvedConfig:
         config = self._config.get(section_path_str)
         if config is None:
             raise ConfigManagerNotLoadedException('no config to get')
         return config
 
     def _get_func_or_collection(self, section_path_str: str) -> FunctionOrCollection:
-        section_path = SectionPath(section_path_str)
-        registrar_name = section_path[0]
+        registrar_name, _, lookup_in_registrar_section_path_str = section_path_str.partition('.')
 
         # Check for specific class dict matching name
-        for registrar in self._registrars:
-            if registrar.name == registrar_name:
-                lookup_in_registrar_section_path = SectionPath.from_section_str_list(section_path[1:]).path_str
-                if not lookup_in_registrar_section_path:
-                    # Was looking up registrar collection itself
-                    return registrar.collection
-                # Looking up within registrar
-                return registrar.get(lookup_in_registrar_section_path)
+        registrar = self._registrar_map.get(registrar_name)
+        if registrar is not None:
+            if not lookup_in_registrar_section_path_str:
+                # Was looking up registrar collection itself
+                return registrar.collection
+            # Looking up within registrar
+            return registrar.get(lookup_in_registrar_section_path_str)
 
         # Try to return from general registrar
         return self._general_registrar.get(section_path_str)
 
-        # raise NoRegistrarWithNameException(registrar_name)
-
     def _get_func_and_config(self, section_path_str: str) -> Tuple[Callable, dict]:
         config = self._get_config(section_path_str)
         func = self._get_func_or_collection(section_path_str)
@@ -361,6 +699,14 @@ class Runner(ReprMixin):
 
         return func, config_dict
 
+    def _get_func_or_class_and_config(self, section_path_str: str,
+                                      func_or_class: Optional[Any] = None) -> Tuple[Any, dict]:
+        if func_or_class is None:
+            func_or_class = self._get_func_or_collection(section_path_str)
+        if self._is_specific_class(func_or_class):
+            return self._get_class_and_config(section_path_str)
+        return self._get_func_and_config(section_path_str)
+
     def _get_class_and_config(self, section_path_str: str) -> Tuple[Type, dict]:
         config = self._get_config(section_path_str)
         obj = self._get_func_or_collection(section_path_str)
@@ -378,9 +724,14 @@ class Runner(ReprMixin):
     def update(self, d_: dict=None, section_path_str: str=None, pyfileconf_persist: bool = True, **kwargs):
         new_config, updated = self._config.update(d_, section_path_str, pyfileconf_persist=pyfileconf_persist, **kwargs)
 
-        if updated and section_path_str in self._loaded_objects:
-            apply_config(self._loaded_objects[section_path_str], new_config)
-            self._config.track_post_update(new_config, section_path_str, d_, **kwargs)
+        if not self._is_or_was_loaded(updated, section_path_str):
+            return
+        loaded = self._loaded_objects.peek(section_path_str)
+        if loaded is not None:
+            # Apply the resolved config so that values inherited from sections are kept
+            apply_config(loaded, self._get_config(section_path_str))
+        # Updates are passed as a dict as config keys may clash with argument names
+        self._config.track_post_update(new_config, section_path_str, {**(d_ or {}), **kwargs})
 
     def reset(self, section_path_str: str=None, allow_create: bool = False) -> None:
         """
@@ -388,17 +739,70 @@ class Runner(ReprMixin):
         is passed, resets local config.
         """
         default, updated = self._config.reset(section_path_str=section_path_str, allow_create=allow_create)
-        if updated and section_path_str in self._loaded_objects:
-            apply_config(self._loaded_objects[section_path_str], default)
-            self._config.track_post_update(default, section_path_str, **default)
+        if not self._is_or_was_loaded(updated, section_path_str):
+            return
+        loaded = self._loaded_objects.peek(section_path_str)
+        if loaded is not None:
+            apply_config(loaded, self._get_config(section_path_str))
+        self._config.track_post_update(default, section_path_str, dict(default))
 
     def refresh(self, section_path_str: str):
         config, updated, updates = self._config.refresh(section_path_str)
 
-        if updated and section_path_str in self._loaded_objects:
+        if not self._is_or_was_loaded(updated, section_path_str):
+            return
+        loaded = self._loaded_objects.peek(section_path_str)
+        if loaded is not None:
             config = self._get_config(section_path_str)
-            apply_config(self._loaded_objects[section_path_str], config)
-            self._config.track_post_update(config, section_path_str, updates)
+            apply_config(loaded, config)
+        self._config.track_post_update(config, section_path_str, updates)
+
+    def _is_or_was_loaded(self, updated: bool, section_path_str: str) -> bool:
+        """
+        Whether post-update hooks should run for a changed config. Objects which were never loaded
+        do not need them, but evicted objects are configured when loaded again while the
+        configs which depend on them must still be refreshed.
+        """
+        if not updated:
+            return False
+        return section_path_str in self._loaded_objects or self._loaded_objects.was_evicted(section_path_str)
+
+    def set_registrars(self, registrars: Sequence[Registrar], general_registrar: PipelineRegistrar):
+        """
+        Sets the registrars from which items are looked up. Already loaded objects are kept.
+        """
+        self._registrars = registrars
+        self._general_registrar = general_registrar
+        self._all_specific_classes = tuple([registrar.klass for registrar in self._registrars])
+        self._specific_class_registrar_map = {registrar.klass: registrar for registrar in self._registrars}
+        # First registrar with each name, matching the order in which registrars are searched
+        self._registrar_map: Dict[str, Registrar] = {}
+        for registrar in self._registrars:
+            self._registrar_map.setdefault(registrar.name, registrar)
+            # Build path indices now rather than on the first lookup
+            registrar.collection.path_index
+        self._general_registrar.collection.path_index
+
+    def drop_loaded_objects(self, section_path_strs: Iterable[str]) -> List[str]:
+        """
+        Removes loaded objects so that they will be created again with the current config
+        the next time they are accessed
+
+        :param section_path_strs: section paths of items or sections to drop. An empty
+            section path drops all loaded objects
+        :return: section paths of objects which were dropped
+        """
+        prefixes = set(section_path_strs)
+        if '' in prefixes:
+            dropped = list(self._loaded_objects)
+        else:
+            dropped = [
+                section_path_str for section_path_str in self._loaded_objects
+                if _is_in_any_section_path(section_path_str, prefixes)
+            ]
+        for section_path_str in dropped:
+            del self._loaded_objects[section_path_str]
+        return dropped
 
     def _is_specific_class(self, obj: Any) -> bool:
         return self._all_specific_classes and isinstance(obj, self._all_specific_classes)  # type: ignore
@@ -412,3 +816,10 @@ class Runner(ReprMixin):
         full_sp_str = SectionPath.join(self._manager_name, section_path_str).path_str
         obj._section_path_str = full_sp_str
 
+
+def _fill_plan_with_results(plan: RunPlan, task_results: Results) -> ResultOrResults:
+    if isinstance(plan, list):
+        return [_fill_plan_with_results(sub_plan, task_results) for sub_plan in plan]
+    if isinstance(plan, _UpToDateResult):
+        return plan.result
+    return task_results[plan]
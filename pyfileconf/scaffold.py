@@ -0,0 +1,270 @@
+import inspect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Any, Sequence, Dict, Optional
+
+from pyfileconf.basemodels.collection import Collection
+from pyfileconf.basemodels.registrar import Registrar
+from pyfileconf.io.file.fingerprint import FileFingerprint, file_fingerprint
+from pyfileconf.io.file.manifest import ScaffoldManifest, ScaffoldInputs
+from pyfileconf.io.file.write.deferred import defer_config_file_writes, write_config_file
+from pyfileconf.logger.logger import logger
+from pyfileconf.opts import options
+from pyfileconf.profile import profile_phase, record_phase, is_profiling, PHASE_SCAFFOLD, \
+    PHASE_SCAFFOLD_COLLECTION, PHASE_SCAFFOLD_ITEM
+
+ScaffoldTask = Tuple[Collection, Any]
+
+
+class ScaffoldSummary:
+    """
+    Result of scaffolding config files for registrars. Counts are stored in
+    registrar order so that the summary is the same no matter how many workers were used.
+    """
+
+    def __init__(self, file_counts: List[Tuple[str, int]], workers: int, num_unchanged: int = 0):
+        """
+        :param file_counts: number of config files written for each registrar
+        :param workers: number of workers used to write the config files
+        :param num_unchanged: number of config files skipped as their inputs did not change
+        """
+        self.file_counts = file_counts
+        self.workers = workers
+        self.num_unchanged = num_unchanged
+
+    @property
+    def total(self) -> int:
+        return sum(count for _, count in self.file_counts)
+
+    def __str__(self) -> str:
+        registrar_strs = ', '.join(f'{name}: {count}' for name, count in self.file_counts)
+        return f'Scaffolded {self.total} config files using {self.workers} workers ({registrar_strs}), ' \
+               f'{self.num_unchanged} unchanged'
+
+    def __repr__(self) -> str:
+        return f'<ScaffoldSummary(total={self.total}, workers={self.workers}, file_counts={self.file_counts}, ' \
+               f'num_unchanged={self.num_unchanged})>'
+
+
+class ConfigScaffolder:
+    """
+    Outputs config files for all the items in registrars, optionally fanning out the
+    per-item work across a process pool.
+
+    Folders and section config files are always created up front in the calling process.
+    Creating the contents of config files extracts arguments and executes the existing config
+    files, which imports modules and uses the global context, so with multiple workers it is done
+    in separate processes, which must be able to pickle the items. The contents are then written
+    out serially by the calling process. Items which output to the same file are handled together
+    in their original order, so the final file contents are the same as when scaffolding serially.
+
+    When a manifest path is passed, config files whose inputs have not changed since
+    they were last scaffolded are skipped.
+    """
+
+    def __init__(self, registrars: Sequence[Registrar], workers: Optional[int] = None,
+                 manifest_path: Optional[str] = None):
+        """
+        :param registrars: registrars to scaffold config for, in order
+        :param workers: number of processes to use to create config files, defaults to the
+            scaffold_workers option. 1 scaffolds serially in the calling process
+        :param manifest_path: file in which to track scaffolded config files, to skip
+            unchanged files. Pass None to always scaffold all files
+        """
+        if workers is None:
+            workers = options.scaffold_workers
+        if workers < 1:
+            raise ValueError(f'must have at least one scaffold worker, got {workers}')
+
+        self.registrars = registrars
+        self.workers = workers
+        self.manifest_path = manifest_path
+
+    def scaffold(self) -> ScaffoldSummary:
+        prior_manifest: Optional[ScaffoldManifest] = None
+        manifest: Optional[ScaffoldManifest] = None
+        if self.manifest_path is not None:
+            prior_manifest = ScaffoldManifest.load(self.manifest_path)
+            # Keep entries for files of other registrars, which may not be scaffolded in this run
+            manifest = ScaffoldManifest(self.manifest_path, dict(prior_manifest.entries))
+
+        # Group by output file, keeping track of which registrar first outputs each file
+        tasks_by_filepath: Dict[str, List[ScaffoldTask]] = {}
+        registrar_idx_by_filepath: Dict[str, int] = {}
+        for i, registrar in enumerate(self.registrars):
+            for collection, item in registrar.collection._config_output_items():
+                filepath = collection._config_filepath_for(item)
+                tasks_by_filepath.setdefault(filepath, []).append((collection, item))
+                registrar_idx_by_filepath.setdefault(filepath, i)
+
+        source_fingerprints: Dict[str, Optional[FileFingerprint]] = {}
+        inputs_by_filepath: Dict[str, Optional[ScaffoldInputs]] = {}
+        output_filepaths: List[str] = []
+        for filepath, tasks in tasks_by_filepath.items():
+            if prior_manifest is not None:
+                inputs = _get_inputs_for_tasks(tasks, source_fingerprints)
+                inputs_by_filepath[filepath] = inputs
+                if prior_manifest.is_current(filepath, inputs):
+                    continue
+            output_filepaths.append(filepath)
+
+        with profile_phase(PHASE_SCAFFOLD):
+            if self.workers == 1:
+                seconds_by_filepath = [
+                    _output_config_files_for_filepath(filepath, tasks_by_filepath) for filepath in output_filepaths
+                ]
+            else:
+                seconds_by_filepath = self._output_config_files_in_processes(output_filepaths, tasks_by_filepath)
+
+        if is_profiling():
+            seconds_by_registrar = [0.0] * len(self.registrars)
+            for filepath, seconds in zip(output_filepaths, seconds_by_filepath):
+                seconds_by_registrar[registrar_idx_by_filepath[filepath]] += seconds
+            for registrar, seconds in zip(self.registrars, seconds_by_registrar):
+                record_phase(PHASE_SCAFFOLD_COLLECTION, seconds, _registrar_display_name(registrar))
+
+        if manifest is not None:
+            # Drop entries for removed items so that the manifest does not grow without bound
+            manifest.prune([_registrar_display_name(registrar) for registrar in self.registrars], tasks_by_filepath)
+            for filepath, inputs in inputs_by_filepath.items():
+                registrar_name = _registrar_display_name(self.registrars[registrar_idx_by_filepath[filepath]])
+                manifest.record(filepath, inputs, registrar_name)
+            manifest.save()
+
+        counts = [0] * len(self.registrars)
+        for filepath in output_filepaths:
+            counts[registrar_idx_by_filepath[filepath]] += len(tasks_by_filepath[filepath])
+        file_counts = [
+            (_registrar_display_name(registrar), count) for registrar, count in zip(self.registrars, counts)
+        ]
+        num_unchanged = sum(len(tasks) for tasks in tasks_by_filepath.values()) - sum(counts)
+        summary = ScaffoldSummary(file_counts, self.workers, num_unchanged=num_unchanged)
+        logger.debug(str(summary))
+        return summary
+
+    def _output_config_files_in_processes(self, output_filepaths: List[str],
+                                          tasks_by_filepath: Dict[str, List[ScaffoldTask]]) -> List[float]:
+        """
+        Creates the contents of the config files in a process pool and writes them in order
+
+        :return: seconds taken to create each file
+        """
+        # Several chunks per worker to balance the load, each contiguous so that the collections
+        # shared by neighboring items are only pickled once per chunk
+        chunks = _split_into_chunks(output_filepaths, self.workers * 4)
+        seconds_by_filepath: List[float] = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(_render_config_files, [(filepath, tasks_by_filepath[filepath]) for filepath in chunk])
+                for chunk in chunks
+            ]
+            # Consume results in order so that any error is raised for the first failing item
+            for chunk, future in zip(chunks, futures):
+                for filepath, (contents, seconds) in zip(chunk, future.result()):
+                    if contents is not None:
+                        write_config_file(filepath, contents)
+                    record_phase(PHASE_SCAFFOLD_ITEM, seconds, filepath)
+                    seconds_by_filepath.append(seconds)
+        return seconds_by_filepath
+
+
+def _output_config_files_for_filepath(filepath: str, tasks_by_filepath: Dict[str, List[ScaffoldTask]]) -> float:
+    """
+    Output the config file at filepath for all the items which output to it
+
+    :return: seconds taken when profiling, otherwise 0
+    """
+    with profile_phase(PHASE_SCAFFOLD_ITEM, filepath) as timer:
+        for collection, item in tasks_by_filepath[filepath]:
+            collection._output_config_file(item)
+    return timer.seconds
+
+
+def _render_config_files(filepaths_and_tasks: List[Tuple[str, List[ScaffoldTask]]]
+                         ) -> List[Tuple[Optional[str], float]]:
+    """
+    Creates the contents of config files in a worker process, leaving writing them to the calling process
+
+    :param filepaths_and_tasks: config file paths and the items which output to each
+    :return: contents and seconds taken for each config file
+    """
+    results: List[Tuple[Optional[str], float]] = []
+    with defer_config_file_writes() as deferred_writes:
+        for filepath, tasks in filepaths_and_tasks:
+            start = time.perf_counter()
+            for i, (collection, item) in enumerate(tasks):
+                if i > 0:
+                    # Following items merge with the file output by the earlier ones
+                    deferred_writes.flush(filepath)
+                collection._output_config_file(item)
+            results.append((deferred_writes.contents.pop(filepath, None), time.perf_counter() - start))
+    return results
+
+
+def _split_into_chunks(values: List[str], num_chunks: int) -> List[List[str]]:
+    chunk_size = max(1, -(-len(values) // num_chunks))
+    return [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+
+def _get_inputs_for_tasks(tasks: List[ScaffoldTask],
+                          source_fingerprints: Dict[str, Optional[FileFingerprint]]) -> Optional[ScaffoldInputs]:
+    """
+    Gets everything which determines the contents of a scaffolded config file, for
+    all the items which output to that file. Returns None if they cannot be determined.
+
+    :param tasks: collections and items which output to the same file
+    :param source_fingerprints: already determined source file fingerprints, will be updated
+    :return:
+    """
+    all_inputs: ScaffoldInputs = []
+    for collection, item in tasks:
+        try:
+            source = collection._config_source_for(item)
+            source_files = _get_source_files(source)
+        except Exception:
+            # Could not import or locate source, so must always scaffold
+            return None
+
+        file_inputs = []
+        for source_file in source_files:
+            if source_file not in source_fingerprints:
+                source_fingerprints[source_file] = file_fingerprint(source_file)
+            fingerprint = source_fingerprints[source_file]
+            if fingerprint is None:
+                return None
+            file_inputs.append([source_file, list(fingerprint)])
+
+        all_inputs.append([
+            file_inputs,
+            getattr(source, '__qualname__', getattr(source, '__name__', None)),
+            list(collection.always_import_strs or []),
+            list(collection.always_assign_strs or []),
+        ])
+    return all_inputs
+
+
+def _get_source_files(source: Any) -> List[str]:
+    """
+    Gets the files defining the source and, for classes, the files defining their base
+    classes, as the extracted arguments may come from an inherited __init__
+    """
+    source_files = [os.path.abspath(inspect.getfile(source))]
+    if not inspect.isclass(source):
+        return source_files
+
+    for base in inspect.getmro(source)[1:]:
+        try:
+            source_file = os.path.abspath(inspect.getfile(base))
+        except TypeError:
+            # Built-in classes are not defined in files
+            continue
+        if source_file not in source_files:
+            source_files.append(source_file)
+    return source_files
+
+
+def _registrar_display_name(registrar: Registrar) -> str:
+    if registrar.name is None:
+        return 'general'
+    return registrar.name
@@ -0,0 +1,331 @@
+"""
+Runs items across pipeline managers in dependency order, using the dependencies pyfileconf
+records in context.config_dependencies when item views are used in configs or while running.
+"""
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor, Future, wait, FIRST_COMPLETED
+from typing import Sequence, Dict, Set, List, Optional, Any, Tuple, Union, TYPE_CHECKING
+
+from pyfileconf.basemodels.collection import Collection
+from pyfileconf.exceptions.config import ConfigDependencyCycleException
+from pyfileconf.logger.logger import logger
+from pyfileconf.logic.combine import combine_items_into_list_whether_they_are_lists_or_not
+from pyfileconf.plugin import manager as plugin_manager
+from pyfileconf.runner.models.executor import (
+    EXECUTOR_THREAD,
+    EXECUTOR_PROCESS,
+    EXECUTOR_SERIAL,
+    RunTask,
+    run_task,
+    validate_executor,
+)
+from pyfileconf.runner.models.interfaces import Result, RunnerArgs
+from pyfileconf.runner.models.resultcache import memoize_result_keys
+from pyfileconf.runner.models.runner import _UpToDateResult
+from pyfileconf.sectionpath.sectionpath import SectionPath, _is_in_any_section_path
+
+if TYPE_CHECKING:
+    from pyfileconf.main import PipelineManager
+
+
+class SchedulePlan:
+    """
+    Items to run along with the items each one depends on, grouped into stages
+    where every item only depends on items in earlier stages
+    """
+
+    def __init__(self, dependencies: Dict[str, Set[str]]):
+        """
+        :param dependencies: full section paths of items to run, in requested order, with
+            the full section paths of the items to run which each one depends on
+        :raises ConfigDependencyCycleException: when items depend on each other
+        """
+        self.dependencies = dependencies
+        self.dependents: Dict[str, List[str]] = {item: [] for item in dependencies}
+        for item, depends_on in dependencies.items():
+            for dependency in depends_on:
+                self.dependents[dependency].append(item)
+        self.stages = self._get_stages()
+
+    def __repr__(self):
+        return f'<SchedulePlan(stages={self.stages})>'
+
+    def __str__(self):
+        return self.report()
+
+    @property
+    def items(self) -> List[str]:
+        return [item for stage in self.stages for item in stage]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            stages=[list(stage) for stage in self.stages],
+            dependencies={item: sorted(depends_on) for item, depends_on in self.dependencies.items()},
+        )
+
+    def report(self) -> str:
+        lines = [f'Schedule of {len(self.dependencies)} items in {len(self.stages)} stages:']
+        for i, stage in enumerate(self.stages):
+            lines.append(f'  Stage {i + 1}:')
+            for item in stage:
+                depends_on = self.dependencies[item]
+                if depends_on:
+                    lines.append(f'    {item} (after {", ".join(sorted(depends_on))})')
+                else:
+                    lines.append(f'    {item}')
+        return '\n'.join(lines)
+
+    def _get_stages(self) -> List[List[str]]:
+        # Kahn's algorithm, keeping requested order within each stage
+        num_remaining_deps = {item: len(depends_on) for item, depends_on in self.dependencies.items()}
+        stage = [item for item, num_deps in num_remaining_deps.items() if num_deps == 0]
+        stages: List[List[str]] = []
+        num_scheduled = 0
+        order = {item: i for i, item in enumerate(self.dependencies)}
+        while stage:
+            stages.append(stage)
+            num_scheduled += len(stage)
+            next_stage: List[str] = []
+            for item in stage:
+                for dependent in self.dependents[item]:
+                    num_remaining_deps[dependent] -= 1
+                    if num_remaining_deps[dependent] == 0:
+                        next_stage.append(dependent)
+            stage = sorted(next_stage, key=order.__getitem__)
+
+        if num_scheduled != len(self.dependencies):
+            in_cycle = [item for item, num_deps in num_remaining_deps.items() if num_deps > 0]
+            raise ConfigDependencyCycleException(f'items depend on each other: {in_cycle}')
+        return stages
+
+
+class Scheduler:
+    """
+    Runs items across pipeline managers so that each item runs after the items it depends on,
+    running independent items in parallel
+
+    Dependencies come from context.config_dependencies. Configs of all the items are loaded
+    when planning so that dependencies on item views in config files are known, but
+    dependencies on items which are only got while running are only known after a run.
+
+    Items are configured in the calling thread as they become ready, only the configured
+    items are run in the pool. Items with a result in the result cache are not run.
+
+    Plugin pre-run hooks are called for each manager with its section paths when planning,
+    and post-run hooks with a list of its results after running. Additional results returned
+    by post-run hooks are not included, as results are keyed by the section paths of the items.
+    """
+
+    def __init__(self, section_path_strs: RunnerArgs, executor: str = EXECUTOR_THREAD,
+                 workers: Optional[int] = None):
+        """
+        :param section_path_strs: full section paths of items or sections to run, including
+            the manager names, or item views
+        :param executor: 'thread' or 'process' to run independent items in a pool, or 'serial'
+            to run them one after another in the calling thread
+        :param workers: number of threads or processes, defaults to the pool's default
+        """
+        validate_executor(executor, workers)
+        if not isinstance(section_path_strs, (list, tuple)):
+            section_path_strs = [section_path_strs]  # type: ignore
+        self.section_paths = [SectionPath.from_ambiguous(sp) for sp in section_path_strs]
+        self.executor = executor
+        self.workers = workers
+
+    def plan(self) -> SchedulePlan:
+        """
+        Calls the pre-run hooks, expands sections into their items, loads configs and orders
+        the items by their dependencies
+
+        :raises ConfigDependencyCycleException: when items depend on each other
+        """
+        items = self._get_items(self._get_section_paths_with_pre_run_hooks())
+        for item in items:
+            manager, relative_section_path_str = _get_manager_and_relative_section_path_str(item)
+            # Loading the config records dependencies on item views in config files
+            manager.config.get(relative_section_path_str)
+        return SchedulePlan(_get_dependencies(items))
+
+    def run(self, plan: Optional[SchedulePlan] = None) -> Dict[str, Result]:
+        """
+        Runs all the items, each after the items it depends on
+
+        :param plan: plan to run, creates a new plan if not passed
+        :return: results by full section path, in the order the items were run
+        """
+        if plan is None:
+            plan = self.plan()
+        logger.info(plan.report())
+        # Keys of upstream items are reused by all the items they are upstream of
+        with memoize_result_keys():
+            if self.executor == EXECUTOR_SERIAL or not plan.stages:
+                results = self._run_serial(plan)
+            else:
+                results = self._run_in_pool(plan)
+        self._call_post_run_hooks(results)
+        return results
+
+    def _run_serial(self, plan: SchedulePlan) -> Dict[str, Result]:
+        results: Dict[str, Result] = {}
+        for item in plan.items:
+            task_or_result = self._get_task_or_result(item)
+            if isinstance(task_or_result, _UpToDateResult):
+                result = task_or_result.result
+            else:
+                result = run_task(task_or_result)
+            results[item] = result
+            self._finish_item(item, result)
+        return results
+
+    def _run_in_pool(self, plan: SchedulePlan) -> Dict[str, Result]:
+        pool: Executor
+        if self.executor == EXECUTOR_PROCESS:
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        results: Dict[str, Result] = {}
+        num_remaining_deps = {item: len(depends_on) for item, depends_on in plan.dependencies.items()}
+        ready = list(plan.stages[0])
+
+        def finish(item: str, result: Result) -> None:
+            results[item] = result
+            self._finish_item(item, result)
+            for dependent in plan.dependents[item]:
+                num_remaining_deps[dependent] -= 1
+                if num_remaining_deps[dependent] == 0:
+                    ready.append(dependent)
+
+        with pool:
+            running: Dict[Future, str] = {}
+            while ready or running:
+                while ready:
+                    item = ready.pop(0)
+                    task_or_result = self._get_task_or_result(item)
+                    if isinstance(task_or_result, _UpToDateResult):
+                        # Cached, so dependents can start without waiting for the pool
+                        finish(item, task_or_result.result)
+                    else:
+                        running[pool.submit(run_task, task_or_result)] = item
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = running.pop(future)
+                    try:
+                        result = future.result()
+                    except BaseException:
+                        for other_future in running:
+                            other_future.cancel()
+                        raise
+                    finish(item, result)
+        return results
+
+    def _get_section_paths_with_pre_run_hooks(self) -> List[SectionPath]:
+        relative_section_path_strs_by_manager: Dict[str, Tuple['PipelineManager', List[str]]] = {}
+        for section_path in self.section_paths:
+            manager, relative_section_path_str = _get_manager_and_relative_section_path_str(section_path.path_str)
+            relative_section_path_strs_by_manager.setdefault(
+                manager.name, (manager, [])
+            )[1].append(relative_section_path_str)
+
+        section_path_strs: List[str] = []
+        for manager, relative_section_path_strs in relative_section_path_strs_by_manager.values():
+            # Hooks may modify the list in place or return additional items to run
+            additional_items = plugin_manager.plm.hook.pyfileconf_pre_run(
+                section_path_str_or_list=relative_section_path_strs, pm=manager
+            )
+            for additional in additional_items:
+                relative_section_path_strs = combine_items_into_list_whether_they_are_lists_or_not(
+                    relative_section_path_strs, additional
+                )
+            section_path_strs.extend(
+                SectionPath.from_ambiguous(
+                    section_path_str, strip_manager_from_iv=True, base_section_path_str=manager.name
+                ).path_str
+                for section_path_str in relative_section_path_strs
+            )
+
+        # Keep the requested order, followed by the items added by hooks
+        requested = [section_path.path_str for section_path in self.section_paths]
+        requested_set = set(requested)
+        after_hooks = set(section_path_strs)
+        ordered = [sp for sp in requested if sp in after_hooks]
+        ordered.extend(sp for sp in section_path_strs if sp not in requested_set)
+        return [SectionPath(sp) for sp in dict.fromkeys(ordered)]
+
+    def _call_post_run_hooks(self, results: Dict[str, Result]) -> None:
+        items_by_manager: Dict[str, Tuple['PipelineManager', List[str]]] = {}
+        for item in results:
+            manager, _ = _get_manager_and_relative_section_path_str(item)
+            items_by_manager.setdefault(manager.name, (manager, []))[1].append(item)
+
+        for manager, items in items_by_manager.values():
+            manager_results = [results[item] for item in items]
+            plugin_manager.plm.hook.pyfileconf_post_run(results=manager_results, runner=manager.runner)
+            # Hooks may modify the results in place
+            for item, result in zip(items, manager_results):
+                results[item] = result
+
+    def _get_items(self, section_paths: Sequence[SectionPath]) -> List[str]:
+        items: List[str] = []
+        for section_path in section_paths:
+            manager, relative_section_path_str = _get_manager_and_relative_section_path_str(section_path.path_str)
+            func_or_collection = manager.runner._get_func_or_collection(relative_section_path_str)
+            if not isinstance(func_or_collection, Collection):
+                items.append(section_path.path_str)
+                continue
+            for nested_path, nested_item in func_or_collection.path_index.items():
+                if not isinstance(nested_item, Collection):
+                    items.append(f'{section_path.path_str}.{nested_path}')
+        # Remove duplicates, keeping the first position
+        return list(dict.fromkeys(items))
+
+    def _get_task_or_result(self, item: str) -> Union[RunTask, _UpToDateResult]:
+        manager, relative_section_path_str = _get_manager_and_relative_section_path_str(item)
+        return manager.runner._get_run_task_or_result(relative_section_path_str)
+
+    def _finish_item(self, item: str, result: Result) -> None:
+        manager, relative_section_path_str = _get_manager_and_relative_section_path_str(item)
+        manager.runner._store_result(relative_section_path_str, result)
+        manager.runner._add_to_config_dependencies_if_necessary(relative_section_path_str)
+
+
+def _get_manager_and_relative_section_path_str(section_path_str: str) -> Tuple['PipelineManager', str]:
+    from pyfileconf.main import PipelineManager
+
+    manager = PipelineManager.get_manager_by_section_path_str(section_path_str)
+    relative_section_path_str = SectionPath.from_section_str_list(SectionPath(section_path_str)[1:]).path_str
+    return manager, relative_section_path_str
+
+
+def _get_dependencies(items: Sequence[str]) -> Dict[str, Set[str]]:
+    """
+    Gets the items each item depends on, including through items which are not being run
+    """
+    from pyfileconf import context
+
+    depends_on_by_dependent: Dict[str, Set[str]] = {}
+    for depends_on, dependents in context.config_dependencies.items():
+        for dependent in dependents:
+            depends_on_by_dependent.setdefault(dependent.path_str, set()).add(depends_on)
+
+    item_set = set(items)
+    dependencies: Dict[str, Set[str]] = {}
+    for item in items:
+        item_dependencies: Set[str] = set()
+        seen: Set[str] = {item}
+        to_visit = list(depends_on_by_dependent.get(item, ()))
+        while to_visit:
+            depends_on = to_visit.pop()
+            if depends_on in seen:
+                continue
+            seen.add(depends_on)
+            # Dependency may be a section containing items being run
+            item_dependencies.update(
+                other for other in item_set if other != item and _is_in_any_section_path(other, {depends_on})
+            )
+            if depends_on not in item_set:
+                # Not being run, but may itself depend on items being run
+                to_visit.extend(depends_on_by_dependent.get(depends_on, ()))
+        dependencies[item] = item_dependencies
+    return dependencies
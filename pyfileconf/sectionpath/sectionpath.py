@@ -1,4 +1,7 @@
-from typing import List, Union, TYPE_CHECKING, Sequence, Optional, cast
+import sys
+import threading
+import weakref
+from typing import List, Union, TYPE_CHECKING, Sequence, Optional, cast, Set, Tuple
 
 from pyfileconf.interfaces import SectionPathLike
 
@@ -6,26 +9,89 @@ if TYPE_CHECKING:
     from pyfileconf.selector.models.itemview import ItemView
 import os
 
-from mixins.repr import ReprMixin
+from mixins.repr import get_repr
 
 SectionPathOrStr = Union[str, 'SectionPath']
 
-class SectionPath(ReprMixin):
+
+class SectionPath:
+    """
+    Immutable path of sections, e.g. manager.section.item
+
+    Instances are interned, so creating a SectionPath for a path string which already
+    has one returns the existing instance without splitting the string again.
+    """
     repr_cols = ['path_str', 'sections']
+    __slots__ = ('path_str', '_sections', '_parent', '__weakref__')
+
+    _interned: 'weakref.WeakValueDictionary[str, SectionPath]' = weakref.WeakValueDictionary()
+    _intern_lock = threading.Lock()
 
-    def __init__(self, section_path: str):
-        self.path_str = section_path
-        self.sections = _section_path_str_to_section_strs(section_path)
+    path_str: str
+    _sections: Tuple[str, ...]
+    _parent: Optional['SectionPath']
+
+    def __new__(cls, section_path: str):
+        try:
+            return cls._interned[section_path]
+        except KeyError:
+            pass
+
+        self = object.__new__(cls)
+        object.__setattr__(self, 'path_str', section_path)
+        object.__setattr__(
+            self, '_sections', tuple(sys.intern(section) for section in _section_path_str_to_section_strs(section_path))
+        )
+        object.__setattr__(self, '_parent', None)
+        with cls._intern_lock:
+            # Another thread may have created the same path in the meantime, keep the first
+            return cls._interned.setdefault(section_path, self)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, item):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        return type(self), (self.path_str,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return get_repr(self, self.repr_cols)
+
+    @property
+    def sections(self) -> List[str]:
+        return list(self._sections)
+
+    @property
+    def parent(self) -> Optional['SectionPath']:
+        """
+        Section path without the last section, or None if there is only one section
+        """
+        if len(self._sections) < 2:
+            return None
+        parent = self._parent
+        if parent is None:
+            parent = type(self)(self.path_str.rpartition('.')[0])
+            object.__setattr__(self, '_parent', parent)
+        return parent
 
     def __iter__(self):
-        for section in self.sections:
-            yield section
+        return iter(self._sections)
 
     def __getitem__(self, item):
-        return self.sections[item]
+        if isinstance(item, slice):
+            return list(self._sections[item])
+        return self._sections[item]
 
     def __len__(self):
-        return len(self.sections)
+        return len(self._sections)
 
     @classmethod
     def from_filepath(cls, basepath: str, filepath: str):
@@ -91,22 +157,24 @@ class SectionPath(ReprMixin):
         section_path_1 = _convert_to_section_path_if_necessary(section_path_1)
         section_path_2 = _convert_to_section_path_if_necessary(section_path_2)
 
-        output_path_sections = section_path_1.sections + section_path_2.sections
-        return cls.from_section_str_list(output_path_sections)
+        # Joining the sections is the same as joining the strings, and the result is interned
+        return cls(f'{section_path_1.path_str}.{section_path_2.path_str}')
 
     def to_filepath(self, basepath: str):
         relative_path = _section_path_to_relative_filepath(self)
         return os.path.join(basepath, relative_path)
 
+    def startswith(self, sp: 'SectionPath'):
+        num_to_match = len(sp._sections)
+        return self._sections[:num_to_match] == sp._sections
+
     def endswith(self, sp: 'SectionPath'):
-        num_to_match = len(sp)
-        match_parts = self[-num_to_match:]
-        for i, part in enumerate(match_parts):
-            if part != sp[i]:
-                return False
-        return True
+        num_to_match = len(sp._sections)
+        return self._sections[-num_to_match:] == sp._sections
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             return self.path_str == other.path_str
         except AttributeError:
@@ -142,4 +210,16 @@ def _convert_to_section_path_if_necessary(section_path: SectionPathOrStr) -> Sec
     elif isinstance(section_path, str):
         return SectionPath(section_path)
     else:
-        raise ValueError(f'expected SectionPath or str. got {section_path} of type {type(section_path)}')
\ No newline at end of file
+        raise ValueError(f'expected SectionPath or str. got {section_path} of type {type(section_path)}')
+
+
+def _is_in_any_section_path(section_path_str: str, section_path_strs: Set[str]) -> bool:
+    """
+    Whether the section path is one of the passed section paths or within one of them
+    """
+    if section_path_str in section_path_strs:
+        return True
+    sections = _section_path_str_to_section_strs(section_path_str)
+    return any(
+        _section_strs_to_section_path_str(sections[:i]) in section_path_strs for i in range(1, len(sections))
+    )
@@ -64,6 +64,10 @@ class Selector:
         from pyfileconf.selector.models.itemview import ItemView
         return ItemView(item, self)
 
+    def __reduce__(self):
+        # Selectors only refer to the active managers, so unpickle as a new selector
+        return self.__class__, ()
+
     def __dir__(self):
         exposed_methods = [
             'get_type'
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class PyfileconfBase:
     """
     A base class which can be used to autocomplete
@@ -8,6 +11,14 @@ class PyfileconfBase:
     methods can be defined on any class.
     """
 
+    _pyfileconf_cache_result_: Optional[bool] = None
+    """
+    Whether to store the result of running the object in the result cache.
+    None to follow the cache_results option. True marks the object as pure, its
+    result depending only on its config, source and the items it uses, so it is
+    cached even without the option. Can also be set in the config.
+    """
+
     def _pyfileconf_update_(self, **kwargs) -> None:
         """
         Called to apply configuration to the object. If this method
@@ -18,3 +29,14 @@ class PyfileconfBase:
         :return: None
         """
         self.__init__(**kwargs)  # type: ignore
+
+    def _pyfileconf_evict_(self) -> None:
+        """
+        Called when the object is evicted from the loaded objects of a
+        PipelineManager, according to the loaded_objects_policy option.
+        Release any large data held by the object here, it will be
+        configured again before it is next used.
+
+        :return: None
+        """
+        pass
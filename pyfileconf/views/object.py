@@ -10,6 +10,7 @@ from pyfileconf.imports.models.statements.container import ImportStatementContai
 from pyfileconf.io.file.load.parsers.extname import extract_external_name_from_assign_value
 from pyfileconf.io.file.load.parsers.kwargs import extract_keywords_from_ast_by_name
 from pyfileconf.io.func.load.config import FunctionConfigExtractor
+from pyfileconf.profile import profile_phase, PHASE_MODULE_IMPORT
 from mixins.repr import ReprMixin
 
 class ObjectView(SimplePropertyCacheMixin, ReprMixin):
@@ -24,7 +25,8 @@ class ObjectView(SimplePropertyCacheMixin, ReprMixin):
     def load(self):
         # executes import
         if self.import_statement is not None:
-            self._item = _execute_import_get_obj_from_result(self.import_statement, self.name)
+            with profile_phase(PHASE_MODULE_IMPORT, f'{self.import_statement.module}.{self.name}'):
+                self._item = _execute_import_get_obj_from_result(self.import_statement, self.name)
 
         return self._item
 
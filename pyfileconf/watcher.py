@@ -0,0 +1,228 @@
+"""
+Background watching of a PipelineManager's files, so that changes
+can be applied incrementally the next time an item is accessed
+"""
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional, Set, Tuple, Iterable, Dict
+
+from pyfileconf.io.file.fingerprint import FileSnapshot, written_files
+from pyfileconf.logger.logger import logger
+
+if TYPE_CHECKING:
+    from pyfileconf.main import PipelineManager
+
+WATCHER_BACKENDS = ('auto', 'poll', 'inotify')
+
+
+class FileWatcher:
+    """
+    Watches the pipeline dict, specific class dict and config files of a PipelineManager
+    in a background thread, collecting which files changed.
+
+    Changes are only made available once no further changes have been seen for the
+    debounce period, so that many saves in quick succession result in one reload.
+    Files which pyfileconf wrote itself, such as scaffolded configs, are not changes
+    unless they were changed again after being written.
+    Changes to source modules are not watched, call PipelineManager.reload for those.
+
+    :param manager: manager whose files should be watched
+    :param interval: seconds between checks for changes
+    :param debounce: seconds without changes before changes are made available
+    :param backend: 'poll' to check the files with stat, 'inotify' to receive file system
+        events, which requires the inotify_simple package and Linux, or 'auto'
+        to use inotify when it is available and poll otherwise
+    """
+
+    def __init__(self, manager: 'PipelineManager', interval: float = 0.5, debounce: float = 0.2,
+                 backend: str = 'auto'):
+        if backend not in WATCHER_BACKENDS:
+            raise ValueError(f'watcher backend must be one of {WATCHER_BACKENDS}, got {backend}')
+        if backend == 'auto':
+            backend = 'inotify' if _inotify_is_available() else 'poll'
+        elif backend == 'inotify' and not _inotify_is_available():
+            raise ValueError('inotify watcher backend requires the inotify_simple package on Linux')
+
+        self.folder = manager.folder
+        self.config_folder = manager.default_config_path
+        self.dict_filepaths = [
+            manager.pipeline_dict_path,
+            *[os.path.join(manager.folder, f'{name}_dict.py') for name in manager.specific_class_names]
+        ]
+        self.interval = interval
+        self.debounce = debounce
+        self.backend = backend
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._changed_filepaths: Set[str] = set()
+        self._needs_full_check = False
+        self._inotify: Optional[Any] = None
+        self._folders_by_watch: Dict[int, str] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        # Files are snapshot or watched before returning, so that no changes made after starting are missed
+        if self.backend == 'inotify':
+            self._start_inotify()
+            target = self._watch_with_inotify
+            args: tuple = ()
+        else:
+            target = self._watch_with_polling
+            args = (self._snapshot(),)
+        self._thread = threading.Thread(
+            target=target, args=args, name=f'pyfileconf-watcher-{self.folder}', daemon=True
+        )
+        self._thread.start()
+        logger.debug(f'Started watching {self.folder} with {self.backend} backend')
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        :param wait: whether to wait for the watching thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None and wait:
+            self._thread.join()
+        self._thread = None
+        logger.debug(f'Stopped watching {self.folder}')
+
+    def pop_changes(self) -> Tuple[bool, Optional[Set[str]]]:
+        """
+        Get and clear the changes which have been collected
+
+        :return: whether anything changed and the paths of the changed files, which is None
+            when it is not known exactly which files changed so all files should be checked
+        """
+        with self._lock:
+            changed_filepaths: Optional[Set[str]] = self._changed_filepaths
+            has_changes = bool(self._changed_filepaths) or self._needs_full_check
+            if self._needs_full_check:
+                changed_filepaths = None
+            self._changed_filepaths = set()
+            self._needs_full_check = False
+        return has_changes, changed_filepaths
+
+    def _add_changes(self, changed_filepaths: Iterable[str], needs_full_check: bool = False):
+        changed_filepaths = [
+            filepath for filepath in changed_filepaths if not written_files.is_unchanged_since_written(filepath)
+        ]
+        if not changed_filepaths and not needs_full_check:
+            return
+        with self._lock:
+            self._changed_filepaths.update(changed_filepaths)
+            self._needs_full_check = self._needs_full_check or needs_full_check
+
+    def _snapshot(self) -> FileSnapshot:
+        config_snapshot = FileSnapshot.from_folder(self.config_folder)
+        return FileSnapshot({
+            **FileSnapshot.from_files(self.dict_filepaths).fingerprints,
+            **config_snapshot.fingerprints,
+        })
+
+    def _watch_with_polling(self, snapshot: FileSnapshot):
+        pending: Set[str] = set()
+        last_change_time = 0.0
+        while not self._stop_event.wait(self.interval):
+            new_snapshot = self._snapshot()
+            changed = snapshot.diff(new_snapshot).changed
+            snapshot = new_snapshot
+            if changed:
+                pending.update(changed)
+                last_change_time = time.monotonic()
+            elif pending and time.monotonic() - last_change_time >= self.debounce:
+                self._add_changes(pending)
+                pending = set()
+
+    def _start_inotify(self):
+        import inotify_simple
+        self._inotify = inotify_simple.INotify()
+        self._folders_by_watch = {}
+        # Dict files are directly in the manager folder, so only that folder itself is watched
+        self._folders_by_watch[self._inotify.add_watch(self.folder, _inotify_watch_flags())] = self.folder
+        self._add_inotify_watches(self.config_folder)
+
+    def _add_inotify_watches(self, folder: str):
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = [d for d in dirs if not d.startswith(('_', '.'))]
+            self._folders_by_watch[self._inotify.add_watch(root, _inotify_watch_flags())] = root
+
+    def _watch_with_inotify(self):
+        import inotify_simple
+        flags = inotify_simple.flags
+        inotify = self._inotify
+        folders_by_watch = self._folders_by_watch
+
+        pending: Set[str] = set()
+        pending_full_check = False
+        last_change_time = 0.0
+        try:
+            while not self._stop_event.is_set():
+                events = inotify.read(timeout=int(self.interval * 1000))
+                for event in events:
+                    folder = folders_by_watch.get(event.wd)
+                    if folder is None:
+                        continue
+                    filepath = os.path.join(folder, event.name)
+                    if event.mask & (flags.ISDIR | flags.DELETE_SELF):
+                        if not _is_in_folder(filepath, self.config_folder):
+                            # Other folders such as logs are not relevant
+                            continue
+                        # Files inside moved or created folders do not generate their own events
+                        pending_full_check = True
+                        if event.mask & (flags.CREATE | flags.MOVED_TO):
+                            self._add_inotify_watches(filepath)
+                    elif filepath in self.dict_filepaths or self._is_config_filepath(filepath):
+                        pending.add(filepath)
+                    else:
+                        continue
+                    last_change_time = time.monotonic()
+                if (
+                    (pending or pending_full_check) and
+                    not events and
+                    time.monotonic() - last_change_time >= self.debounce
+                ):
+                    self._add_changes(pending, needs_full_check=pending_full_check)
+                    pending = set()
+                    pending_full_check = False
+        finally:
+            inotify.close()
+            self._inotify = None
+
+    def _is_config_filepath(self, filepath: str) -> bool:
+        if not filepath.endswith('.py') or not _is_in_folder(filepath, self.config_folder):
+            return False
+        relative_path = os.path.relpath(filepath, self.config_folder)
+        folders = relative_path.split(os.path.sep)[:-1]
+        return not any(folder.startswith(('_', '.')) for folder in folders)
+
+    def __repr__(self) -> str:
+        return f'<FileWatcher(folder={self.folder}, backend={self.backend}, running={self.is_running})>'
+
+
+def _inotify_watch_flags() -> int:
+    from inotify_simple import flags
+    return (
+        flags.CLOSE_WRITE | flags.CREATE | flags.DELETE | flags.MODIFY |
+        flags.MOVED_FROM | flags.MOVED_TO | flags.DELETE_SELF
+    )
+
+
+def _inotify_is_available() -> bool:
+    try:
+        import inotify_simple
+    except ImportError:
+        return False
+    return hasattr(os, 'uname') and os.uname().sysname == 'Linux'
+
+
+def _is_in_folder(filepath: str, folder: str) -> bool:
+    relative_path = os.path.relpath(filepath, folder)
+    return relative_path != os.pardir and not relative_path.startswith(os.pardir + os.path.sep)
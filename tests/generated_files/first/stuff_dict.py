@@ -0,0 +1,2 @@
+
+class_dict = {}
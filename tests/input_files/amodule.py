@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from functools import wraps
 from typing import List, Tuple, Optional, Union, Sequence, Iterable, Any, Dict
@@ -60,3 +61,26 @@ class SecondExampleClass:
         self.b = b
         self.name = name
 
+
+async def a_coroutine_function(a: ExampleClass, b: List[str]) -> Tuple[ExampleClass, List[str]]:
+    """
+    An example coroutine function
+    """
+    await asyncio.sleep(0)
+    return a, b
+
+
+def call_synchronously(f):
+    @wraps(f)
+    def wrapper(a: ExampleClass, b: List[str]):
+        return f(a, b)
+    return wrapper
+
+
+@call_synchronously
+async def a_wrapped_coroutine_function(a: ExampleClass, b: List[str]) -> Tuple[ExampleClass, List[str]]:
+    """
+    An example coroutine function with a sync decorator
+    """
+    await asyncio.sleep(0)
+    return a, b
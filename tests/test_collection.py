@@ -0,0 +1,65 @@
+from pyfileconf.config.models.config import ActiveFunctionConfig
+from pyfileconf.config.models.section import ConfigSection
+from pyfileconf.pipelines.models.collection import PipelineCollection
+
+
+def _collection(name: str) -> PipelineCollection:
+    return PipelineCollection(name, [], name=name)
+
+
+def test_collection_name_maps_updated_on_append_and_extend():
+    collection = _collection('top')
+    first = _collection('first')
+    collection.append(first)
+    others = [_collection('second'), _collection('third')]
+    collection.extend(iter(others))
+    assert list(collection.name_dict) == ['first', 'second', 'third']
+    assert collection.name_for_obj(others[1]) == 'third'
+
+    # Replacing an item by name removes the old item from the reverse map
+    new_first = _collection('first')
+    collection.append(new_first)
+    assert collection.first is new_first
+    assert collection.name_for_obj(new_first) == 'first'
+    try:
+        collection.name_for_obj(first)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('should not find replaced item')
+
+
+def test_config_section_map_updated_on_append_and_extend():
+    section = ConfigSection([], name='section')
+    section.append(ActiveFunctionConfig(name='a'))
+    section.extend(iter([ActiveFunctionConfig(name='b'), ActiveFunctionConfig(name='c')]))
+    assert list(section.config_map) == ['a', 'b', 'c']
+    assert section.c.name == 'c'
+
+
+def test_collection_name_for_obj_stored_under_multiple_names():
+    collection = _collection('top')
+    shared = _collection('shared')
+    collection.append(shared)
+    shared.name = 'alias'
+    collection.append(shared)
+    assert list(collection.name_dict) == ['shared', 'alias']
+    assert collection.name_for_obj(shared) == 'shared'
+
+    # Replacing the first name keeps the object findable by its other name
+    collection.append(_collection('shared'))
+    assert collection.name_for_obj(shared) == 'alias'
+
+
+def test_collection_subclass_name_map_used_on_append():
+    class UpperNameCollection(PipelineCollection):
+
+        def _set_name_map(self):
+            self.name_dict = {self._name_for_item(item).upper(): item for item in self}
+
+    collection = UpperNameCollection('top', [_collection('first')], name='top')
+    second = _collection('second')
+    collection.append(second)
+    assert list(collection.name_dict) == ['FIRST', 'SECOND']
+    assert collection.name_for_obj(second) == 'SECOND'
+    assert collection.path_index['SECOND'] is second
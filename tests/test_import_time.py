@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ('pandas', 'black', 'astor', 'datacode')
+# Generous so that slow CI machines pass, while still catching heavy packages being imported again
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+import time
+start = time.perf_counter()
+import pyfileconf
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    elapsed=elapsed,
+    imported=[name for name in {HEAVY_MODULES!r} if name in sys.modules],
+)))
+"""
+
+
+def _import_pyfileconf_in_subprocess() -> dict:
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_SCRIPT], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_does_not_import_heavy_packages():
+    result = _import_pyfileconf_in_subprocess()
+    assert result['imported'] == []
+
+
+def test_import_time_within_budget():
+    result = _import_pyfileconf_in_subprocess()
+    assert result['elapsed'] < IMPORT_TIME_BUDGET_SECONDS
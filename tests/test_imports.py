@@ -0,0 +1,110 @@
+import sys
+import types
+
+from pyfileconf.exceptions.imports import CouldNotDetermineModuleForObjectException
+from pyfileconf.imports.logic.load.index import should_skip_module, ImportedObjectIndex, imported_object_index
+from pyfileconf.imports.logic.load.name import get_module_and_name_imported_from, is_imported_obj, is_imported_name
+from tests.input_files.mypackage.cmodule import ExampleClass
+
+
+class _Instance:
+    pass
+
+
+def test_function_found_in_defining_module():
+    module, module_name = get_module_and_name_imported_from(ExampleClass)
+    assert module_name == 'tests.input_files.mypackage.cmodule'
+    assert module is sys.modules[module_name]
+
+
+def test_instance_found_through_index_and_module_updates():
+    module = types.ModuleType('_pyfileconf_index_test_module')
+    sys.modules[module.__name__] = module
+    try:
+        obj = _Instance()
+        assert not is_imported_obj(obj)
+        module.obj = obj
+        assert get_module_and_name_imported_from(obj) == (module, module.__name__)
+        assert is_imported_name('obj', search_list=[module.__name__])
+
+        # Rebinding an existing name does not change the module's size, so it is found by scanning
+        for _ in range(2):
+            new_obj = _Instance()
+            module.obj = new_obj
+            assert get_module_and_name_imported_from(new_obj) == (module, module.__name__)
+            assert imported_object_index.find_obj(new_obj) == (module, module.__name__)
+        assert not is_imported_obj(obj)
+        try:
+            get_module_and_name_imported_from(obj)
+        except CouldNotDetermineModuleForObjectException:
+            pass
+        else:
+            raise AssertionError('should not find object which is no longer in a module')
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_deleted_name_removed_from_index():
+    module = types.ModuleType('_pyfileconf_deleted_name_test_module')
+    sys.modules[module.__name__] = module
+    try:
+        module.deleted_name = _Instance()
+        assert is_imported_name('deleted_name', search_list=[module.__name__])
+        del module.deleted_name
+        assert not is_imported_name('deleted_name', search_list=[module.__name__])
+        assert 'deleted_name' not in imported_object_index._module_entries[module.__name__]
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_re_exported_function_found_in_first_module():
+    from tests.input_files.mypackage import cmodule
+    re_exporting = types.ModuleType('_pyfileconf_index_re_exporting')
+    re_exporting.ExampleClass = ExampleClass
+    sys.modules[re_exporting.__name__] = re_exporting
+    try:
+        # Defining module is first in sys.modules
+        assert get_module_and_name_imported_from(ExampleClass) == (cmodule, cmodule.__name__)
+        assert get_module_and_name_imported_from(
+            ExampleClass, search_list=[re_exporting.__name__, cmodule.__name__]
+        ) == (re_exporting, re_exporting.__name__)
+    finally:
+        del sys.modules[re_exporting.__name__]
+
+
+def test_redefined_function_found_in_defining_module():
+    module = types.ModuleType('_pyfileconf_index_redefined')
+    sys.modules[module.__name__] = module
+    try:
+        exec('def a_function():\n    pass', module.__dict__)
+        assert get_module_and_name_imported_from(module.a_function) == (module, module.__name__)
+        exec('def a_function():\n    return 1', module.__dict__)
+        assert get_module_and_name_imported_from(module.a_function) == (module, module.__name__)
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_index_keeps_sys_modules_order():
+    first = types.ModuleType('_pyfileconf_index_first')
+    second = types.ModuleType('_pyfileconf_index_second')
+    obj = _Instance()
+    first.obj = obj
+    second.obj = obj
+    index = ImportedObjectIndex()
+    sys.modules[first.__name__] = first
+    sys.modules[second.__name__] = second
+    try:
+        assert index.find_obj(obj) == (first, first.__name__)
+        assert index.find_obj(obj, search_list=[second.__name__, first.__name__]) == (second, second.__name__)
+        module_names = index.modules_with_name('obj')
+        assert module_names.index(first.__name__) < module_names.index(second.__name__)
+    finally:
+        del sys.modules[first.__name__]
+        del sys.modules[second.__name__]
+
+
+def test_should_skip_module():
+    assert should_skip_module('six.moves')
+    assert should_skip_module('mypackage.six.moves')
+    assert not should_skip_module('six')
+    assert not should_skip_module('six.moves.other')
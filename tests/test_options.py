@@ -4,6 +4,7 @@ from typing import Any, Tuple
 
 import pyfileconf
 from pyfileconf import Selector, PipelineManager
+from pyfileconf.logger.bind_stdout import stdout_also_logged
 from pyfileconf.logger.logger import logger
 from pyfileconf.opts import options
 from pyfileconf.sectionpath.sectionpath import SectionPath
@@ -193,3 +194,49 @@ class TestLogOptions(OptionsTest):
             assert 'raise ValueError(\'error was supposed to be raised\')\nValueError: error was supposed to be raised\n\n[pyfileconf ERROR]: Exception summary for running stuff.a_function (exceptions were also shown when raised):\nError while running stuff.a_function:\n\nTraceback (most recent call last):' \
                    in contents
 
+
+    def test_log_queue_file(self):
+        pyfileconf.options.set_options([('log_queue', True), ('log_folder', self.logs_folder)])
+        logger.info('woo')
+        # Records are written out when the queue is stopped on reset
+        pyfileconf.options.reset()
+        logger.info('woo2')
+        with open(self.logs_path, 'r') as f:
+            contents = f.read()
+            assert contents == '[pyfileconf INFO]: woo\n'
+        assert self.mock_logs.messages['info'] == ['woo', 'woo2']
+
+    def test_log_queue_renders_message_when_logged(self):
+        pyfileconf.options.set_options([('log_queue', True), ('log_folder', self.logs_folder)])
+        value = ['a']
+        logger.info('value %s', value)
+        value.append('b')
+        pyfileconf.options.reset()
+        with open(self.logs_path, 'r') as f:
+            assert f.read() == "[pyfileconf INFO]: value ['a']\n"
+
+    def test_log_stdout_partial_lines(self):
+        with stdout_also_logged():
+            print('wo', end='')
+            print('o', end='')
+            print('\nwoo2\n', end='')
+            print('woo3', end='')
+        assert self.mock_logs.messages['info'] == ['woo', 'woo2', 'woo3']
+
+    def test_log_stdout_partial_lines_from_threads(self):
+        import threading
+
+        def print_partial_lines(name: str):
+            for i in range(50):
+                print(name, end='')
+                print(i, end='')
+                print()
+
+        with stdout_also_logged():
+            threads = [threading.Thread(target=print_partial_lines, args=(name,)) for name in ('a', 'b')]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        expected = sorted(f'{name}{i}' for name in ('a', 'b') for i in range(50))
+        assert sorted(self.mock_logs.messages['info']) == expected
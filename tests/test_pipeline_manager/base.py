@@ -83,6 +83,7 @@ class PipelineManagerTestBase(TestCase):
         second_example_class_dict_paths.append(os.path.join(second_pm_folder, name))
     logs_folder = os.path.join(pm_folder, 'MyLogs')
     logs_path = os.path.join(logs_folder, 'pyfileconf.log')
+    cache_folder = os.path.join(pm_folder, 'cache')
     all_paths = (
         defaults_path,
         pm_folder,
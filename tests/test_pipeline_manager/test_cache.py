@@ -0,0 +1,355 @@
+import asyncio
+import gc
+import os
+import shutil
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pyfileconf
+from pyfileconf import Selector, Scheduler
+from pyfileconf.io.file.load.bytecode import bytecode_cache
+from pyfileconf.io.file.load.cache import parsed_file_cache
+from pyfileconf.io.func.load.cache import source_module_cache
+from pyfileconf.runner.models import runner as runner_module
+from pyfileconf.runner.models.resultcache import result_cache, get_item_key, get_result_key, memoize_result_keys
+from tests.input_files.amodule import a_function
+from tests.input_files.mypackage.cmodule import ExampleClass
+from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST
+
+
+class TestParsedFileCache(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        parsed_file_cache.stats.reset()
+
+    def test_no_cache_without_folder(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        assert parsed_file_cache.stats.total == 0
+
+    def test_load_from_cache(self):
+        pyfileconf.options.set_option('cache_folder', self.cache_folder)
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        assert parsed_file_cache.stats.hits == 0
+        assert parsed_file_cache.stats.misses > 0
+
+        parsed_file_cache.stats.reset()
+        pipeline_manager.reload()
+        assert parsed_file_cache.stats.hits > 0
+        sel = Selector()
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+        assert pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data) == ExampleClass(None, name='data')
+
+    def test_changed_file_misses_cache(self):
+        pyfileconf.options.set_option('cache_folder', self.cache_folder)
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        self.append_to_a_function_config('\na = 10\n')
+        parsed_file_cache.stats.reset()
+        pipeline_manager.reload()
+        sel = Selector()
+        assert parsed_file_cache.stats.misses > 0
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+
+
+class TestBytecodeCache(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        bytecode_cache.stats.reset()
+
+    def test_executed_config_compiled_once(self):
+        pyfileconf.options.set_option('cache_folder', self.cache_folder)
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        assert bytecode_cache.stats.misses == 1
+        assert bytecode_cache.stats.hits == 0
+
+        pipeline_manager.refresh('example_class.stuff.data')
+        assert bytecode_cache.stats.misses == 1
+        assert bytecode_cache.stats.hits > 0
+
+        self.append_to_specific_class_config('\na = 20\n')
+        pipeline_manager.refresh('example_class.stuff.data')
+        assert bytecode_cache.stats.misses == 2
+        obj = pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        assert obj == ExampleClass(20, name='data')
+
+
+class TestSourceModuleCache(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        source_module_cache.clear()
+
+    def _read_example_class_config(self) -> str:
+        with open(self.standard_ec_path, 'r') as f:
+            return f.read()
+
+    def test_args_extracted_once_per_module(self):
+        self.write_example_class_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        assert source_module_cache.stats.hits == 1
+        assert source_module_cache.stats.misses == 1
+        contents = self._read_example_class_config()
+
+        # Remove scaffolded files so that they are scaffolded again
+        shutil.rmtree(self.defaults_path)
+        source_module_cache.stats.reset()
+        pipeline_manager.reload()
+        assert source_module_cache.stats.hits == 2
+        assert source_module_cache.stats.misses == 0
+        # First argument is only removed from the cached class __init__ once
+        assert self._read_example_class_config() == contents
+        assert pipeline_manager.get('stuff.ExampleClass') == ExampleClass(None)
+
+
+class TestResultCache(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        result_cache.stats.reset()
+
+    def create_caching_pm(self, **kwargs):
+        pyfileconf.options.set_options([
+            ('cache_folder', self.cache_folder),
+            ('cache_results', True),
+        ])
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST, **kwargs)
+        pipeline_manager.load()
+        return pipeline_manager
+
+    def test_no_cache_without_option(self):
+        pyfileconf.options.set_option('cache_folder', self.cache_folder)
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.run('stuff.a_function')
+        pipeline_manager.run('stuff.a_function')
+        assert result_cache.stats.total == 0
+
+    def test_second_run_uses_cached_result(self):
+        pipeline_manager = self.create_caching_pm()
+        assert pipeline_manager.run('stuff.a_function') == (None, None)
+        assert result_cache.stats.misses == 1
+        assert result_cache.stats.hits == 0
+        assert pipeline_manager.run('stuff.a_function') == (None, None)
+        assert result_cache.stats.hits == 1
+        assert pipeline_manager.run('example_class.stuff.data') == 'woo'
+        assert pipeline_manager.run('example_class.stuff.data') == 'woo'
+        assert result_cache.stats.hits == 2
+
+    def test_cached_result_used_when_running_in_parallel(self):
+        pipeline_manager = self.create_caching_pm()
+        assert pipeline_manager.run(['stuff.a_function'], executor='thread') == (None, None)
+        assert result_cache.stats.misses == 1
+        assert pipeline_manager.run(['stuff.a_function'], executor='thread') == (None, None)
+        assert asyncio.run(pipeline_manager.arun('stuff.a_function')) == (None, None)
+        results = Scheduler(['test_pipeline_manager.stuff.a_function'], executor='thread').run()
+        assert results == {'test_pipeline_manager.stuff.a_function': (None, None)}
+        assert result_cache.stats.hits == 3
+        assert result_cache.stats.misses == 1
+
+    def test_scheduler_stores_results(self):
+        pipeline_manager = self.create_caching_pm()
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        items = ['test_pipeline_manager.example_class.stuff.data', 'test_pipeline_manager.stuff.a_function']
+        Scheduler(items, executor='thread', workers=2).run()
+        assert result_cache.stats.misses == 2
+        results = Scheduler(items, executor='thread', workers=2).run()
+        assert results['test_pipeline_manager.example_class.stuff.data'] == 'woo'
+        assert result_cache.stats.hits == 2
+
+    def test_result_key_computed_once_without_new_dependencies(self):
+        pipeline_manager = self.create_caching_pm()
+        with patch.object(runner_module, 'get_result_key', wraps=get_result_key) as mock_get_result_key:
+            pipeline_manager.run('stuff.a_function')
+            assert mock_get_result_key.call_count == 1
+            pipeline_manager.run('stuff.a_function')
+            assert mock_get_result_key.call_count == 2
+        assert result_cache.stats.hits == 1
+
+    def test_changed_config_misses_cache(self):
+        pipeline_manager = self.create_caching_pm()
+        pipeline_manager.run('stuff.a_function')
+        pipeline_manager.update(section_path_str='stuff.a_function', a=10)
+        assert pipeline_manager.run('stuff.a_function') == (10, None)
+        assert result_cache.stats.misses == 2
+        assert result_cache.stats.hits == 0
+
+    def test_changed_upstream_config_misses_cache(self):
+        pipeline_manager = self.create_caching_pm()
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        pipeline_manager.run('stuff.a_function')
+        pipeline_manager.run('stuff.a_function')
+        assert result_cache.stats.hits == 1
+        pipeline_manager.update(section_path_str='example_class.stuff.data', a=20)
+        a, b = pipeline_manager.run('stuff.a_function')
+        assert a.a == 20
+        assert result_cache.stats.hits == 1
+        assert result_cache.stats.misses == 2
+
+    def test_opt_out_in_config(self):
+        pipeline_manager = self.create_caching_pm()
+        self.append_to_a_function_config('\n_pyfileconf_cache_result_ = False\n')
+        pipeline_manager.reload()
+        pipeline_manager.run('stuff.a_function')
+        pipeline_manager.run('stuff.a_function')
+        assert result_cache.stats.total == 0
+
+    def test_least_recently_used_results_removed(self):
+        pipeline_manager = self.create_caching_pm()
+        pyfileconf.options.set_option('result_cache_max_bytes', 1)
+        pipeline_manager.run('stuff.a_function')
+        assert os.listdir(result_cache.folder) == []
+        pipeline_manager.run('stuff.a_function')
+        assert result_cache.stats.misses == 2
+
+    def test_key_independent_of_container_order(self):
+        pipeline_manager = self.create_caching_pm()
+        runner = pipeline_manager.runner
+        key = get_item_key(runner, 'stuff.a_function', a_function, dict(a={'x': 1, 'y': {'c', 'd'}}, b=None))
+        same_key = get_item_key(runner, 'stuff.a_function', a_function, dict(b=None, a={'y': {'d', 'c'}, 'x': 1}))
+        assert key is not None
+        assert key == same_key
+        assert key != get_item_key(runner, 'stuff.a_function', a_function, dict(a={'x': 2, 'y': {'c', 'd'}}, b=None))
+
+        # String hashes and so set order differ between sessions
+        code = (
+            'from pyfileconf.runner.models.resultcache import ResultKeyMemo, _canonicalize, _pickle_digest\n'
+            'value = {"a": {"b", "c", "d", "e", "f"}, "g": frozenset({1, "h", 2.5})}\n'
+            'print(_pickle_digest(_canonicalize(value, set(), ResultKeyMemo()), set(), ResultKeyMemo()).hex())'
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, '-c', code], env={**os.environ, 'PYTHONHASHSEED': str(seed)},
+                stdout=subprocess.PIPE, check=True, universal_newlines=True,
+            ).stdout
+            for seed in range(3)
+        }
+        assert len(digests) == 1
+
+    def test_upstream_keys_memoized_within_run(self):
+        pipeline_manager = self.create_caching_pm()
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n'
+                                         'b = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        runner = pipeline_manager.runner
+        func_or_class, config_dict = runner._get_func_or_class_and_config('stuff.a_function')
+        with patch.object(
+            runner, '_get_func_or_class_and_config', wraps=runner._get_func_or_class_and_config
+        ) as get_func_or_class_and_config:
+            with memoize_result_keys() as memo:
+                key = get_item_key(runner, 'stuff.a_function', func_or_class, config_dict)
+                assert get_item_key(runner, 'stuff.a_function', func_or_class, config_dict) == key
+            assert get_func_or_class_and_config.call_count == 1
+            assert list(memo.keys) == ['test_pipeline_manager.example_class.stuff.data']
+            # Outside of a run, each key hashes the upstream item again
+            get_item_key(runner, 'stuff.a_function', func_or_class, config_dict)
+            assert get_func_or_class_and_config.call_count == 2
+
+
+class TestLoadedObjectCache(PipelineManagerTestBase):
+
+    def create_loaded_pm(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        return pipeline_manager
+
+    def test_unbounded_by_default(self):
+        pipeline_manager = self.create_loaded_pm()
+        func = pipeline_manager.get('stuff.a_function')
+        pipeline_manager.get('stuff.ExampleClass')
+        assert pipeline_manager.get('stuff.a_function') is func
+        assert len(pipeline_manager.runner.loaded_objects) == 2
+        assert pipeline_manager.runner.loaded_objects.stats.evictions == 0
+
+    def test_evicted_object_recreated(self):
+        pyfileconf.options.set_options([
+            ('loaded_objects_policy', 'lru'),
+            ('loaded_objects_max_count', 1),
+        ])
+        pipeline_manager = self.create_loaded_pm()
+        pipeline_manager.update(section_path_str='stuff.a_function', a=10)
+        func = pipeline_manager.get('stuff.a_function')
+        pipeline_manager.get('stuff.ExampleClass')
+        loaded_objects = pipeline_manager.runner.loaded_objects
+        assert list(loaded_objects) == ['stuff.ExampleClass']
+        assert loaded_objects.stats.evictions == 1
+        new_func = pipeline_manager.get('stuff.a_function')
+        assert new_func is not func
+        assert new_func() == (10, None)
+
+    def test_update_evicted_object_refreshes_dependents(self):
+        from pyfileconf.config.models.manager import ConfigManager
+        pyfileconf.options.set_options([
+            ('loaded_objects_policy', 'lru'),
+            ('loaded_objects_max_count', 1),
+        ])
+        pipeline_manager = self.create_loaded_pm()
+        pipeline_manager.get('stuff.a_function')
+        pipeline_manager.get('stuff.ExampleClass')
+        loaded_objects = pipeline_manager.runner.loaded_objects
+        stats = (loaded_objects.stats.hits, loaded_objects.stats.misses)
+        with patch.object(ConfigManager, 'refresh_dependent_configs') as refresh_dependent_configs:
+            pipeline_manager.update(section_path_str='stuff.a_function', a=10)
+            pipeline_manager.update(section_path_str='stuff.ExampleClass', a=10)
+        called_paths = [call.args[0] for call in refresh_dependent_configs.call_args_list]
+        assert called_paths == ['stuff.a_function', 'stuff.ExampleClass']
+        assert (loaded_objects.stats.hits, loaded_objects.stats.misses) == stats
+        assert pipeline_manager.get('stuff.a_function')() == (10, None)
+
+    def test_update_never_loaded_object_does_not_refresh_dependents(self):
+        from pyfileconf.config.models.manager import ConfigManager
+        pipeline_manager = self.create_loaded_pm()
+        with patch.object(ConfigManager, 'refresh_dependent_configs') as refresh_dependent_configs:
+            pipeline_manager.update(section_path_str='stuff.a_function', a=10)
+        refresh_dependent_configs.assert_not_called()
+        assert not pipeline_manager.runner.loaded_objects.was_evicted('stuff.a_function')
+
+    def test_evict_by_memory_size(self):
+        pyfileconf.options.set_options([
+            ('loaded_objects_policy', 'memory'),
+            ('loaded_objects_max_bytes', 1),
+        ])
+        pipeline_manager = self.create_loaded_pm()
+        pipeline_manager.get('stuff.a_function')
+        loaded_objects = pipeline_manager.runner.loaded_objects
+        assert loaded_objects.size_bytes > 0
+        pipeline_manager.get('stuff.ExampleClass')
+        assert list(loaded_objects) == ['stuff.ExampleClass']
+        assert loaded_objects.stats.evictions == 1
+
+    def test_weak_references(self):
+        pyfileconf.options.set_option('loaded_objects_policy', 'weak')
+        pipeline_manager = self.create_loaded_pm()
+        obj = pipeline_manager.get('stuff.ExampleClass')
+        assert pipeline_manager.get('stuff.ExampleClass') is obj
+        del obj
+        gc.collect()
+        assert 'stuff.ExampleClass' not in pipeline_manager.runner.loaded_objects
+        assert pipeline_manager.run('stuff.ExampleClass') == 'woo'
+
+    def test_invalid_policy(self):
+        pyfileconf.options.set_option('loaded_objects_policy', 'fifo')
+        pipeline_manager = self.create_loaded_pm()
+        with self.assertRaises(ValueError):
+            pipeline_manager.get('stuff.a_function')
@@ -3,6 +3,11 @@ from copy import deepcopy
 
 from pyfileconf import Selector, PipelineManager, context
 from pyfileconf.batch import BatchUpdater
+from pyfileconf.config.models.section import LazyConfigSection, ActiveFunctionConfig
+from pyfileconf.exceptions.config import ReadOnlyConfigException
+from pyfileconf.io.file.load.active.literal import config_load_path_stats, get_user_defined_dict_from_literal_ast
+from pyfileconf.io.file.load.active.loader import ActiveConfigFileLoader
+from pyfileconf.io.file.load.active.userdef import get_user_defined_dict_from_filepath
 from pyfileconf.sectionpath.sectionpath import SectionPath
 from tests.input_files.amodule import SecondExampleClass, a_function
 from tests.input_files.mypackage.cmodule import ExampleClass, ExampleClassWithCustomUpdate
@@ -1030,6 +1035,25 @@ class TestPipelineManagerConfig(PipelineManagerTestBase):
             iv.item
 
 
+    def test_config_sections_load_lazily(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        main_section = pipeline_manager.config.section
+        assert isinstance(main_section, LazyConfigSection)
+        assert not main_section._loaded
+
+        sel = Selector()
+        result = pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function)
+        assert result == (None, None)
+        assert main_section._loaded
+        assert main_section.stuff._loaded
+        # Branch of config tree which was not used is not read
+        assert not main_section.example_class._loaded
+        assert sorted(main_section.config_map.keys()) == ['example_class', 'stuff']
+
+
 class TestBatchUpdater(PipelineManagerTestBase):
 
     def test_config_batch_updater_function_multiple_pms(self):
@@ -1238,3 +1262,132 @@ class TestConfigRefresh(PipelineManagerTestBase):
         assert ec.name == expect_ec.name
         assert ec.a == ec._a == expect_ec.a
         assert ec._f == expected_f_result
+
+
+class TestLiteralConfigLoad(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        config_load_path_stats.reset()
+
+    def test_literal_config_matches_executed(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        self.append_to_a_function_config('\na = {"c": [1, 2.5, None]}\nb = -3\n')
+        loader = ActiveConfigFileLoader(self.standard_a_function_path)
+        literal_dict = get_user_defined_dict_from_literal_ast(loader.ast, loader.filepath)
+        executed_dict = get_user_defined_dict_from_filepath(loader.filepath)
+        assert literal_dict is not None
+        assert list(literal_dict) == list(executed_dict)
+        assert isinstance(literal_dict.pop('s'), Selector)
+        assert isinstance(executed_dict.pop('s'), Selector)
+        assert literal_dict == executed_dict
+
+    def test_non_literal_config_is_executed(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function)
+        assert config_load_path_stats.literal > 0
+        assert config_load_path_stats.executed == 0
+
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        config_load_path_stats.reset()
+        result = pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function)
+        assert result[0].name == 'data'
+        # Both the function config and the class config, which has calls, are executed
+        assert config_load_path_stats.executed == 2
+
+
+class TestResolvedConfigCache(PipelineManagerTestBase):
+
+    def test_resolved_config_cached_until_changed(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        config_manager = pipeline_manager.config
+        stats = config_manager.resolved_config_stats
+        config = config_manager.get('stuff.a_function')
+        stats.reset()
+        assert config_manager.get('stuff.a_function') is config
+        assert stats.hits == 1
+        assert stats.misses == 0
+
+        # Local config applies to everything
+        config_manager.set(value=ActiveFunctionConfig(dict(b=['a'])))
+        assert config_manager.get('stuff.a_function')['b'] == ['a']
+        assert stats.misses == 1
+
+        pipeline_manager.update(a=10, section_path_str='stuff.a_function')
+        assert config_manager.get('stuff.a_function')['a'] == 10
+        assert stats.misses == 2
+
+        config_manager.reset('stuff.a_function')
+        new_config = config_manager.get('stuff.a_function')
+        assert new_config is not config
+        assert new_config['a'] is None
+        assert new_config['b'] == ['a']
+
+    def test_resolved_config_does_not_modify_configs(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        config_manager = pipeline_manager.config
+        config_manager.set(value=ActiveFunctionConfig(dict(b=['a'])))
+        config = config_manager.get('stuff.a_function')
+        assert config['b'] == ['a']
+        assert config.for_function(a_function) == dict(a=None, b=['a'])
+
+        # Underlying function config is not changed by inheritance
+        function_config = config_manager._get_func_or_section_configs('stuff.a_function')
+        assert function_config['b'] is None
+        assert function_config._applied_updates == {}
+
+        with self.assertRaises(ReadOnlyConfigException):
+            config['a'] = 10
+        with self.assertRaises(ReadOnlyConfigException):
+            config.update(a=10)
+
+    def test_resolved_config_invalidated_on_reload(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        sel = Selector()
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+        self.append_to_a_function_config('\na = 10\n')
+        pipeline_manager.refresh('stuff.a_function')
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+        self.append_to_a_function_config('\na = 20\n')
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (20, None)
+
+    def test_resolved_config_copy_and_pickle(self):
+        import copy
+        import pickle
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.update(b=['a'], section_path_str='stuff.a_function')
+        config = pipeline_manager.config.get('stuff.a_function')
+
+        deep_copied = copy.deepcopy(config)
+        assert isinstance(deep_copied, dict)
+        assert deep_copied['b'] == ['a']
+        assert deep_copied['b'] is not config['b']
+        assert deep_copied['s'] is config['s']
+        assert copy.copy(config) == config.to_dict()
+        assert config.copy() == config.to_dict()
+        unpickled = pickle.loads(pickle.dumps(config.for_function(a_function)))
+        assert unpickled == dict(a=None, b=['a'])
+        unpickled = pickle.loads(pickle.dumps(config))
+        assert unpickled['b'] == ['a']
+
+        child = config.new_child()
+        child['a'] = 10
+        assert child['a'] == 10
+        assert child['b'] == ['a']
+        assert config['a'] is None
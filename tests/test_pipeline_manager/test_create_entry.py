@@ -315,3 +315,20 @@ class TestPipelineManagerCreateEntry(PipelineManagerCreateEntryTestBase):
                 contents,
                 name_value="name: Optional[str] = 'data2'"
             )
+
+    def test_create_deeply_nested_entry_updates_path_index(self):
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(
+            specific_class_config_dicts=CLASS_CONFIG_DICT_LIST
+        )
+        pipeline_manager.load()
+        registrar = pipeline_manager._registrars[0]
+        path_index = registrar.collection.path_index
+        assert path_index['stuff.data'] is registrar.collection.stuff.data
+        pipeline_manager.create('example_class.thing.stuff.whoa.data')
+        # Index updated in place with the new collections and item
+        assert registrar.collection.path_index is path_index
+        assert path_index['thing.stuff'] is registrar.collection.thing.stuff
+        assert path_index['thing.stuff.whoa.data'] is registrar.collection.thing.stuff.whoa.data
+        assert registrar.collection.thing.path_index['stuff.whoa.data'] is path_index['thing.stuff.whoa.data']
+        assert pipeline_manager.get('example_class.thing.stuff.whoa.data').name == 'data'
@@ -8,11 +8,13 @@ from pyfileconf import (
     reset_plugins,
     remove_default_plugins,
     PipelineManager,
+    Scheduler,
 )
 from pyfileconf.plugin import manager
 from pyfileconf.runner.models.interfaces import RunnerArgs, ResultOrResults
 from pyfileconf.sectionpath.sectionpath import SectionPath
 from tests.input_files.amodule import a_function
+from tests.input_files.mypackage.cmodule import ExampleClass
 from tests.test_pipeline_manager.base import (
     PipelineManagerTestBase,
     CLASS_CONFIG_DICT_LIST,
@@ -320,6 +322,21 @@ class TestRunPlugins(PluginsTest):
         assert POST_RUN_COUNTER == 2
         assert PRE_RUN_COUNTER == 2
 
+    def test_scheduler_run_plugins(self):
+        self.add_plugin()
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        results = Scheduler(['test_pipeline_manager.stuff.ExampleClass']).run()
+        # Pre-run hook adds an item to run
+        assert results == {
+            'test_pipeline_manager.stuff.ExampleClass': 'woo',
+            'test_pipeline_manager.stuff.a_function': (None, None),
+        }
+        assert POST_RUN_COUNTER == 1
+        assert PRE_RUN_COUNTER == 1
+
 
 class TestUpdatePlugins(PluginsTest):
     def test_update_no_plugins(self):
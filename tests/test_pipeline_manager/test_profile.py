@@ -0,0 +1,66 @@
+import pyfileconf
+from pyfileconf.profile import PHASE_PIPELINE_DICT, PHASE_SPECIFIC_CLASS_DICT, PHASE_FROM_DICT, \
+    PHASE_SCAFFOLD, PHASE_SCAFFOLD_COLLECTION, PHASE_SCAFFOLD_ITEM, PHASE_ARGUMENT_EXTRACTION, \
+    PHASE_CONFIG_SECTION, PHASE_MODULE_IMPORT
+from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST
+
+
+class TestLoadProfile(PipelineManagerTestBase):
+
+    def test_no_profile_by_default(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        assert pipeline_manager.load_profile is None
+
+    def test_load_profile(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load(profile=True)
+        profile = pipeline_manager.load_profile
+        assert profile is not None
+        for phase in (
+            PHASE_PIPELINE_DICT, PHASE_SPECIFIC_CLASS_DICT, PHASE_FROM_DICT, PHASE_SCAFFOLD,
+            PHASE_SCAFFOLD_COLLECTION, PHASE_SCAFFOLD_ITEM, PHASE_ARGUMENT_EXTRACTION,
+            PHASE_CONFIG_SECTION, PHASE_MODULE_IMPORT,
+        ):
+            assert phase in profile.phases
+        assert profile.phases[PHASE_FROM_DICT].count == 2
+        assert profile.phases[PHASE_SCAFFOLD_ITEM].count == 2
+        assert profile.total_seconds >= profile.phases[PHASE_SCAFFOLD].seconds
+        collection_names = [entry.name for entry in profile.slowest(phase=PHASE_SCAFFOLD_COLLECTION)]
+        assert sorted(collection_names) == ['example_class', 'test_pipeline_manager']
+        slowest = profile.slowest(3)
+        assert len(slowest) == 3
+        assert slowest[0].seconds >= slowest[1].seconds >= slowest[2].seconds
+        assert profile.to_dict(n=3)['slowest'][0]['name'] == slowest[0].name
+        assert 'Load profile for test_pipeline_manager' in profile.report()
+
+    def test_load_profile_option(self):
+        pyfileconf.options.set_option('profile_load', True)
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        assert pipeline_manager.load_profile is not None
+        assert pipeline_manager.load_profile.phases[PHASE_PIPELINE_DICT].count == 1
+
+    def test_profile_not_recorded_from_other_threads(self):
+        import threading
+        from pyfileconf.profile import LoadProfile, profiling, record_phase
+
+        started = threading.Event()
+        finish = threading.Event()
+
+        def record_while_other_thread_profiles():
+            started.wait()
+            record_phase(PHASE_PIPELINE_DICT, 1.0)
+            finish.set()
+
+        thread = threading.Thread(target=record_while_other_thread_profiles)
+        thread.start()
+        with profiling(LoadProfile('profiled')) as profile:
+            started.set()
+            finish.wait()
+        thread.join()
+        assert PHASE_PIPELINE_DICT not in profile.phases
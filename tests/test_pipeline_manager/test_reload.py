@@ -0,0 +1,107 @@
+import os
+
+import pyfileconf
+from pyfileconf import Selector, context
+from tests.input_files.mypackage.cmodule import ExampleClass
+from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST
+
+
+class TestIncrementalReload(PipelineManagerTestBase):
+
+    def setup_method(self, method):
+        super().setup_method(method)
+        pyfileconf.options.set_option('incremental_reload', True)
+
+    def test_incremental_reload_without_changes_keeps_loaded_objects(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        obj = pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        pipeline_manager.update(b=['a'], section_path_str='stuff.a_function')
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data) is obj
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, ['a'])
+
+    def test_incremental_reload_changed_config_file(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+        self.append_to_a_function_config('\na = 10\n')
+        pipeline_manager.reload(incremental=True)
+        # Unchanged item was not reloaded
+        assert list(pipeline_manager.runner._loaded_objects) == ['example_class.stuff.data']
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+
+        self.append_to_specific_class_config('\na = 20\n')
+        pipeline_manager.reload(incremental=True)
+        assert list(pipeline_manager.runner._loaded_objects) == ['stuff.a_function']
+        obj = pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        assert obj == ExampleClass(20, name='data')
+
+    def test_incremental_reload_changed_config_file_keeps_updates(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        sel = Selector()
+        pipeline_manager.update(a=10, section_path_str='stuff.a_function')
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+        self.append_to_a_function_config('\nb = 20\n')
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, 20)
+
+    def test_incremental_reload_changed_pipeline_dict(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function)
+        self.write_example_class_to_pipeline_dict_file()
+        pipeline_manager.reload(incremental=True)
+        assert os.path.exists(self.standard_ec_path)
+        assert list(pipeline_manager.runner._loaded_objects) == ['example_class.stuff.data']
+        assert pipeline_manager.get('stuff.ExampleClass') == ExampleClass(None)
+        with self.assertRaises(AttributeError):
+            pipeline_manager.get('stuff.a_function')
+
+    def test_incremental_reload_drops_dependents(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        sel = Selector()
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data.a\n')
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+        assert context.config_dependencies == self.expect_pm_1_a_function_depends_on_pm_1_specific_class
+
+        self.append_to_specific_class_config('\na = 20\n')
+        pipeline_manager.reload(incremental=True)
+        assert 'stuff.a_function' not in pipeline_manager.runner._loaded_objects
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (20, None)
+
+    def test_incremental_reload_fingerprints_files_on_first_use(self):
+        pyfileconf.options.reset()
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        assert pipeline_manager._load_snapshot is None
+        sel = Selector()
+        self.append_to_a_function_config('\na = 10\n')
+        # Without a snapshot, the first incremental reload is a full reload
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager._load_snapshot is not None
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+        obj = pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data)
+        self.append_to_a_function_config('\na = 20\n')
+        pipeline_manager.reload(incremental=True)
+        assert pipeline_manager.get(sel.test_pipeline_manager.example_class.stuff.data) is obj
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (20, None)
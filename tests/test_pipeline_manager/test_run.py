@@ -1,11 +1,18 @@
+import asyncio
+import logging
 from copy import deepcopy
+from unittest.mock import patch
 from typing import Any, Dict, Tuple
 
+import pyfileconf
 from pyfileconf import Selector, PipelineManager
+from pyfileconf.logger.logger import logger
 from pyfileconf.iterate import IterativeRunner
+from pyfileconf.runner.models.executor import run_tasks
 from pyfileconf.sectionpath.sectionpath import SectionPath
 from pyfileconf import context
-from tests.input_files.amodule import SecondExampleClass, a_function, a_function_that_calls_iterative_runner
+from tests.input_files.amodule import SecondExampleClass, a_function, a_function_that_calls_iterative_runner, \
+    a_coroutine_function, a_wrapped_coroutine_function
 from tests.input_files.mypackage.cmodule import ExampleClass, ExampleClassWithCustomUpdate
 from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST, \
     SAME_CLASS_CONFIG_DICT_LIST, \
@@ -82,6 +89,14 @@ class TestPipelineManagerRun(PipelineManagerTestBase):
         assert len(ExampleClass._instances) == num_ec + 1
         assert result2 == 'woo2'
 
+    def test_run_section_containing_class(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        # Class is run by its own section path rather than the path of the section
+        assert pipeline_manager.run('stuff') == [(None, None), 'woo']
+
     def test_create_class_multiple_pms(self):
         self.write_example_class_to_pipeline_dict_file()
         self.write_example_class_to_pipeline_dict_file(file_path=self.second_pipeline_dict_path)
@@ -227,6 +242,187 @@ class TestPipelineManagerRun(PipelineManagerTestBase):
         assert sec.b == expect_sec.b
 
 
+class TestPipelineManagerRunExecutors(PipelineManagerTestBase):
+
+    def test_run_section_in_thread_pool(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        serial_result = pipeline_manager.run(['stuff', 'stuff.a_function'])
+        result = pipeline_manager.run(['stuff', 'stuff.a_function'], executor='thread', workers=2)
+        assert result == serial_result == [[(None, None), 'woo'], (None, None)]
+        assert pipeline_manager.run('stuff', executor='thread') == [(None, None), 'woo']
+
+    def test_run_function_in_process_pool(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.update(a=10, section_path_str='stuff.a_function')
+        result = pipeline_manager.run(['stuff', 'stuff.a_function'], executor='process', workers=2)
+        assert result == [[(10, None)], (10, None)]
+
+    def test_force_continue_runs_all_items_with_one_executor(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm(force_continue=True)
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        pipeline_manager.update(section_path_str='stuff.a_function', a=10)
+        with patch('pyfileconf.runner.models.runner.run_tasks', wraps=run_tasks) as mock_run_tasks:
+            with patch.object(ExampleClass, '__call__', side_effect=ValueError('failed')):
+                result = pipeline_manager.run(['stuff.a_function', 'stuff', 'stuff.a_function'], executor='thread')
+        assert mock_run_tasks.call_count == 1
+        assert len(mock_run_tasks.call_args[0][0]) == 4
+        # Results of the section with the failing item are dropped
+        assert result == [(10, None), (10, None)]
+
+    def test_run_with_invalid_executor(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        with self.assertRaises(ValueError):
+            pipeline_manager.run('stuff', executor='cluster')
+
+
+class TestPipelineManagerArun(PipelineManagerTestBase):
+
+    def create_async_pm(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', a_coroutine_function)
+        pipeline_manager.create('stuff', ExampleClass)
+        return pipeline_manager
+
+    def test_arun_section(self):
+        pipeline_manager = self.create_async_pm()
+        pipeline_manager.update(section_path_str='stuff.a_coroutine_function', a=10)
+        for concurrency in (None, 1):
+            results = asyncio.run(
+                pipeline_manager.arun(['stuff', 'stuff.a_coroutine_function'], concurrency=concurrency)
+            )
+            assert results == [[(None, None), (10, None), 'woo'], (10, None)]
+        assert asyncio.run(pipeline_manager.arun('stuff.a_coroutine_function')) == (10, None)
+
+    def test_arun_sync_wrapped_coroutine_function(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', a_wrapped_coroutine_function)
+        pipeline_manager.update(section_path_str='stuff.a_wrapped_coroutine_function', a=10)
+        result = asyncio.run(pipeline_manager.arun('stuff.a_wrapped_coroutine_function'))
+        assert result == (10, None)
+        assert context.stack.frames == []
+
+    def test_arun_records_dependencies(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', a_coroutine_function)
+        pipeline_manager.update(
+            section_path_str='stuff.a_coroutine_function',
+            a=Selector().test_pipeline_manager.example_class.stuff.data,
+        )
+        a, b = asyncio.run(pipeline_manager.arun('stuff.a_coroutine_function'))
+        assert a.name == 'data'
+        assert context.stack.frames == []
+        assert SectionPath('test_pipeline_manager.stuff.a_coroutine_function') in \
+            context.config_dependencies['test_pipeline_manager.example_class.stuff.data']
+
+
+class TestPipelineManagerRunStale(PipelineManagerTestBase):
+
+    def create_dependent_pm(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        pipeline_manager.create('stuff', ExampleClass)
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        return pipeline_manager
+
+    def test_run_stale_skips_up_to_date_items(self):
+        pipeline_manager = self.create_dependent_pm()
+        first_results = pipeline_manager.run_stale('stuff')
+        assert first_results[1] == 'woo'
+        results = pipeline_manager.run_stale('stuff')
+        assert results[0] is first_results[0]
+
+        # Changing config of another item does not make the function stale
+        pipeline_manager.update(section_path_str='stuff.ExampleClass', a=5)
+        results = pipeline_manager.run('stuff', only_stale=True, executor='thread')
+        assert results[0] is first_results[0]
+
+    def test_run_stale_reruns_after_upstream_update(self):
+        pipeline_manager = self.create_dependent_pm()
+        first_result = pipeline_manager.run_stale('stuff.a_function')
+        pipeline_manager.update(section_path_str='example_class.stuff.data', a=20)
+        result = pipeline_manager.run_stale('stuff.a_function')
+        assert result is not first_result
+        assert result[0].a == 20
+        assert pipeline_manager.run_stale('stuff.a_function') is result
+
+    def test_run_does_not_use_last_results(self):
+        pipeline_manager = self.create_dependent_pm()
+        first_result = pipeline_manager.run_stale('stuff.a_function')
+        assert pipeline_manager.run('stuff.a_function') is not first_result
+
+
+class TestPipelineManagerRunLogging(PipelineManagerTestBase):
+
+    def create_logging_pm(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.update(section_path_str='stuff.a_function', a='a' * 100)
+        return pipeline_manager
+
+    def test_log_max_length(self):
+        pipeline_manager = self.create_logging_pm()
+        pyfileconf.options.set_option('log_max_length', 10)
+        with self.assertLogs('pyfileconf', level='INFO') as logs:
+            pipeline_manager.run('stuff.a_function')
+        output = '\n'.join(logs.output)
+        assert "a = r'aaaaa...," in output
+        assert "Result:\n('aa..." in output
+        assert 'a' * 20 not in output
+
+    def test_log_max_length_limits_rendered_config_values(self):
+        from pyfileconf.logger.render import render_run_description
+        rendered = []
+
+        class Element:
+            def __repr__(self):
+                rendered.append(self)
+                return 'Element()'
+
+        pyfileconf.options.set_option('log_max_length', 10)
+        description = render_run_description('function', 'stuff.a_function', {'a': [Element()] * 1000})
+        assert description == 'function stuff.a_function(\n\ta = [Elemen...\n)'
+        assert len(rendered) < 10
+
+    def test_skip_result_logging(self):
+        pipeline_manager = self.create_logging_pm()
+        pyfileconf.options.set_option('log_results', False)
+        with self.assertLogs('pyfileconf', level='INFO') as logs:
+            pipeline_manager.run('stuff.a_function')
+        assert not any('Result:' in line for line in logs.output)
+
+    def test_nothing_rendered_when_filtered(self):
+        pipeline_manager = self.create_logging_pm()
+        with patch('pyfileconf.logger.render.render_result') as render_result, \
+                patch('pyfileconf.logger.render.render_run_description') as render_run_description:
+            logger.setLevel(logging.WARNING)
+            try:
+                assert pipeline_manager.run('stuff.a_function') == ('a' * 100, None)
+            finally:
+                logger.setLevel(logging.INFO)
+        render_result.assert_not_called()
+        render_run_description.assert_not_called()
+
+
 class TestPipelineManagerRunIter(PipelineManagerTestBase):
 
     def test_run_iter_function_single(self):
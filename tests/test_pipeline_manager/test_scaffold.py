@@ -0,0 +1,156 @@
+import inspect
+import os
+import shutil
+from types import SimpleNamespace
+from typing import Dict
+from unittest.mock import patch
+
+import pyfileconf
+from pyfileconf import Selector
+from pyfileconf.io.file.manifest import SCAFFOLD_MANIFEST_FILENAME, ScaffoldManifest
+from pyfileconf.scaffold import ConfigScaffolder, ScaffoldSummary, _get_inputs_for_tasks
+from tests.input_files.mypackage.cmodule import ExampleClass
+from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST
+
+
+def _read_folder_contents(folder: str) -> Dict[str, str]:
+    contents = {}
+    for root, dirs, files in os.walk(folder):
+        for file in files:
+            if not file.endswith('.py'):
+                continue
+            file_path = os.path.join(root, file)
+            with open(file_path, 'r') as f:
+                contents[os.path.relpath(file_path, folder)] = f.read()
+    return contents
+
+
+class TestParallelScaffold(PipelineManagerTestBase):
+
+    def _load_pm_and_read_defaults(self) -> Dict[str, str]:
+        self.write_a_function_to_pipeline_dict_file(nest_section=True)
+        self.write_example_class_dict_to_file(nest_section=True)
+        self.pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        self.pipeline_manager.load()
+        return _read_folder_contents(self.defaults_path)
+
+    def test_parallel_scaffold_matches_serial(self):
+        serial_contents = self._load_pm_and_read_defaults()
+        shutil.rmtree(self.defaults_path)
+        self.reset_pm_class()
+
+        pyfileconf.options.set_option('scaffold_workers', 4)
+        parallel_contents = self._load_pm_and_read_defaults()
+        assert parallel_contents == serial_contents
+        assert len(parallel_contents) > 0
+
+        sel = Selector()
+        assert self.pipeline_manager.run(sel.test_pipeline_manager.my_section.stuff.a_function) == (None, None)
+        assert self.pipeline_manager.get(
+            sel.test_pipeline_manager.example_class.my_section.stuff.data
+        ) == ExampleClass(None, name='data')
+
+    def test_parallel_scaffold_loads_config_files_in_worker_processes(self):
+        from pyfileconf.io.file.interfaces.config import ConfigFileInterface
+        self._load_pm_and_read_defaults()
+        registrars = [*self.pipeline_manager._registrars, self.pipeline_manager._general_registrar]
+        load_pids = []
+        orig_load = ConfigFileInterface.load
+
+        def load(interface, *args, **kwargs):
+            load_pids.append(os.getpid())
+            return orig_load(interface, *args, **kwargs)
+
+        with patch.object(ConfigFileInterface, 'load', load):
+            summary = ConfigScaffolder(registrars, workers=4).scaffold()
+        assert summary.total == 2
+        # Existing config files are only executed in the worker processes
+        assert load_pids == []
+
+    def test_scaffold_summary_is_deterministic(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        registrars = [*pipeline_manager._registrars, pipeline_manager._general_registrar]
+
+        serial_summary = ConfigScaffolder(registrars, workers=1).scaffold()
+        parallel_summary = ConfigScaffolder(registrars, workers=4).scaffold()
+        assert serial_summary.file_counts == parallel_summary.file_counts == [
+            ('example_class', 1),
+            ('test_pipeline_manager', 1),
+        ]
+        assert str(parallel_summary) == 'Scaffolded 2 config files using 4 workers ' \
+                                        '(example_class: 1, test_pipeline_manager: 1), 0 unchanged'
+
+
+class TestScaffoldManifest(PipelineManagerTestBase):
+    manifest_path = os.path.join(PipelineManagerTestBase.defaults_path, SCAFFOLD_MANIFEST_FILENAME)
+
+    def _scaffold(self, pipeline_manager) -> ScaffoldSummary:
+        registrars = [*pipeline_manager._registrars, pipeline_manager._general_registrar]
+        return ConfigScaffolder(registrars, manifest_path=self.manifest_path).scaffold()
+
+    def test_unchanged_files_are_not_rewritten(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        assert os.path.exists(self.manifest_path)
+        a_function_mtime = os.stat(self.standard_a_function_path).st_mtime_ns
+
+        summary = self._scaffold(pipeline_manager)
+        assert summary.total == 0
+        assert summary.num_unchanged == 2
+        assert os.stat(self.standard_a_function_path).st_mtime_ns == a_function_mtime
+
+    def test_changed_config_file_is_rescaffolded(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        with open(self.standard_a_function_path, 'w') as f:
+            f.write('a = 10\n')
+
+        summary = self._scaffold(pipeline_manager)
+        assert summary.file_counts == [('test_pipeline_manager', 1)]
+        assert summary.num_unchanged == 0
+        with open(self.standard_a_function_path, 'r') as f:
+            contents = f.read()
+        assert 'a = 10' in contents
+        assert 'b: List[str] = None' in contents
+
+        summary = self._scaffold(pipeline_manager)
+        assert summary.total == 0
+
+    def test_removed_manifest_rescaffolds_all(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        os.remove(self.manifest_path)
+
+        summary = self._scaffold(pipeline_manager)
+        assert summary.total == 1
+        assert summary.num_unchanged == 0
+
+    def test_removed_items_are_pruned_from_manifest(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        self.write_example_class_to_pipeline_dict_file()
+        pipeline_manager.reload()
+
+        manifest = ScaffoldManifest.load(self.manifest_path)
+        assert manifest._key(self.standard_ec_path) in manifest.entries
+        assert manifest._key(self.standard_a_function_path) not in manifest.entries
+
+    def test_base_class_files_are_inputs(self):
+        class SubExampleClass(ExampleClass):
+            pass
+
+        collection = SimpleNamespace(
+            _config_source_for=lambda item: item, always_import_strs=None, always_assign_strs=None
+        )
+        inputs = _get_inputs_for_tasks([(collection, SubExampleClass)], {})
+        # Arguments are extracted from the __init__ of the base class in another module
+        source_files = [source_file for source_file, _ in inputs[0][0]]
+        assert source_files == [os.path.abspath(__file__), os.path.abspath(inspect.getfile(ExampleClass))]
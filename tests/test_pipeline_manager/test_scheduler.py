@@ -0,0 +1,41 @@
+from pyfileconf import Scheduler
+from pyfileconf.exceptions.config import ConfigDependencyCycleException
+from tests.test_pipeline_manager.base import PipelineManagerTestBase, CLASS_CONFIG_DICT_LIST
+
+A_FUNCTION_PATH = 'test_pipeline_manager.stuff.a_function'
+DATA_PATH = 'test_pipeline_manager.example_class.stuff.data'
+
+
+class TestScheduler(PipelineManagerTestBase):
+
+    def create_dependent_pm(self):
+        self.write_a_function_to_pipeline_dict_file()
+        self.write_example_class_dict_to_file()
+        pipeline_manager = self.create_pm(specific_class_config_dicts=CLASS_CONFIG_DICT_LIST)
+        pipeline_manager.load()
+        self.append_to_a_function_config('\na = s.test_pipeline_manager.example_class.stuff.data\n')
+        pipeline_manager.reload()
+        return pipeline_manager
+
+    def test_plan_orders_items_by_dependencies(self):
+        self.create_dependent_pm()
+        plan = Scheduler([A_FUNCTION_PATH, 'test_pipeline_manager.example_class']).plan()
+        assert plan.stages == [[DATA_PATH], [A_FUNCTION_PATH]]
+        assert plan.to_dict()['dependencies'] == {A_FUNCTION_PATH: [DATA_PATH], DATA_PATH: []}
+        assert f'{A_FUNCTION_PATH} (after {DATA_PATH})' in plan.report()
+
+    def test_run_in_dependency_order(self):
+        self.create_dependent_pm()
+        for executor in ('serial', 'thread'):
+            results = Scheduler([A_FUNCTION_PATH, DATA_PATH], executor=executor, workers=2).run()
+            assert list(results) == [DATA_PATH, A_FUNCTION_PATH]
+            assert results[DATA_PATH] == 'woo'
+            a, b = results[A_FUNCTION_PATH]
+            assert a.name == 'data'
+            assert b is None
+
+    def test_plan_with_cycle_raises_error(self):
+        self.create_dependent_pm()
+        self.append_to_specific_class_config('\na = s.test_pipeline_manager.stuff.a_function\n')
+        with self.assertRaises(ConfigDependencyCycleException):
+            Scheduler([A_FUNCTION_PATH, DATA_PATH]).plan()
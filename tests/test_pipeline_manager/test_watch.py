@@ -0,0 +1,96 @@
+import time
+
+from pyfileconf import Selector
+from tests.input_files.mypackage.cmodule import ExampleClass
+from pyfileconf.watcher import FileWatcher
+from tests.test_pipeline_manager.base import PipelineManagerTestBase
+
+
+def _wait_for_changes(watcher: FileWatcher, timeout: float = 5):
+    end_time = time.monotonic() + timeout
+    while time.monotonic() < end_time:
+        with watcher._lock:
+            if watcher._changed_filepaths or watcher._needs_full_check:
+                return
+        time.sleep(0.01)
+    raise TimeoutError('watcher did not pick up changes')
+
+
+class TestWatch(PipelineManagerTestBase):
+
+    def test_watch_reloads_changed_config_on_run(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        pipeline_manager.watch(interval=0.01, debounce=0.05, backend='poll')
+        try:
+            sel = Selector()
+            assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+            self.append_to_a_function_config('\na = 10\n')
+            _wait_for_changes(pipeline_manager._watcher)
+            assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+        finally:
+            pipeline_manager.stop_watching()
+        assert pipeline_manager._watcher is None
+
+    def test_watch_reloads_config_changed_between_load_and_watch(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        sel = Selector()
+        assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (None, None)
+        self.append_to_a_function_config('\na = 10\n')
+        pipeline_manager.watch(interval=0.01, debounce=0.05, backend='poll')
+        try:
+            assert pipeline_manager.run(sel.test_pipeline_manager.stuff.a_function) == (10, None)
+        finally:
+            pipeline_manager.stop_watching()
+
+    def test_watcher_debounces_changes(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        watcher = FileWatcher(pipeline_manager, interval=0.01, debounce=0.2, backend='poll')
+        watcher.start()
+        try:
+            for i in range(5):
+                self.append_to_a_function_config(f'\na = {i}\n')
+                time.sleep(0.02)
+            # Still within debounce period of last change
+            assert watcher.pop_changes() == (False, set())
+            _wait_for_changes(watcher)
+            assert watcher.pop_changes() == (True, {self.standard_a_function_path})
+            assert watcher.pop_changes() == (False, set())
+        finally:
+            watcher.stop()
+        assert not watcher.is_running
+
+    def test_watcher_sees_changes_right_after_start(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        watcher = FileWatcher(pipeline_manager, interval=0.01, debounce=0.05, backend='poll')
+        watcher.start()
+        try:
+            self.append_to_a_function_config('\na = 10\n')
+            _wait_for_changes(watcher)
+            assert watcher.pop_changes() == (True, {self.standard_a_function_path})
+        finally:
+            watcher.stop()
+
+    def test_watcher_ignores_files_written_by_pyfileconf(self):
+        self.write_a_function_to_pipeline_dict_file()
+        pipeline_manager = self.create_pm()
+        pipeline_manager.load()
+        watcher = FileWatcher(pipeline_manager, interval=0.01, debounce=0.05, backend='poll')
+        watcher.start()
+        try:
+            pipeline_manager.create('stuff', ExampleClass)
+            time.sleep(0.3)
+            assert watcher.pop_changes() == (False, set())
+            # Changed again after being written, so is a change
+            self.append_to_a_function_config('\na = 10\n')
+            _wait_for_changes(watcher)
+            assert watcher.pop_changes() == (True, {self.standard_a_function_path})
+        finally:
+            watcher.stop()
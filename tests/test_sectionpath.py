@@ -0,0 +1,41 @@
+import copy
+import pickle
+
+from pyfileconf.sectionpath.sectionpath import SectionPath
+
+
+def test_section_paths_are_interned():
+    sp = SectionPath('a.b.c')
+    assert SectionPath('a.b.c') is sp
+    assert SectionPath.join('a.b', 'c') is sp
+    assert SectionPath.from_section_str_list(['a', 'b', 'c']) is sp
+    assert copy.deepcopy(sp) is sp
+    assert pickle.loads(pickle.dumps(sp)) is sp
+
+
+def test_section_path_is_immutable():
+    sp = SectionPath('a.b')
+    try:
+        sp.path_str = 'c'
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('should not be able to set attributes')
+    sp.sections.append('c')
+    assert sp.sections == ['a', 'b']
+
+
+def test_section_path_api():
+    sp = SectionPath('a.b.c')
+    assert repr(sp) == "<SectionPath(path_str='a.b.c', sections=['a', 'b', 'c'])>"
+    assert list(sp) == ['a', 'b', 'c']
+    assert sp[0] == 'a'
+    assert sp[1:] == ['b', 'c']
+    assert len(sp) == 3
+    assert sp.parent is SectionPath('a.b')
+    assert sp.parent.parent.parent is None
+    assert sp.startswith(SectionPath('a.b'))
+    assert not sp.startswith(SectionPath('b'))
+    assert sp.endswith(SectionPath('b.c'))
+    assert not sp.endswith(SectionPath('x.a.b.c'))
+    assert {sp: 1}[SectionPath('a.b.c')] == 1
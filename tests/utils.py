@@ -9,6 +9,7 @@ def delete_project(path: str, logs_path: str,
         os.path.join(path, 'defaults'),
         os.path.join(path, 'custom_defaults'),
         os.path.join(path, 'pipeline_dict.py'),
+        os.path.join(path, 'cache'),
         logs_path,
     ]
     for specific_class_config in specific_class_config_dicts: